@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Throughput of agent calls through the async executor and a thread pool.
+
+Sends a burst of concurrent agent calls to the local stub provider, which
+answers after a fixed latency, so no model or network is needed. The
+baseline runs the same calls as blocking sleeps on a
+``ThreadPoolExecutor(max_workers=10)``, as the agent manager used to.
+Reports throughput and end-to-end latency for each executor pool size:
+
+    python benchmarks/bench_agent_executor.py --requests 1000 --latency 0.05 --pool-sizes 10 50 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agentmesh.core.agent_executor import AgentExecutor, AgentRequest, StubProvider
+
+
+def report(label: str, latencies: list, elapsed: float) -> None:
+    """Print throughput and latency percentiles of one run."""
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"  {label:<24} {len(latencies) / elapsed:>8.0f} calls/s  "
+          f"p50 {quantiles[49] * 1000:>7.1f} ms  p99 {quantiles[98] * 1000:>7.1f} ms")
+
+
+async def run_thread_pool(args: argparse.Namespace) -> None:
+    """Run blocking calls on a fixed thread pool."""
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(max_workers=10)
+
+    async def call() -> float:
+        started = time.perf_counter()
+        await loop.run_in_executor(pool, time.sleep, args.latency)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(call() for _ in range(args.requests)))
+    report("thread pool (10)", latencies, time.perf_counter() - started)
+    pool.shutdown()
+
+
+async def run_executor(args: argparse.Namespace, pool_size: int) -> None:
+    """Run calls on the async executor with the given pool size."""
+    executor = AgentExecutor(max_concurrency=args.max_concurrency, pool_size=pool_size)
+    executor.register_provider(StubProvider(latency=args.latency))
+
+    async def call(i: int) -> float:
+        started = time.perf_counter()
+        await executor.execute(AgentRequest(agent_id=f"agent{i % 8}", prompt="benchmark"))
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(call(i) for i in range(args.requests)))
+    report(f"executor (pool {pool_size})", latencies, time.perf_counter() - started)
+    await executor.close()
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Compare the thread pool with every executor pool size."""
+    await run_thread_pool(args)
+    for pool_size in args.pool_sizes:
+        await run_executor(args, pool_size)
+
+
+def main() -> None:
+    """Run the agent executor benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="stub provider latency in seconds")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--max-concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"agent executor: {args.requests} concurrent calls, {args.latency * 1000:.0f} ms each")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Encode/decode cost and stored size of the payload codecs.
+
+Measures every available codec on representative bus messages, context
+entries and handoff requests:
+
+    python benchmarks/bench_codec.py --iterations 20000
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agentmesh.core.codec import get_codec
+from agentmesh.core.context_manager import ContextEntry
+from agentmesh.core.handoff_manager import HandoffRequest
+from agentmesh.messaging.message_bus import Message, MessageType
+
+
+def sample_models():
+    """Build one representative instance of each stored model."""
+    now = datetime.utcnow()
+    return {
+        "Message": Message(
+            id=str(uuid4()),
+            sender_id="research-agent",
+            receiver_id="writer-agent",
+            message_type=MessageType.CHAT,
+            content="Here are the three sources I found on the topic. " * 4,
+            metadata={"turn": 3, "tokens": 412, "tags": ["draft", "sources"]},
+            timestamp=now,
+        ),
+        "ContextEntry": ContextEntry(
+            id=str(uuid4()),
+            key="customer_profile",
+            value={"name": "Ada", "plan": "enterprise", "seats": 250, "regions": ["eu", "us"]},
+            scope="conversation",
+            scope_id=str(uuid4()),
+            created_by="intake-agent",
+            created_at=now,
+            updated_at=now,
+            version=7,
+        ),
+        "HandoffRequest": HandoffRequest(
+            id=str(uuid4()),
+            from_agent_id="triage-agent",
+            to_agent_id="billing-agent",
+            reason="expertise_required",
+            message="Customer disputes an invoice line item.",
+            context_data={"invoice_id": "INV-1042", "amount": 129.5},
+            created_at=now,
+            priority=2,
+        ),
+    }
+
+
+def main() -> None:
+    """Run the codec benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    codecs = []
+    for name in ("json", "orjson", "msgpack"):
+        codec = get_codec(name)
+        if codec.name == name:
+            codecs.append(codec)
+        else:
+            print(f"(skipping {name}: not installed)")
+
+    for model_name, model in sample_models().items():
+        print(f"{model_name}:")
+        legacy_payload = model.model_dump_json()
+        legacy_us = timeit.timeit(
+            lambda: type(model)(**json.loads(legacy_payload)), number=args.iterations
+        )
+        print(f"  {'legacy':<8} json.loads + Model(**data)   "
+              f"decode {legacy_us / args.iterations * 1e6:>6.2f} us")
+        for codec in codecs:
+            payload = codec.encode(model)
+            encode_us = timeit.timeit(lambda: codec.encode(model), number=args.iterations)
+            decode_us = timeit.timeit(
+                lambda: codec.decode(payload, type(model)), number=args.iterations
+            )
+            print(f"  {codec.name:<8} encode {encode_us / args.iterations * 1e6:>6.2f} us  "
+                  f"decode {decode_us / args.iterations * 1e6:>6.2f} us  "
+                  f"stored {len(payload.encode()):>5} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Read latency and hit ratio of the ContextManager with and without its cache.
+
+Runs a read-heavy workload (``--read-ratio`` of operations are get_context,
+the rest set_context) over ``--keys`` keys with a skewed access pattern,
+against fakeredis with a simulated RTT (see bench_message_bus.py):
+
+    python benchmarks/bench_context.py --ops 5000 --rtt-ms 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agentmesh.core.context_cache import ContextCache
+from agentmesh.core.context_manager import ContextManager, ContextScope
+from bench_message_bus import make_client
+
+
+async def run_workload(args: argparse.Namespace, cached: bool) -> None:
+    """Run the workload once and print latency percentiles."""
+    manager = ContextManager()
+    manager.redis_client = make_client(args.redis_url, args.rtt_ms)
+    await manager.redis_client.flushdb()
+    manager.cache = ContextCache(max_entries=args.keys * 2) if cached else None
+
+    rng = random.Random(42)
+    keys = [f"key-{i}" for i in range(args.keys)]
+    for key in keys:
+        await manager.set_context(key, {"n": 0}, ContextScope.AGENT, "alice", "alice")
+
+    read_latencies = []
+    start = time.perf_counter()
+    for i in range(args.ops):
+        # Skewed towards a few hot keys
+        key = keys[min(int(rng.paretovariate(1.2)) - 1, args.keys - 1)]
+        if rng.random() < args.read_ratio:
+            op_start = time.perf_counter()
+            await manager.get_context(key, ContextScope.AGENT, "alice", "alice")
+            read_latencies.append(time.perf_counter() - op_start)
+        else:
+            await manager.set_context(key, {"n": i}, ContextScope.AGENT, "alice", "alice")
+    elapsed = time.perf_counter() - start
+
+    read_latencies.sort()
+    p50 = statistics.median(read_latencies) * 1000
+    p99 = read_latencies[int(len(read_latencies) * 0.99)] * 1000
+    stats = manager.get_cache_stats()
+    hit_ratio = f"{stats['hit_ratio']:.1%}" if stats["enabled"] else "-"
+    label = "cached" if cached else "uncached"
+    print(f"  {label:<9} {args.ops / elapsed:>8.0f} ops/s  get p50 {p50:.3f} ms  "
+          f"p99 {p99:.3f} ms  hit ratio {hit_ratio}")
+    await manager.redis_client.aclose()
+
+
+def main() -> None:
+    """Run the context cache benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--read-ratio", type=float, default=0.9)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    print(f"context reads: {args.ops} ops over {args.keys} keys, "
+          f"{args.read_ratio:.0%} reads, rtt={args.rtt_ms}ms")
+    asyncio.run(run_workload(args, cached=False))
+    asyncio.run(run_workload(args, cached=True))
+
+
+if __name__ == "__main__":
+    main()
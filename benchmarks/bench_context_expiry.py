@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Context store footprint over a simulated day of expiring writes.
+
+Every simulated minute ``--writes-per-minute`` short-lived entries (``--ttl-minutes``)
+are written to fresh keys and a handful of long-lived keys are updated. The
+same load is run once without sweeping (how ``expires_in`` behaved before
+the expiry index) and once with a sweep every ``--sweep-minutes``. The clock
+is simulated by shifting ``expires_in`` and the sweep cutoff, so a day runs
+in seconds against fakeredis:
+
+    python benchmarks/bench_context_expiry.py --hours 24
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agentmesh.core.context_manager import ContextManager, ContextScope
+from bench_message_bus import make_client
+
+
+async def footprint(client) -> tuple:
+    """Count stored context fields and their payload bytes."""
+    entries = await client.hvals("context_entries")
+    total = sum(len(payload) for payload in entries)
+    async for key in client.scan_iter(match="context_revisions:*", count=1000):
+        total += sum(len(payload) for payload in await client.hvals(key))
+    async for key in client.scan_iter(match="context_scope:*", count=1000):
+        total += sum(len(member) for member in await client.smembers(key))
+    return len(entries), total
+
+
+async def run_day(args: argparse.Namespace, sweep: bool) -> None:
+    """Run the simulated day and print the footprint every few hours."""
+    manager = ContextManager()
+    manager.redis_client = make_client(args.redis_url, args.rtt_ms)
+    await manager.redis_client.flushdb()
+    manager.cache = None
+
+    label = "sweeper" if sweep else "no sweep"
+    started = time.perf_counter()
+    real_start = datetime.utcnow()
+    ttl = timedelta(minutes=args.ttl_minutes)
+    samples = []
+
+    for minute in range(args.hours * 60):
+        offset = timedelta(minutes=minute)
+        for i in range(args.writes_per_minute):
+            await manager.set_context(
+                f"session-{minute}-{i}", {"token": "x" * 64, "turn": i},
+                ContextScope.CONVERSATION, f"conv-{i % 10}", "agent",
+                expires_in=ttl + offset
+            )
+        for i in range(args.long_lived_keys):
+            await manager.set_context(
+                f"plan-{i}", {"step": minute}, ContextScope.AGENT, "agent", "agent"
+            )
+        if sweep and minute % args.sweep_minutes == 0:
+            await manager.expire_context(now=real_start + offset)
+        if (minute + 1) % (args.sample_hours * 60) == 0:
+            samples.append(((minute + 1) // 60, *await footprint(manager.redis_client)))
+
+    elapsed = time.perf_counter() - started
+    for hour, fields, size in samples:
+        print(f"  {label:<9} t={hour:>2}h  {fields:>7} entries  {size / 1024:>9.0f} KiB")
+    stats = manager.get_expiry_stats()
+    print(f"  {label:<9} expired {stats['entries_expired']} entries in {stats['runs']} sweeps, "
+          f"{elapsed:.1f}s wall")
+    await manager.redis_client.aclose()
+
+
+def main() -> None:
+    """Run the context expiry benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=int, default=24)
+    parser.add_argument("--writes-per-minute", type=int, default=20)
+    parser.add_argument("--long-lived-keys", type=int, default=5)
+    parser.add_argument("--ttl-minutes", type=int, default=60)
+    parser.add_argument("--sweep-minutes", type=int, default=5)
+    parser.add_argument("--sample-hours", type=int, default=6)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    print(f"context expiry: {args.hours}h, {args.writes_per_minute} writes/min "
+          f"with ttl={args.ttl_minutes}min, sweep every {args.sweep_minutes}min")
+    asyncio.run(run_day(args, sweep=False))
+    asyncio.run(run_day(args, sweep=True))
+
+
+if __name__ == "__main__":
+    main()
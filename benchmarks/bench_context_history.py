@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""History footprint and version lookup latency of delta-encoded context history.
+
+Writes ``--versions`` updates of a large JSON document that changes a little
+each time, then compares the revisions hash (snapshots plus JSON patches)
+with the previous layout (a list of full copies, scanned on every lookup),
+against fakeredis with a simulated RTT (see bench_message_bus.py):
+
+    python benchmarks/bench_context_history.py --versions 100 --rtt-ms 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agentmesh.core.context_manager import ContextManager, ContextScope, ContextVersion
+from bench_message_bus import make_client
+
+
+def document(step: int, fields: int) -> dict:
+    """Build a large document where one record changes per step."""
+    return {
+        "step": step,
+        "records": [
+            {"id": i, "status": "done" if i < step % fields else "pending", "notes": "x" * 80}
+            for i in range(fields)
+        ],
+    }
+
+
+async def legacy_lookup(manager: ContextManager, entry_id: str, version: int):
+    """Find a version the way the list-based history did: scan and parse everything."""
+    for version_data in await manager.redis_client.lrange(f"context_history:{entry_id}", 0, -1):
+        version_entry = manager.codec.decode(version_data, ContextVersion)
+        if version_entry.version == version:
+            return version_entry
+    return None
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Write the history in both layouts and compare size and lookup latency."""
+    manager = ContextManager()
+    manager.redis_client = make_client(args.redis_url, args.rtt_ms)
+    await manager.redis_client.flushdb()
+    entry_id = "agent:alice:doc"
+
+    for step in range(1, args.versions + 1):
+        entry = await manager.set_context(
+            "doc", document(step, args.fields), ContextScope.AGENT, "alice", "alice"
+        )
+        if step > 1:
+            await manager.redis_client.lpush(f"context_history:{entry_id}", manager.codec.encode(
+                ContextVersion(version=step, value=entry.value, updated_by="alice",
+                               updated_at=entry.updated_at)
+            ))
+
+    legacy_bytes = sum(
+        len(record) for record in await manager.redis_client.lrange(f"context_history:{entry_id}", 0, -1)
+    )
+    delta_bytes = sum(
+        len(record) for record in await manager.redis_client.hvals(f"context_revisions:{entry_id}")
+    )
+
+    rng = random.Random(42)
+    versions = [rng.randint(2, args.versions - 1) for _ in range(args.lookups)]
+    timings = {"list scan": [], "revisions": []}
+    for version in versions:
+        start = time.perf_counter()
+        await legacy_lookup(manager, entry_id, version)
+        timings["list scan"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await manager.get_context("doc", ContextScope.AGENT, "alice", "alice", version=version)
+        timings["revisions"].append(time.perf_counter() - start)
+
+    print(f"  list scan  history {legacy_bytes / 1024:>8.0f} KiB  "
+          f"lookup p50 {statistics.median(timings['list scan']) * 1000:.3f} ms")
+    print(f"  revisions  history {delta_bytes / 1024:>8.0f} KiB  "
+          f"lookup p50 {statistics.median(timings['revisions']) * 1000:.3f} ms")
+    await manager.redis_client.aclose()
+
+
+def main() -> None:
+    """Run the context history benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--versions", type=int, default=100)
+    parser.add_argument("--fields", type=int, default=200)
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    print(f"context history: {args.versions} versions of a {args.fields}-record document, "
+          f"rtt={args.rtt_ms}ms")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
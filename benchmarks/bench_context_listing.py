@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""list_context latency for an agent with a few grants in a large scope.
+
+Compares loading every entry of the scope and filtering by access (how
+listing worked before the listing index) with the per-agent index, for
+several scope sizes, against fakeredis with a simulated RTT (see
+bench_message_bus.py):
+
+    python benchmarks/bench_context_listing.py --sizes 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agentmesh.core.context_manager import AccessLevel, ContextManager, ContextScope
+from bench_message_bus import make_client
+
+
+async def timed(coro_factory, repeats: int) -> float:
+    """Median latency of a coroutine in milliseconds."""
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await coro_factory()
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000
+
+
+async def run(args: argparse.Namespace, size: int) -> None:
+    """Fill a scope and time both listing strategies."""
+    manager = ContextManager()
+    manager.redis_client = make_client(args.redis_url, args.rtt_ms)
+    await manager.redis_client.flushdb()
+    manager.cache = None
+
+    for start in range(0, size, 1000):
+        await manager.set_many(
+            {f"key-{i}": {"n": i} for i in range(start, min(start + 1000, size))},
+            ContextScope.AGENT, "alice", "alice"
+        )
+    for i in range(0, size, size // args.grants):
+        await manager.grant_access(
+            f"key-{i}", ContextScope.AGENT, "alice", "bob", AccessLevel.READ, "alice"
+        )
+
+    async def scan_scope():
+        entry_ids = await manager.redis_client.smembers("context_scope:agent:alice")
+        return await manager._read_many(list(entry_ids), "bob")
+
+    async def indexed():
+        return await manager.list_context(ContextScope.AGENT, "alice", "bob")
+
+    assert len(await scan_scope()) == len(await indexed()) == args.grants
+    scan_ms = await timed(scan_scope, args.repeats)
+    index_ms = await timed(indexed, args.repeats)
+    print(f"  {size:>6} entries  scope scan {scan_ms:>8.2f} ms  listing index {index_ms:>6.2f} ms")
+    await manager.redis_client.aclose()
+
+
+def main() -> None:
+    """Run the context listing benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--grants", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    print(f"context listing: {args.grants} readable entries, rtt={args.rtt_ms}ms")
+    for size in args.sizes:
+        asyncio.run(run(args, size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Makespan of wide fan-outs under all, quorum and first-wins joins.
+
+Builds ``start -> N workers -> join -> after`` graphs whose worker durations
+are log-normal with a heavy tail (one unit on average), so a few stragglers
+dominate an all-inputs join. Each join policy runs on the same durations on
+the virtual clock from ``bench_graph_priority``; stragglers are cancelled
+once a quorum or first-wins join fires:
+
+    python benchmarks/bench_graph_join.py --widths 8 32 128 --quorum 0.9
+"""
+
+import argparse
+import math
+import random
+import statistics
+import sys
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bench_graph_priority import SimulatedGraphOrchestrator, makespan
+from agentmesh.orchestration.base import OrchestrationPattern, WorkflowConfig
+from agentmesh.orchestration.graph import EdgeType
+
+
+def build(durations: dict, policy: str, quorum: int) -> SimulatedGraphOrchestrator:
+    """Build a fan-out graph joined with the given policy."""
+    orchestrator = SimulatedGraphOrchestrator(
+        WorkflowConfig(name="fan-out", pattern=OrchestrationPattern.GRAPH, agents=[]),
+        {"start": 0.0, "join": 0.1, "after": 0.1, **durations}
+    )
+    for node_id in orchestrator.durations:
+        orchestrator.add_node(node_id, "agent", max_retries=1)
+    for worker in durations:
+        orchestrator.add_edge(f"start-{worker}", "start", worker)
+        orchestrator.add_edge(f"{worker}-join", worker, "join", edge_type=EdgeType.SYNCHRONIZE)
+    orchestrator.add_edge("join-after", "join", "after")
+    orchestrator.set_join("join", policy, quorum=quorum if policy == "quorum" else None, reducer="concat")
+    return orchestrator
+
+
+def run(args: argparse.Namespace) -> None:
+    """Compare join policies for every fan-out width."""
+    rng = random.Random(args.seed)
+    for width in args.widths:
+        quorum = max(1, math.ceil(args.quorum * width))
+        trials = [
+            {f"worker{i}": rng.lognormvariate(-1.125, 1.5) for i in range(width)}
+            for _ in range(args.trials)
+        ]
+        results = {
+            policy: statistics.mean(makespan(build(durations, policy, quorum)) for durations in trials)
+            for policy in ["all", "quorum", "first"]
+        }
+        print(f"  width {width:>4}  all {results['all']:>6.2f}  "
+              f"quorum {quorum}/{width} {results['quorum']:>6.2f} ({1 - results['quorum'] / results['all']:>+6.1%})  "
+              f"first {results['first']:>6.2f} ({1 - results['first'] / results['all']:>+6.1%}) units")
+
+
+def main() -> None:
+    """Run the graph join benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--widths", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--quorum", type=float, default=0.9, help="fraction of inputs to wait for")
+    parser.add_argument("--trials", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"graph join: mean makespan over {args.trials} duration sets")
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
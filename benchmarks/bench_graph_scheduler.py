@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Scheduler overhead of GraphOrchestrator on large workflow graphs.
+
+Builds a layered DAG where every node depends on up to ``--fan-in`` nodes
+of the previous layer and drains it with instantly completing nodes, once
+with the full rescan the scheduler used to do on every tick (each node's
+dependencies checked through a linear edge search) and once with the
+incrementally maintained ready set. The full ``execute`` path with
+zero-duration agents is timed as well:
+
+    python benchmarks/bench_graph_scheduler.py --sizes 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agentmesh.orchestration.base import OrchestrationPattern, WorkflowConfig
+from agentmesh.orchestration.graph import GraphOrchestrator, NodeStatus
+
+
+class InstantGraphOrchestrator(GraphOrchestrator):
+    """Graph orchestrator whose agents return immediately."""
+
+    async def _run_agent(self, node, task):
+        return {"result": node.node_id}
+
+    def _prepare_node_task(self, node_id, original_task):
+        # Keep prompt building out of the scheduler measurement
+        return original_task
+
+
+def build_graph(size: int, width: int, fan_in: int, seed: int) -> GraphOrchestrator:
+    """Build a layered DAG with ``size`` nodes."""
+    rng = random.Random(seed)
+    orchestrator = InstantGraphOrchestrator(WorkflowConfig(
+        name=f"layered-{size}", pattern=OrchestrationPattern.GRAPH, agents=["agent"]
+    ))
+    previous = []
+    for start in range(0, size, width):
+        layer = [f"n{i}" for i in range(start, min(start + width, size))]
+        for node_id in layer:
+            orchestrator.add_node(node_id, "agent")
+            for source in rng.sample(previous, min(fan_in, len(previous))):
+                orchestrator.add_edge(f"{source}-{node_id}", source, node_id)
+        previous = layer
+    return orchestrator
+
+
+def legacy_ready_nodes(orchestrator: GraphOrchestrator) -> list:
+    """The old ready check: scan every node, search the edge list per dependency."""
+    ready = []
+    for node_id, node in orchestrator.nodes.items():
+        if node.status != NodeStatus.PENDING:
+            continue
+        can_execute = True
+        for dep_node_id in orchestrator.reverse_graph[node_id]:
+            edge = next(
+                edge for edge in orchestrator.edges.values()
+                if edge.source_node == dep_node_id and edge.target_node == node_id
+            )
+            if orchestrator.nodes[edge.source_node].status != NodeStatus.COMPLETED:
+                can_execute = False
+                break
+        if can_execute:
+            ready.append(node_id)
+    return ready
+
+
+def drain_legacy(orchestrator: GraphOrchestrator) -> int:
+    """Complete the graph tick by tick with full rescans; return the tick count."""
+    ticks = 0
+    while True:
+        ready = legacy_ready_nodes(orchestrator)
+        if not ready:
+            return ticks
+        ticks += 1
+        for node_id in ready:
+            orchestrator.nodes[node_id].status = NodeStatus.COMPLETED
+
+
+def drain_indexed(orchestrator: GraphOrchestrator) -> int:
+    """Complete the graph one node at a time through the ready set."""
+    orchestrator._reset_schedule()
+    completions = 0
+    while orchestrator._ready:
+        node_id = next(iter(orchestrator._ready))
+        del orchestrator._ready[node_id]
+        orchestrator.nodes[node_id].status = NodeStatus.COMPLETED
+        orchestrator._release_dependents(node_id)
+        completions += 1
+    return completions
+
+
+def reset(orchestrator: GraphOrchestrator) -> None:
+    """Put every node back to pending."""
+    for node in orchestrator.nodes.values():
+        node.status = NodeStatus.PENDING
+
+
+def run(args: argparse.Namespace, size: int) -> None:
+    """Time both scheduling strategies and a full execute on one graph size."""
+    orchestrator = build_graph(size, args.width, args.fan_in, args.seed)
+
+    if size <= args.legacy_max:
+        start = time.perf_counter()
+        ticks = drain_legacy(orchestrator)
+        legacy = f"{(time.perf_counter() - start) * 1000:>9.1f} ms ({ticks} rescans)"
+        reset(orchestrator)
+    else:
+        legacy = f"{'skipped':>9}"
+
+    start = time.perf_counter()
+    completions = drain_indexed(orchestrator)
+    indexed = (time.perf_counter() - start) * 1000
+    assert completions == size
+    reset(orchestrator)
+
+    start = time.perf_counter()
+    result = asyncio.run(orchestrator.execute("task"))
+    executed = (time.perf_counter() - start) * 1000
+    assert result.success and len(orchestrator.completed_nodes) == size
+
+    print(f"  {size:>6} nodes {len(orchestrator.edges):>6} edges  rescan {legacy}  "
+          f"ready set {indexed:>7.1f} ms  execute {executed:>8.1f} ms")
+
+
+def main() -> None:
+    """Run the graph scheduler benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--width", type=int, default=50)
+    parser.add_argument("--fan-in", type=int, default=2)
+    parser.add_argument("--legacy-max", type=int, default=2000,
+                        help="largest graph to drain with full rescans")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"graph scheduler: layers of {args.width} nodes, fan-in {args.fan_in}")
+    for size in args.sizes:
+        run(args, size)
+
+
+if __name__ == "__main__":
+    main()
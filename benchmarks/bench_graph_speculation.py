@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Makespan of graph workflows with and without speculative conditional branches.
+
+Loads every ``examples/workflows/graph-*.yaml`` that has conditional edges
+and runs it repeatedly with random node durations (log-normal, one unit on
+average). Each conditional edge is taken with probability ``p`` in every
+run, so the orchestrator learns branch probabilities from its own history
+as it would in production. Runs use the virtual clock from
+``bench_graph_priority`` and report mean makespan, the head start of
+confirmed speculative runs and the agent time spent on discarded ones:
+
+    python benchmarks/bench_graph_speculation.py --probabilities 0.9 0.7 0.5
+"""
+
+import argparse
+import random
+import statistics
+import sys
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bench_graph_priority import EXAMPLES, SimulatedGraphOrchestrator, makespan
+from agentmesh.orchestration.base import WorkflowConfig
+from agentmesh.orchestration.graph import EdgeType
+from agentmesh.workflows.config import WorkflowConfigManager
+
+
+def build(config_file, outcomes: dict, speculative: bool) -> SimulatedGraphOrchestrator:
+    """Build an orchestrator whose conditions read this run's outcomes."""
+    orchestrator = SimulatedGraphOrchestrator(
+        WorkflowConfig(name=config_file.name, pattern=config_file.pattern, agents=[]),
+        {}
+    )
+    graph = config_file.graph
+    for node in graph.nodes:
+        orchestrator.add_node(node.id, node.agent, max_retries=1)
+    for edge in graph.edges:
+        edge_type = EdgeType(edge.type)
+        orchestrator.add_edge(
+            edge.id, edge.source, edge.target, edge_type=edge_type,
+            condition=(lambda data, edge_id=edge.id: outcomes[edge_id])
+            if edge_type == EdgeType.CONDITIONAL else None,
+            weight=edge.weight
+        )
+    for branch in graph.parallel_branches or []:
+        orchestrator.add_parallel_branch(branch.id, branch.nodes, branch.synchronization_node)
+
+    orchestrator.set_speculation(speculative)
+    return orchestrator
+
+
+def run(args: argparse.Namespace) -> None:
+    """Compare plain and speculative execution on every example graph."""
+    manager = WorkflowConfigManager()
+    for path in sorted(EXAMPLES.glob("graph-*.yaml")):
+        config_file = manager.load_config_from_file(path)
+        conditional = [edge.id for edge in config_file.graph.edges if edge.type == "conditional"]
+        if not conditional:
+            continue
+
+        for probability in args.probabilities:
+            rng = random.Random(args.seed)
+            results = {}
+            for speculative in [False, True]:
+                outcomes = {}
+                orchestrator = build(config_file, outcomes, speculative)
+                makespans, saved, wasted = [], 0.0, 0.0
+                # Same durations and outcomes for both modes
+                rng.seed(args.seed)
+                for _ in range(args.trials):
+                    orchestrator.durations = {
+                        node.id: rng.lognormvariate(-0.5, 1.0) for node in config_file.graph.nodes
+                    }
+                    outcomes.update({edge_id: rng.random() < probability for edge_id in conditional})
+                    makespans.append(makespan(orchestrator))
+                    saved += orchestrator.speculation_stats["saved_seconds"]
+                    wasted += orchestrator.speculation_stats["wasted_seconds"]
+                results[speculative] = statistics.mean(makespans)
+
+            change = 1 - results[True] / results[False]
+            print(f"  {path.stem:<38} p={probability:.1f}  plain {results[False]:>6.2f}  "
+                  f"speculative {results[True]:>6.2f} units  ({change:>+6.1%})  "
+                  f"saved {saved / args.trials:.2f}  wasted {wasted / args.trials:.2f} per run")
+
+
+def main() -> None:
+    """Run the graph speculation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--probabilities", type=float, nargs="+", default=[0.9, 0.7, 0.5])
+    parser.add_argument("--trials", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"graph speculation: mean makespan over {args.trials} runs per graph")
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Throughput benchmarks for the MessageBus write paths.
+
+Runs against an in-process fakeredis server by default. Every client -> server
+send is delayed by ``--rtt-ms`` to model network round trips, which is what
+dominates latency against a real Redis. Pass ``--redis-url`` to benchmark a
+real server instead (the RTT knob is ignored in that case).
+
+    python benchmarks/bench_message_bus.py --messages 2000 --rtt-ms 0.5
+    python benchmarks/bench_message_bus.py --only broadcast --group-sizes 10 100 1000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import redis.asyncio as redis
+
+from agentmesh.messaging.message_bus import Message, MessageBus, MessageType
+
+
+def make_client(redis_url: str = None, rtt_ms: float = 0.0) -> redis.Redis:
+    """Create a Redis client, optionally a fakeredis one with simulated RTT."""
+    if redis_url:
+        return redis.from_url(redis_url, decode_responses=True)
+
+    import fakeredis
+
+    class LatencyConnection(fakeredis.FakeAsyncRedisConnection):
+        """Fake connection that sleeps for one RTT per request."""
+
+        async def send_packed_command(self, command, check_health=True):
+            await asyncio.sleep(rtt_ms / 1000)
+            await super().send_packed_command(command, check_health)
+
+    return fakeredis.FakeAsyncRedis(
+        decode_responses=True, connection_class=LatencyConnection
+    )
+
+
+async def legacy_send_message(bus: MessageBus, sender_id: str, receiver_id: str, content: str) -> None:
+    """The pre-pipeline write path: one awaited round trip per command."""
+    client = bus.redis_client
+    message = Message(
+        id=str(uuid4()),
+        sender_id=sender_id,
+        receiver_id=receiver_id,
+        message_type=MessageType.CHAT,
+        content=content,
+        timestamp=datetime.utcnow(),
+    )
+    conv_key = f"conversation:{':'.join(sorted([sender_id, receiver_id]))}"
+    await client.hset("messages", message.id, message.model_dump_json())
+    await client.lpush(f"agent_messages:{sender_id}", message.id)
+    await client.lpush(f"agent_messages:{receiver_id}", message.id)
+    await client.publish(f"agent:{receiver_id}", message.model_dump_json())
+    await client.lpush(conv_key, message.id)
+    await client.ltrim(conv_key, 0, 999)
+
+
+async def bench_send(args: argparse.Namespace) -> None:
+    """Compare messages/sec of the legacy and pipelined write paths."""
+    print(f"send_message: {args.messages} messages, rtt={args.rtt_ms}ms")
+    for label, send in (
+        ("sequential (legacy)", lambda bus, i: legacy_send_message(bus, "alice", "bob", f"m{i}")),
+        ("pipelined", lambda bus, i: bus.send_message("alice", "bob", f"m{i}")),
+    ):
+        bus = MessageBus()
+        bus.redis_client = make_client(args.redis_url, args.rtt_ms)
+        await bus.redis_client.flushdb()
+
+        start = time.perf_counter()
+        for i in range(args.messages):
+            await send(bus, i)
+        elapsed = time.perf_counter() - start
+
+        print(f"  {label:<22} {args.messages / elapsed:>10.0f} msg/s  "
+              f"({elapsed / args.messages * 1000:.3f} ms/msg)")
+        await bus.redis_client.aclose()
+
+
+async def bench_broadcast(args: argparse.Namespace) -> None:
+    """Compare deliveries/sec of per-member sends and pipelined fan-out."""
+    print(f"broadcast_message: rtt={args.rtt_ms}ms")
+    for group_size in args.group_sizes:
+        members = [f"agent-{i}" for i in range(group_size)]
+
+        for label in ("per-member sends (legacy)", "pipelined fan-out"):
+            bus = MessageBus()
+            bus.redis_client = make_client(args.redis_url, args.rtt_ms)
+            await bus.redis_client.flushdb()
+            await bus.redis_client.sadd("group:bench:members", *members)
+
+            start = time.perf_counter()
+            if label.startswith("per-member"):
+                for member_id in members[1:]:
+                    await legacy_send_message(bus, members[0], member_id, "hello")
+            else:
+                await bus.broadcast_message(members[0], "bench", "hello")
+            elapsed = time.perf_counter() - start
+
+            deliveries = group_size - 1
+            stored = await bus.redis_client.hlen("messages")
+            print(f"  group={group_size:<5} {label:<26} {elapsed * 1000:>9.1f} ms  "
+                  f"{deliveries / elapsed:>10.0f} deliveries/s  payloads stored={stored}")
+            await bus.redis_client.aclose()
+
+
+def main() -> None:
+    """Run the message bus benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--group-sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--only", choices=["send", "broadcast"], default=None)
+    args = parser.parse_args()
+
+    if args.only in (None, "send"):
+        asyncio.run(bench_send(args))
+    if args.only in (None, "broadcast"):
+        asyncio.run(bench_broadcast(args))
+
+
+if __name__ == "__main__":
+    main()
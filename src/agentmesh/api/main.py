@@ -15,6 +15,7 @@ from ..db.database import init_db, close_db, create_tables
 from ..messaging.message_bus import get_message_bus
 from ..core.context_manager import get_context_manager
 from ..core.handoff_manager import get_handoff_manager
+from ..core.agent_executor import get_agent_executor
 from ..security import get_auth_manager, get_rate_limiter, RateLimitMiddleware
 from ..monitoring import CorrelationIdMiddleware, get_metrics_collector, setup_logging
 
@@ -41,14 +42,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     try:
         message_bus = get_message_bus()
         await message_bus.connect()
+        await message_bus.start_compactor()
         logger.info("Message bus connected")
         
         context_manager = get_context_manager()
         await context_manager.connect()
+        await context_manager.rebuild_access_index()
+        await context_manager.start_expiry_sweeper()
         logger.info("Context manager connected")
         
         handoff_manager = get_handoff_manager()
         await handoff_manager.connect()
+        await handoff_manager.rebuild_history_index()
+        await handoff_manager.start_expiry_scheduler()
         logger.info("Handoff manager connected")
         
         auth_manager = get_auth_manager()
@@ -91,6 +97,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"Error closing Redis connections: {e}")
     
+    # Close pooled agent provider clients
+    await get_agent_executor().close()
+    
     await close_db()
     logger.info("Database connections closed")
 
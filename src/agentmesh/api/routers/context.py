@@ -12,6 +12,7 @@ from ...core.context_manager import (
     ContextEntry, 
     ContextVersion,
     ContextScope,
+    ContextVersionConflict,
     AccessLevel
 )
 from ...core.agent_manager import get_agent_manager
@@ -30,6 +31,7 @@ class SetContextRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
     expires_in_hours: Optional[int] = None
     change_reason: Optional[str] = None
+    expected_version: Optional[int] = None  # optimistic lock; 0 means "must not exist"
 
 
 class ContextResponse(BaseModel):
@@ -43,6 +45,29 @@ class ContextListResponse(BaseModel):
     count: int
 
 
+class GetManyContextRequest(BaseModel):
+    """Request model for fetching several context keys."""
+    scope: str
+    scope_id: str
+    keys: List[str]
+
+
+class SetManyContextRequest(BaseModel):
+    """Request model for setting several context keys."""
+    scope: str
+    scope_id: str
+    values: Dict[str, Any]
+    metadata: Optional[Dict[str, Any]] = None
+    expires_in_hours: Optional[int] = None
+    change_reason: Optional[str] = None
+
+
+class ContextBatchResponse(BaseModel):
+    """Response model for batch reads and snapshots, keyed by context key."""
+    entries: Dict[str, ContextEntry]
+    count: int
+
+
 class ContextHistoryResponse(BaseModel):
     """Response model for context history."""
     versions: List[ContextVersion]
@@ -99,11 +124,17 @@ async def set_context(
             created_by=agent_id,
             metadata=request.metadata,
             expires_in=expires_in,
-            change_reason=request.change_reason
+            change_reason=request.change_reason,
+            expected_version=request.expected_version
         )
         
         return ContextResponse(entry=entry)
         
+    except ContextVersionConflict as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error setting context by agent {agent_id}: {e}")
         raise HTTPException(
@@ -157,6 +188,126 @@ async def get_context(
         )
 
 
+@router.post("/batch/get", response_model=ContextBatchResponse)
+async def get_many_context(
+    agent_id: str = Query(..., description="ID of the requesting agent"),
+    request: GetManyContextRequest = ...,
+):
+    """Get several context entries of a scope in one call.
+    
+    Keys that do not exist or are not readable by the agent are omitted.
+    """
+    context_manager = get_context_manager()
+    agent_manager = get_agent_manager()
+    
+    # Verify agent exists
+    agent = await agent_manager.get_agent(agent_id)
+    if not agent:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Agent {agent_id} not found"
+        )
+    
+    try:
+        entries = await context_manager.get_many(
+            keys=request.keys,
+            scope=request.scope,
+            scope_id=request.scope_id,
+            requester_id=agent_id
+        )
+        
+        return ContextBatchResponse(entries=entries, count=len(entries))
+        
+    except Exception as e:
+        logger.error(f"Error getting context batch by agent {agent_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal error while getting context: {str(e)}"
+        )
+
+
+@router.post("/batch/set", response_model=ContextListResponse)
+async def set_many_context(
+    agent_id: str = Query(..., description="ID of the agent setting context"),
+    request: SetManyContextRequest = ...,
+):
+    """Set several context entries of a scope in one call."""
+    context_manager = get_context_manager()
+    agent_manager = get_agent_manager()
+    
+    # Verify agent exists
+    agent = await agent_manager.get_agent(agent_id)
+    if not agent:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Agent {agent_id} not found"
+        )
+    
+    # Validate scope
+    if request.scope not in [ContextScope.AGENT, ContextScope.CONVERSATION, ContextScope.GROUP, ContextScope.GLOBAL]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid scope: {request.scope}"
+        )
+    
+    try:
+        expires_in = timedelta(hours=request.expires_in_hours) if request.expires_in_hours else None
+        
+        entries = await context_manager.set_many(
+            values=request.values,
+            scope=request.scope,
+            scope_id=request.scope_id,
+            created_by=agent_id,
+            metadata=request.metadata,
+            expires_in=expires_in,
+            change_reason=request.change_reason
+        )
+        
+        return ContextListResponse(entries=entries, count=len(entries))
+        
+    except Exception as e:
+        logger.error(f"Error setting context batch by agent {agent_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal error while setting context: {str(e)}"
+        )
+
+
+@router.get("/snapshot/{scope}/{scope_id}", response_model=ContextBatchResponse)
+async def snapshot_context(
+    scope: str = Path(..., description="Context scope"),
+    scope_id: str = Path(..., description="Scope identifier"),
+    agent_id: str = Query(..., description="ID of the requesting agent"),
+):
+    """Get every readable context entry of a scope, keyed by context key."""
+    context_manager = get_context_manager()
+    agent_manager = get_agent_manager()
+    
+    # Verify agent exists
+    agent = await agent_manager.get_agent(agent_id)
+    if not agent:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Agent {agent_id} not found"
+        )
+    
+    try:
+        entries = await context_manager.snapshot(
+            scope=scope,
+            scope_id=scope_id,
+            requester_id=agent_id
+        )
+        
+        return ContextBatchResponse(entries=entries, count=len(entries))
+        
+    except Exception as e:
+        logger.error(f"Error taking context snapshot by agent {agent_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal error while taking context snapshot: {str(e)}"
+        )
+
+
 @router.delete("/delete/{scope}/{scope_id}/{key}")
 async def delete_context(
     scope: str = Path(..., description="Context scope"),
@@ -394,3 +545,17 @@ async def revoke_context_access(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal error while revoking access: {str(e)}"
         )
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Get hit ratio and size of this worker's context cache."""
+    context_manager = get_context_manager()
+    return context_manager.get_cache_stats()
+
+
+@router.get("/expiry/stats")
+async def get_expiry_stats():
+    """Get counters of this worker's context expiry sweeper."""
+    context_manager = get_context_manager()
+    return context_manager.get_expiry_stats()
@@ -55,10 +55,16 @@ class HandoffListResponse(BaseModel):
     count: int
 
 
+class ClaimHandoffResponse(BaseModel):
+    """Response model for claiming a handoff."""
+    handoff: Optional[HandoffRequest] = None
+
+
 class HandoffHistoryResponse(BaseModel):
     """Response model for handoff history."""
     history: List[HandoffSummary]
     count: int
+    next_cursor: Optional[str] = None
 
 
 class HandoffAuditResponse(BaseModel):
@@ -264,12 +270,46 @@ async def get_pending_handoffs(
         )
 
 
+@router.post("/claim", response_model=ClaimHandoffResponse)
+async def claim_next_handoff(
+    agent_id: str = Query(..., description="ID of the agent"),
+    timeout: float = Query(0.0, ge=0, le=60, description="Seconds to wait for a handoff"),
+):
+    """Claim the highest-priority pending handoff, waiting up to timeout seconds."""
+    handoff_manager = get_handoff_manager()
+    agent_manager = get_agent_manager()
+    
+    # Verify agent exists
+    agent = await agent_manager.get_agent(agent_id)
+    if not agent:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Agent {agent_id} not found"
+        )
+    
+    try:
+        handoff = await handoff_manager.claim_next_handoff(
+            agent_id=agent_id,
+            timeout=timeout
+        )
+        
+        return ClaimHandoffResponse(handoff=handoff)
+        
+    except Exception as e:
+        logger.error(f"Error claiming handoff for agent {agent_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal error while claiming handoff: {str(e)}"
+        )
+
+
 @router.get("/history", response_model=HandoffHistoryResponse)
 async def get_handoff_history(
     agent_id: str = Query(..., description="ID of the agent"),
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of handoffs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
 ):
-    """Get handoff history for an agent."""
+    """Get handoff history for an agent, most recent first."""
     handoff_manager = get_handoff_manager()
     agent_manager = get_agent_manager()
     
@@ -282,14 +322,16 @@ async def get_handoff_history(
         )
     
     try:
-        history = await handoff_manager.get_handoff_history(
+        history, next_cursor = await handoff_manager.get_handoff_history_page(
             agent_id=agent_id,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
         
         return HandoffHistoryResponse(
             history=history,
-            count=len(history)
+            count=len(history),
+            next_cursor=next_cursor
         )
         
     except Exception as e:
@@ -300,6 +342,13 @@ async def get_handoff_history(
         )
 
 
+@router.get("/expiry/stats")
+async def get_expiry_stats():
+    """Get backlog and sweep latency of this worker's handoff expiry scheduler."""
+    handoff_manager = get_handoff_manager()
+    return handoff_manager.get_expiry_stats()
+
+
 @router.get("/audit/{handoff_id}", response_model=HandoffAuditResponse)
 async def get_handoff_audit(
     handoff_id: str = Path(..., description="ID of the handoff"),
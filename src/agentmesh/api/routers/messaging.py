@@ -47,6 +47,7 @@ class MessagesResponse(BaseModel):
     """Response model for multiple messages."""
     messages: List[Message]
     count: int
+    next_cursor: Optional[str] = None  # Pass as `before` to fetch older messages
 
 
 class GroupOperationResponse(BaseModel):
@@ -55,6 +56,24 @@ class GroupOperationResponse(BaseModel):
     message: str
 
 
+def _validate_cursor(before: Optional[str], after: Optional[str]) -> None:
+    """Reject requests that page in both directions at once."""
+    if before and after:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only one of 'before' or 'after' may be specified"
+        )
+
+
+def _build_messages_response(messages: List[Message], limit: int) -> MessagesResponse:
+    """Build a page of messages with the cursor for the next older page."""
+    return MessagesResponse(
+        messages=messages,
+        count=len(messages),
+        next_cursor=messages[0].id if len(messages) == limit else None
+    )
+
+
 @router.post("/send", response_model=MessageResult)
 async def send_message(
     sender_id: str = Query(..., description="ID of the sending agent"),
@@ -147,11 +166,15 @@ async def get_conversation_history(
     agent1_id: str = Path(..., description="ID of the first agent"),
     agent2_id: str = Path(..., description="ID of the second agent"),
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of messages to return"),
+    before: Optional[str] = Query(None, description="Return messages older than this message ID"),
+    after: Optional[str] = Query(None, description="Return messages newer than this message ID"),
 ):
     """Get conversation history between two agents."""
     message_bus = get_message_bus()
     agent_manager = get_agent_manager()
     
+    _validate_cursor(before, after)
+    
     # Verify both agents exist
     agent1 = await agent_manager.get_agent(agent1_id)
     if not agent1:
@@ -171,13 +194,12 @@ async def get_conversation_history(
         messages = await message_bus.get_conversation_history(
             agent1_id=agent1_id,
             agent2_id=agent2_id,
-            limit=limit
+            limit=limit,
+            before=before,
+            after=after
         )
         
-        return MessagesResponse(
-            messages=messages,
-            count=len(messages)
-        )
+        return _build_messages_response(messages, limit)
         
     except Exception as e:
         logger.error(f"Error getting conversation history between {agent1_id} and {agent2_id}: {e}")
@@ -191,11 +213,15 @@ async def get_conversation_history(
 async def get_agent_messages(
     agent_id: str = Path(..., description="ID of the agent"),
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of messages to return"),
+    before: Optional[str] = Query(None, description="Return messages older than this message ID"),
+    after: Optional[str] = Query(None, description="Return messages newer than this message ID"),
 ):
     """Get all messages for a specific agent."""
     message_bus = get_message_bus()
     agent_manager = get_agent_manager()
     
+    _validate_cursor(before, after)
+    
     # Verify agent exists
     agent = await agent_manager.get_agent(agent_id)
     if not agent:
@@ -207,13 +233,12 @@ async def get_agent_messages(
     try:
         messages = await message_bus.get_agent_messages(
             agent_id=agent_id,
-            limit=limit
+            limit=limit,
+            before=before,
+            after=after
         )
         
-        return MessagesResponse(
-            messages=messages,
-            count=len(messages)
-        )
+        return _build_messages_response(messages, limit)
         
     except Exception as e:
         logger.error(f"Error getting messages for agent {agent_id}: {e}")
@@ -324,3 +349,15 @@ async def get_group_members(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal error while getting group members: {str(e)}"
         )
+
+
+@router.get("/retention/stats")
+async def get_retention_stats():
+    """Get message retention and compaction counters."""
+    message_bus = get_message_bus()
+    
+    stats = message_bus.get_retention_stats()
+    return {
+        "retention_hours": message_bus.settings.message_retention_hours,
+        **stats
+    }
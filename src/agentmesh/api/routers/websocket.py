@@ -142,23 +142,39 @@ async def websocket_endpoint(websocket: WebSocket, agent_id: str):
     
     connection_id = await manager.connect(websocket, agent_id)
     
+    async def forward_message(msg: Message):
+        """Forward a message bus message to the WebSocket."""
+        await manager.send_personal_message(
+            json.dumps({
+                "type": "message",
+                "data": msg.model_dump(mode='json')  # Use JSON mode for proper serialization
+            }),
+            agent_id
+        )
+
     # Start listening to messages from the message bus
     async def message_listener():
         """Listen for messages from the message bus and forward to WebSocket."""
         try:
-            await message_bus.subscribe_to_messages(
-                agent_id,
-                lambda msg: manager.send_personal_message(
-                    json.dumps({
-                        "type": "message",
-                        "data": msg.model_dump(mode='json')  # Use JSON mode for proper serialization
-                    }),
-                    agent_id
-                )
-            )
+            if message_bus.stream_transport:
+                # Stream consumers need their own blocking reads
+                await message_bus.subscribe_to_messages(agent_id, forward_message)
+                return
+
+            # Multiplexed over the process-wide pub/sub connection
+            subscription = await message_bus.open_subscription(agent_id)
+            try:
+                while True:
+                    payload = await subscription.get()
+                    try:
+                        await forward_message(message_bus.decode_message(payload))
+                    except Exception as e:
+                        logger.error(f"Error forwarding message to agent {agent_id}: {e}")
+            finally:
+                await message_bus.close_subscription(subscription)
         except Exception as e:
             logger.error(f"Message listener error for agent {agent_id}: {e}")
-    
+
     # Start message listener task
     listener_task = asyncio.create_task(message_listener())
     
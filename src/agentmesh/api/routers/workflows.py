@@ -299,6 +299,73 @@ async def list_workflows(
         )
 
 
+@router.get(
+    "/checkpoints",
+    summary="List Checkpoints",
+    description="List checkpointed graph runs, newest first"
+)
+async def list_checkpoints(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of runs"),
+    workflow_manager = Depends(get_workflow_manager)
+) -> Dict[str, Any]:
+    """List checkpointed runs."""
+    try:
+        checkpoints = await workflow_manager.list_checkpoints(limit)
+        return {"checkpoints": checkpoints, "total": len(checkpoints)}
+
+    except Exception as e:
+        logger.error(f"Error listing checkpoints: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal error while listing checkpoints: {str(e)}"
+        )
+
+
+@router.post(
+    "/checkpoints/{execution_id}/resume",
+    response_model=WorkflowExecutionResponse,
+    summary="Resume From Checkpoint",
+    description="Resume an interrupted graph run, skipping nodes that already completed"
+)
+async def resume_from_checkpoint(
+    execution_id: str,
+    workflow_manager = Depends(get_workflow_manager)
+) -> WorkflowExecutionResponse:
+    """Resume an interrupted run."""
+    try:
+        result = await workflow_manager.resume_from_checkpoint(execution_id)
+        workflow = next(
+            workflow for workflow in workflow_manager.completed_workflows.values()
+            if workflow.execution_id == execution_id
+        )
+
+        return WorkflowExecutionResponse(
+            execution_id=execution_id,
+            workflow_id=workflow.workflow_id,
+            result={
+                "task_id": result.task_id,
+                "agent_id": result.agent_id,
+                "result": result.result,
+                "execution_time": result.execution_time,
+                "timestamp": result.timestamp.isoformat()
+            },
+            success=result.success,
+            error=result.error
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error resuming execution {execution_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal error while resuming execution: {str(e)}"
+        )
+
+
 @router.get(
     "/{workflow_id}",
     response_model=WorkflowResponse,
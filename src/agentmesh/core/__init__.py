@@ -1,5 +1,6 @@
 """Core agent management functionality."""
 
+from .agent_executor import AgentExecutor, get_agent_executor
 from .agent_manager import AgentManager, get_agent_manager
 
-__all__ = ["AgentManager", "get_agent_manager"]
+__all__ = ["AgentExecutor", "AgentManager", "get_agent_executor", "get_agent_manager"]
@@ -0,0 +1,433 @@
+"""Async execution backend for agent calls with pooled provider clients."""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .config import get_settings
+
+try:
+    from openai import AsyncOpenAI
+
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    AsyncOpenAI = None
+
+# AWS Bedrock support
+try:
+    import boto3
+
+    BEDROCK_AVAILABLE = True
+except ImportError:
+    BEDROCK_AVAILABLE = False
+    boto3 = None
+
+logger = logging.getLogger(__name__)
+
+
+class AgentRequest(BaseModel):
+    """A single call to an agent's model."""
+    agent_id: str
+    prompt: str
+    provider: Optional[str] = None  # executor default if unset
+    model: Optional[str] = None
+    system_message: Optional[str] = None
+    options: Dict[str, Any] = Field(default_factory=dict)  # temperature, max_tokens, ...
+    timeout: Optional[float] = None  # seconds, executor default if unset
+
+
+class AgentResponse(BaseModel):
+    """The result of an agent call."""
+    agent_id: str
+    provider: str
+    content: str
+    latency: float  # seconds spent in the provider call
+    queued: float = 0.0  # seconds spent waiting for capacity
+    usage: Dict[str, Any] = Field(default_factory=dict)
+
+
+class AgentInvocationError(Exception):
+    """Raised when an agent call cannot be made or fails."""
+    pass
+
+
+class AgentTimeoutError(AgentInvocationError, asyncio.TimeoutError):
+    """Raised when an agent call exceeds its timeout."""
+    pass
+
+
+class AgentProvider(ABC):
+    """A model provider that agent calls are sent to.
+
+    Providers create clients (connections, SDK handles) that the executor
+    pools and reuses across calls, and run one request on a client at a
+    time.
+    """
+
+    name: str = "provider"
+
+    @abstractmethod
+    async def create_client(self) -> Any:
+        """Create a client for the pool."""
+        pass
+
+    @abstractmethod
+    async def invoke(self, client: Any, request: AgentRequest) -> AgentResponse:
+        """Run a request on a pooled client."""
+        pass
+
+    async def close_client(self, client: Any) -> None:
+        """Release a client that leaves the pool."""
+        pass
+
+
+class StubProvider(AgentProvider):
+    """Local provider that answers after a fixed latency, for offline runs."""
+
+    name = "local"
+
+    def __init__(self, latency: float = 0.1):
+        """Initialize the stub with its per-call latency in seconds."""
+        self.latency = latency
+        self.clients_created = 0
+
+    async def create_client(self) -> Any:
+        """Create a stub client, numbered so reuse is observable."""
+        self.clients_created += 1
+        return {"client_id": self.clients_created}
+
+    async def invoke(self, client: Any, request: AgentRequest) -> AgentResponse:
+        """Echo the prompt back after the configured latency."""
+        await asyncio.sleep(self.latency)
+        return AgentResponse(
+            agent_id=request.agent_id,
+            provider=self.name,
+            content=f"{request.agent_id} response to: {request.prompt}",
+            latency=self.latency,
+            usage={"client_id": client["client_id"]}
+        )
+
+
+class OpenAIProvider(AgentProvider):
+    """OpenAI chat completions through the async SDK."""
+
+    name = "openai"
+
+    async def create_client(self) -> Any:
+        """Create an SDK client; retries are left to the orchestrators."""
+        return AsyncOpenAI(max_retries=0)
+
+    async def invoke(self, client: Any, request: AgentRequest) -> AgentResponse:
+        """Send the request as a chat completion."""
+        messages = []
+        if request.system_message:
+            messages.append({"role": "system", "content": request.system_message})
+        messages.append({"role": "user", "content": request.prompt})
+
+        started = time.perf_counter()
+        completion = await client.chat.completions.create(
+            model=request.model or get_settings().default_model,
+            messages=messages,
+            **request.options
+        )
+        return AgentResponse(
+            agent_id=request.agent_id,
+            provider=self.name,
+            content=completion.choices[0].message.content or "",
+            latency=time.perf_counter() - started,
+            usage=completion.usage.model_dump() if completion.usage else {}
+        )
+
+    async def close_client(self, client: Any) -> None:
+        """Close the client's HTTP connections."""
+        await client.close()
+
+
+class BedrockProvider(AgentProvider):
+    """AWS Bedrock Converse API.
+
+    boto3 is blocking, so calls run in a worker thread. Cancelling a call
+    frees its slot right away, but the thread finishes the request.
+    """
+
+    name = "bedrock"
+
+    async def create_client(self) -> Any:
+        """Create a Bedrock runtime client."""
+        return await asyncio.to_thread(boto3.client, "bedrock-runtime")
+
+    async def invoke(self, client: Any, request: AgentRequest) -> AgentResponse:
+        """Send the request as a Converse call."""
+        kwargs: Dict[str, Any] = {
+            "modelId": request.model,
+            "messages": [{"role": "user", "content": [{"text": request.prompt}]}],
+        }
+        if request.system_message:
+            kwargs["system"] = [{"text": request.system_message}]
+        inference = {
+            "temperature": request.options.get("temperature"),
+            "maxTokens": request.options.get("max_tokens"),
+        }
+        if any(value is not None for value in inference.values()):
+            kwargs["inferenceConfig"] = {k: v for k, v in inference.items() if v is not None}
+
+        started = time.perf_counter()
+        result = await asyncio.to_thread(client.converse, **kwargs)
+        return AgentResponse(
+            agent_id=request.agent_id,
+            provider=self.name,
+            content="".join(
+                part.get("text", "") for part in result["output"]["message"]["content"]
+            ),
+            latency=time.perf_counter() - started,
+            usage=result.get("usage", {})
+        )
+
+
+class ClientPool:
+    """Bounded pool of clients for one provider.
+
+    At most ``size`` clients exist at once, so the pool size also bounds
+    the provider's concurrent calls. Clients are created on demand and
+    reused; a client whose call failed, timed out or was cancelled may
+    hold a half-read response and is closed instead of returned.
+    """
+
+    def __init__(self, provider: AgentProvider, size: int):
+        """Initialize an empty pool."""
+        self.provider = provider
+        self.size = size
+        self.created = 0
+        self.discarded = 0
+        self._idle: List[Any] = []
+        self._slots = asyncio.Semaphore(size)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Borrow a client, waiting while all of them are in use."""
+        async with self._slots:
+            if self._idle:
+                client = self._idle.pop()
+            else:
+                client = await self.provider.create_client()
+                self.created += 1
+            try:
+                yield client
+            except BaseException:
+                await self._discard(client)
+                raise
+            self._idle.append(client)
+
+    async def close(self) -> None:
+        """Close every idle client."""
+        while self._idle:
+            await self._discard(self._idle.pop())
+
+    async def _discard(self, client: Any) -> None:
+        """Close a client that will not be reused."""
+        self.discarded += 1
+        try:
+            await self.provider.close_client(client)
+        except Exception as e:
+            logger.warning(f"Failed to close {self.provider.name} client: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool size statistics."""
+        return {
+            "size": self.size,
+            "created": self.created,
+            "discarded": self.discarded,
+            "idle": len(self._idle),
+        }
+
+
+class AgentExecutor:
+    """Runs agent calls on pooled provider clients.
+
+    Calls are bounded twice: by ``max_concurrency`` across all providers
+    and by each provider's pool size. Each provider call gets ``timeout``
+    seconds (or the request's own) once it has a client; time spent
+    waiting for capacity is reported separately. Cancelling the caller
+    cancels the provider call and discards its client.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        pool_size: int = 10,
+        timeout: float = 300.0,
+        default_provider: str = "local"
+    ):
+        """Initialize the executor without providers."""
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.default_provider = default_provider
+        self.providers: Dict[str, AgentProvider] = {}
+        self._pool_sizes: Dict[str, int] = {}
+        self._pools: Dict[str, ClientPool] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.dropped_clients = 0  # left on an event loop that could no longer close them
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def register_provider(self, provider: AgentProvider, pool_size: Optional[int] = None) -> None:
+        """Register a provider under its name, replacing any previous one."""
+        self.providers[provider.name] = provider
+        self._pool_sizes[provider.name] = pool_size or self.pool_size
+        self._pools.pop(provider.name, None)
+        logger.info(f"Registered agent provider {provider.name}")
+
+    async def execute(self, request: AgentRequest) -> AgentResponse:
+        """Run an agent call.
+
+        Args:
+            request: The call to make
+
+        Returns:
+            The provider's response
+
+        Raises:
+            AgentTimeoutError: If the provider call exceeds its timeout
+            AgentInvocationError: If the provider is not registered
+        """
+        provider_name = request.provider or self.default_provider
+        provider = self.providers.get(provider_name)
+        if provider is None:
+            raise AgentInvocationError(f"Agent provider {provider_name} is not available")
+
+        self._bind_loop()
+        pool = self._pools.get(provider_name)
+        if pool is None:
+            pool = self._pools[provider_name] = ClientPool(provider, self._pool_sizes[provider_name])
+        stats = self._stats.setdefault(provider_name, {
+            "calls": 0, "succeeded": 0, "failed": 0, "timeouts": 0, "cancelled": 0,
+            "in_flight": 0, "peak_in_flight": 0, "latency_seconds": 0.0, "queued_seconds": 0.0
+        })
+        timeout = request.timeout or self.timeout
+
+        stats["calls"] += 1
+        queued_at = time.perf_counter()
+        try:
+            async with self._slots:
+                async with pool.acquire() as client:
+                    started = time.perf_counter()
+                    stats["queued_seconds"] += started - queued_at
+                    stats["in_flight"] += 1
+                    stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+                    self.in_flight += 1
+                    self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                    try:
+                        response = await asyncio.wait_for(provider.invoke(client, request), timeout)
+                    except asyncio.TimeoutError:
+                        raise AgentTimeoutError(
+                            f"Agent {request.agent_id} timed out after {timeout}s on {provider_name}"
+                        ) from None
+                    finally:
+                        stats["in_flight"] -= 1
+                        self.in_flight -= 1
+                        stats["latency_seconds"] += time.perf_counter() - started
+        except AgentTimeoutError as e:
+            stats["timeouts"] += 1
+            logger.warning(str(e))
+            raise
+        except asyncio.CancelledError:
+            stats["cancelled"] += 1
+            raise
+        except Exception as e:
+            stats["failed"] += 1
+            logger.error(f"Agent {request.agent_id} failed on {provider_name}: {e}")
+            raise
+
+        stats["succeeded"] += 1
+        response.queued = started - queued_at
+        return response
+
+    async def close(self) -> None:
+        """Close every pooled client."""
+        for pool in self._pools.values():
+            await pool.close()
+        self._pools.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-provider call and pool statistics."""
+        providers = {}
+        for name in self.providers:
+            stats = dict(self._stats.get(name, {}))
+            finished = stats.get("succeeded", 0) + stats.get("failed", 0)
+            stats["avg_latency_seconds"] = (
+                stats["latency_seconds"] / finished if finished else 0.0
+            )
+            pool = self._pools.get(name)
+            stats["pool"] = pool.get_stats() if pool else {"size": self._pool_sizes[name]}
+            providers[name] = stats
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "dropped_clients": self.dropped_clients,
+            "default_provider": self.default_provider,
+            "providers": providers,
+        }
+
+    def _bind_loop(self) -> None:
+        """Rebuild pools and limits when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Semaphores and pooled connections belong to the loop that made them
+            if self._pools:
+                self._release_pools(self._loop, list(self._pools.values()))
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._pools = {}
+
+    def _release_pools(self, loop: asyncio.AbstractEventLoop, pools: List[ClientPool]) -> None:
+        """Close the idle clients of pools left on another event loop.
+
+        Clients can only be closed on their own loop. If it is still running
+        (in another thread) they are closed there; otherwise they are
+        dropped and counted.
+        """
+        if loop.is_running() and not loop.is_closed():
+            for pool in pools:
+                asyncio.run_coroutine_threadsafe(pool.close(), loop)
+            return
+
+        dropped = sum(len(pool._idle) for pool in pools)
+        if dropped:
+            self.dropped_clients += dropped
+            logger.warning(
+                f"Dropped {dropped} pooled agent clients of a stopped event loop; "
+                f"call close() before the loop ends to release them"
+            )
+
+
+# Global agent executor instance
+_agent_executor: Optional[AgentExecutor] = None
+
+
+def get_agent_executor() -> AgentExecutor:
+    """Get or create the global agent executor instance."""
+    global _agent_executor
+    if _agent_executor is None:
+        settings = get_settings()
+        _agent_executor = AgentExecutor(
+            max_concurrency=settings.agent_max_concurrency,
+            pool_size=settings.agent_pool_size,
+            timeout=settings.agent_timeout,
+            default_provider=settings.agent_default_provider
+        )
+        _agent_executor.register_provider(StubProvider(latency=settings.agent_stub_latency_seconds))
+        if OPENAI_AVAILABLE:
+            _agent_executor.register_provider(OpenAIProvider())
+        if BEDROCK_AVAILABLE:
+            _agent_executor.register_provider(BedrockProvider())
+    return _agent_executor
@@ -4,7 +4,6 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
-from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 
 try:
@@ -33,6 +32,7 @@ except ImportError:
     BotoCoreError = None
     ClientError = None
 
+from .agent_executor import AgentRequest, AgentResponse, get_agent_executor
 from ..models.agent import (
     AgentConfig,
     AgentInfo,
@@ -52,7 +52,8 @@ class AgentManager:
     def __init__(self):
         """Initialize the agent manager."""
         self.agents: Dict[str, Dict[str, Any]] = {}
-        self.executor = ThreadPoolExecutor(max_workers=10)
+        self.executor = get_agent_executor()
+        self._fallback_providers: set = set()  # unavailable providers already warned about
         self._metrics: Dict[str, AgentMetrics] = {}
 
     async def create_agent(self, config: AgentConfig) -> str:
@@ -390,6 +391,81 @@ class AgentManager:
 
         return agent_info
 
+    async def get_agent_config(self, agent_id: Union[str, UUID]) -> Optional[AgentConfig]:
+        """Get the configuration an agent was created or last updated with.
+
+        Args:
+            agent_id: Agent identifier
+
+        Returns:
+            Agent configuration or None if not found
+        """
+        agent_data = self.agents.get(self._normalize_agent_id(agent_id))
+        return agent_data["config"] if agent_data else None
+
+    async def invoke_agent(
+        self,
+        agent_id: Union[str, UUID],
+        prompt: str,
+        timeout: Optional[float] = None
+    ) -> AgentResponse:
+        """Run an agent on a prompt through the agent executor.
+
+        Agents that are not managed here, or whose provider is not
+        available, run on the default provider.
+
+        Args:
+            agent_id: Agent identifier
+            prompt: The prompt to send
+            timeout: Call timeout in seconds (``agent_timeout`` if unset)
+
+        Returns:
+            The agent's response
+        """
+        agent_id = self._normalize_agent_id(agent_id)
+        agent_data = self.agents.get(agent_id)
+        config = agent_data["config"] if agent_data else None
+
+        request = AgentRequest(agent_id=agent_id, prompt=prompt, timeout=timeout)
+        if config:
+            llm_config = config.llm_config or {}
+            provider = llm_config.get("provider") or getattr(config, "provider", None)
+            request.provider = getattr(provider, "value", provider)
+            request.model = config.model
+            request.system_message = config.system_message
+            if request.provider and request.provider not in self.executor.providers:
+                # Agents of providers without a backend (yet) run on the default one,
+                # with its default model
+                if request.provider not in self._fallback_providers:
+                    self._fallback_providers.add(request.provider)
+                    logger.warning(
+                        f"Agent provider {request.provider} is not available, "
+                        f"using {self.executor.default_provider} instead"
+                    )
+                request.provider = None
+                request.model = None
+            request.options = {
+                key: llm_config[key] for key in ("temperature", "max_tokens") if key in llm_config
+            }
+
+        metrics = self._metrics.get(agent_id)
+        try:
+            response = await self.executor.execute(request)
+        except Exception:
+            if metrics:
+                metrics.total_messages += 1
+                metrics.failed_responses += 1
+            raise
+
+        if metrics:
+            metrics.total_messages += 1
+            metrics.successful_responses += 1
+            metrics.average_response_time += (
+                response.latency - metrics.average_response_time
+            ) / metrics.successful_responses
+            metrics.last_activity = datetime.now()
+        return response
+
     async def list_agents(
         self, 
         status_filter: Optional[AgentStatus] = None,
@@ -507,6 +583,7 @@ class AgentManager:
             "error_agents": error_agents,
             "autogen_available": AUTOGEN_AVAILABLE,
             "bedrock_available": BEDROCK_AVAILABLE,
+            "executor": self.executor.get_stats(),
             "timestamp": datetime.now().isoformat(),
         }
 
@@ -0,0 +1,107 @@
+"""Pluggable payload codecs for models stored in and published through Redis.
+
+Payloads are text because every Redis client in the system is created with
+``decode_responses=True``. JSON payloads are written untagged, exactly as
+``model_dump_json()`` always produced them, so entries written before the
+codec layer existed keep decoding. Other formats start with a short tag
+(``<name>:``) that tells readers how to decode them, which lets processes
+running different codecs share the same keys during a rollout.
+"""
+
+import base64
+import logging
+from typing import Dict, Type, TypeVar
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+TAG_SEPARATOR = ":"
+
+
+class PayloadCodec:
+    """Encode pydantic models to Redis payloads and back."""
+
+    name = "json"
+    tagged = False
+
+    def encode(self, model: BaseModel) -> str:
+        """Encode a model to a payload string."""
+        return model.model_dump_json()
+
+    def decode(self, payload: str, model_cls: Type[ModelT]) -> ModelT:
+        """Decode a payload written by any registered codec."""
+        return decode_payload(payload, model_cls)
+
+    def _decode_body(self, body: str, model_cls: Type[ModelT]) -> ModelT:
+        """Decode a payload body with the tag already stripped."""
+        return model_cls.model_validate_json(body)
+
+
+class OrjsonCodec(PayloadCodec):
+    """JSON via orjson; output is plain JSON, so it needs no tag."""
+
+    name = "orjson"
+
+    def encode(self, model: BaseModel) -> str:
+        """Encode a model to a payload string."""
+        return orjson.dumps(model.model_dump(mode="json")).decode()
+
+    def _decode_body(self, body: str, model_cls: Type[ModelT]) -> ModelT:
+        """Decode a payload body with the tag already stripped."""
+        return model_cls.model_validate(orjson.loads(body))
+
+
+class MsgpackCodec(PayloadCodec):
+    """MessagePack, base64-armoured to fit text-mode Redis clients."""
+
+    name = "msgpack"
+    tagged = True
+
+    def encode(self, model: BaseModel) -> str:
+        """Encode a model to a payload string."""
+        packed = msgpack.packb(model.model_dump(mode="json"), use_bin_type=True)
+        return f"{self.name}{TAG_SEPARATOR}{base64.b64encode(packed).decode('ascii')}"
+
+    def _decode_body(self, body: str, model_cls: Type[ModelT]) -> ModelT:
+        """Decode a payload body with the tag already stripped."""
+        return model_cls.model_validate(msgpack.unpackb(base64.b64decode(body), raw=False))
+
+
+_CODECS: Dict[str, PayloadCodec] = {"json": PayloadCodec()}
+if orjson is not None:
+    _CODECS["orjson"] = OrjsonCodec()
+if msgpack is not None:
+    _CODECS["msgpack"] = MsgpackCodec()
+
+
+def get_codec(name: str) -> PayloadCodec:
+    """Get a codec by name, falling back to JSON if it is unavailable."""
+    codec = _CODECS.get(name)
+    if codec is None:
+        logger.warning(f"Payload codec '{name}' is not available, using json")
+        return _CODECS["json"]
+    return codec
+
+
+def decode_payload(payload: str, model_cls: Type[ModelT]) -> ModelT:
+    """Decode a payload by its format tag; untagged payloads are JSON."""
+    if payload[:1] not in ("{", "["):
+        tag, _, body = payload.partition(TAG_SEPARATOR)
+        codec = _CODECS.get(tag)
+        if codec is None or not codec.tagged:
+            raise ValueError(f"Unknown payload format: {tag[:16]!r}")
+        return codec._decode_body(body, model_cls)
+    return _CODECS["json"]._decode_body(payload, model_cls)
@@ -73,13 +73,52 @@ class Settings(BaseSettings):
     max_agents: int = Field(default=100, env="MAX_AGENTS")
     agent_timeout: int = Field(default=300, env="AGENT_TIMEOUT")  # seconds
     
+    # Agent Execution (async provider calls, see AgentExecutor)
+    agent_max_concurrency: int = Field(default=100, env="AGENT_MAX_CONCURRENCY")  # calls in flight per process
+    agent_pool_size: int = Field(default=10, env="AGENT_POOL_SIZE")  # pooled clients per provider
+    agent_default_provider: str = Field(default="local", env="AGENT_DEFAULT_PROVIDER")  # local, openai or bedrock
+    agent_stub_latency_seconds: float = Field(default=0.1, env="AGENT_STUB_LATENCY_SECONDS")  # local provider
+    
     # Workflow Configuration
     max_workflows: int = Field(default=50, env="MAX_WORKFLOWS")
     workflow_timeout: int = Field(default=3600, env="WORKFLOW_TIMEOUT")  # seconds
     
     # Message Bus Configuration
     message_retention_hours: int = Field(default=24, env="MESSAGE_RETENTION_HOURS")
+    message_compaction_interval_seconds: int = Field(default=300, env="MESSAGE_COMPACTION_INTERVAL_SECONDS")
+    message_compaction_batch_size: int = Field(default=1000, env="MESSAGE_COMPACTION_BATCH_SIZE")
     max_message_size: int = Field(default=1024 * 1024, env="MAX_MESSAGE_SIZE")  # 1MB
+    message_transport: str = Field(default="pubsub", env="MESSAGE_TRANSPORT")  # pubsub or streams
+    payload_codec: str = Field(default="json", env="PAYLOAD_CODEC")  # json, orjson or msgpack
+    subscriber_queue_size: int = Field(default=1000, env="SUBSCRIBER_QUEUE_SIZE")  # per WebSocket
+    
+    # Redis Streams transport (used when message_transport is "streams")
+    stream_maxlen: int = Field(default=10000, env="STREAM_MAXLEN")  # entries kept per agent inbox
+    stream_consumer_group: str = Field(default="agentmesh", env="STREAM_CONSUMER_GROUP")
+    stream_block_ms: int = Field(default=5000, env="STREAM_BLOCK_MS")
+    stream_batch_size: int = Field(default=100, env="STREAM_BATCH_SIZE")
+    stream_claim_idle_ms: int = Field(default=60000, env="STREAM_CLAIM_IDLE_MS")  # reclaim after 1 min
+    
+    # Context Cache Configuration (per-process, invalidated over pub/sub)
+    context_cache_enabled: bool = Field(default=True, env="CONTEXT_CACHE_ENABLED")
+    context_cache_size: int = Field(default=10000, env="CONTEXT_CACHE_SIZE")  # cached entries
+    context_cache_ttl_seconds: float = Field(default=30.0, env="CONTEXT_CACHE_TTL_SECONDS")
+    
+    # Context Expiry Configuration (sweeper for entries written with expires_in)
+    context_expiry_interval_seconds: int = Field(default=60, env="CONTEXT_EXPIRY_INTERVAL_SECONDS")
+    context_expiry_batch_size: int = Field(default=1000, env="CONTEXT_EXPIRY_BATCH_SIZE")
+    
+    # Handoff Expiry Configuration (scheduler for unanswered handoffs)
+    handoff_expiry_interval_seconds: int = Field(default=30, env="HANDOFF_EXPIRY_INTERVAL_SECONDS")
+    handoff_expiry_batch_size: int = Field(default=500, env="HANDOFF_EXPIRY_BATCH_SIZE")
+    
+    # Workflow Checkpoint Configuration (resuming graph runs after a crash)
+    workflow_checkpoints_enabled: bool = Field(default=True, env="WORKFLOW_CHECKPOINTS_ENABLED")
+    workflow_checkpoint_ttl_seconds: int = Field(default=7 * 24 * 3600, env="WORKFLOW_CHECKPOINT_TTL_SECONDS")
+    
+    # Result Cache Configuration (per-process, used by workflows with cache_results)
+    result_cache_size: int = Field(default=1000, env="RESULT_CACHE_SIZE")  # cached agent results
+    result_cache_ttl_seconds: float = Field(default=3600.0, env="RESULT_CACHE_TTL_SECONDS")
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,204 @@
+"""Per-process LRU/TTL cache for context entries and access records."""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+# Pub/sub channel carrying context invalidations between API workers
+INVALIDATION_CHANNEL = "context_invalidations"
+
+# Sentinel for "not cached", distinct from a cached miss (None)
+MISSING = object()
+
+
+@dataclass
+class _CachedRecord:
+    """Cached state of one context entry."""
+    expires_at: float
+    entry: Any = MISSING
+    version: int = 0
+    access: Dict[str, Any] = field(default_factory=dict)
+
+
+class ContextCache:
+    """Bounded LRU cache of ``ContextEntry`` and ACL records with a TTL.
+
+    Writers publish an invalidation (entry ID plus the new version) after
+    every change, and every process drops its copy when it receives one.
+    Pub/sub is best effort, so the TTL bounds staleness if an invalidation
+    is lost. Fills carry the invalidation generation observed before the
+    Redis read, so a read racing with an invalidation never repopulates the
+    cache with the value it just replaced.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30.0):
+        """Initialize the cache."""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.instance_id = str(uuid4())
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._records: "OrderedDict[str, _CachedRecord]" = OrderedDict()
+        self._pubsub: Optional[redis.client.PubSub] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._listening = False
+
+    def get_entry(self, entry_id: str) -> Any:
+        """Get a cached entry, ``None`` for a cached miss or ``MISSING``."""
+        record = self._lookup(entry_id)
+        if record is None or record.entry is MISSING:
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        return record.entry.model_copy(deep=True) if record.entry is not None else None
+
+    def put_entry(self, entry_id: str, entry: Any, generation: Optional[int] = None) -> None:
+        """Cache an entry (or ``None`` if it does not exist).
+
+        Entries are copied in and out, so callers changing a value they
+        wrote or read never change what later reads return.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        record = self._record(entry_id)
+        record.entry = entry.model_copy(deep=True) if entry is not None else None
+        record.version = entry.version if entry is not None else 0
+
+    def get_access(self, entry_id: str, agent_id: str) -> Any:
+        """Get a cached ACL record, ``None`` for a cached miss or ``MISSING``."""
+        record = self._lookup(entry_id)
+        if record is None or agent_id not in record.access:
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        return record.access[agent_id]
+
+    def put_access(
+        self,
+        entry_id: str,
+        agent_id: str,
+        access_control: Any,
+        generation: Optional[int] = None
+    ) -> None:
+        """Cache an ACL record (or ``None`` if the agent has no grant)."""
+        if generation is not None and generation != self.generation:
+            return
+        self._record(entry_id).access[agent_id] = access_control
+
+    def invalidate(self, entry_id: str, version: Optional[int] = None) -> None:
+        """Drop an entry unless the cached copy is already at ``version``.
+
+        Without a version (deletes and ACL changes) the entry is always
+        dropped.
+        """
+        self.generation += 1
+        record = self._records.get(entry_id)
+        if record is None:
+            return
+        if version is not None and record.entry is not MISSING and record.version >= version:
+            return
+        del self._records[entry_id]
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every cached record."""
+        self.generation += 1
+        self._records.clear()
+
+    def invalidation_message(self, entry_id: str, version: Optional[int] = None) -> str:
+        """Build the pub/sub payload announcing a change to an entry."""
+        return json.dumps({
+            "entry_id": entry_id,
+            "version": version,
+            "origin": self.instance_id
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit ratio and size statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._records),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    async def start_listener(self, redis_client: redis.Redis, poll_timeout: float = 1.0) -> None:
+        """Subscribe to invalidations published by other processes."""
+        if self._listener_task and not self._listener_task.done():
+            return
+        self._pubsub = redis_client.pubsub()
+        await self._pubsub.subscribe(INVALIDATION_CHANNEL)
+        self._listening = True
+        self._listener_task = asyncio.create_task(self._listen(poll_timeout))
+
+    async def stop_listener(self) -> None:
+        """Stop listening for invalidations."""
+        self._listening = False
+        if self._listener_task:
+            await self._listener_task
+            self._listener_task = None
+        if self._pubsub:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    async def _listen(self, poll_timeout: float) -> None:
+        """Apply invalidations until the listener is stopped."""
+        while self._listening:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=poll_timeout
+                )
+            except Exception as e:
+                # Invalidations may have been missed while disconnected
+                logger.error(f"Context invalidation listener error: {e}")
+                self.clear()
+                await asyncio.sleep(poll_timeout)
+                continue
+
+            if not message or message["type"] != "message":
+                continue
+            try:
+                data = json.loads(message["data"])
+            except (TypeError, ValueError):
+                continue
+            if data.get("origin") != self.instance_id:
+                self.invalidate(data["entry_id"], data.get("version"))
+
+    def _lookup(self, entry_id: str) -> Optional[_CachedRecord]:
+        """Find a live record and mark it most recently used."""
+        record = self._records.get(entry_id)
+        if record is None:
+            return None
+        if record.expires_at <= time.monotonic():
+            del self._records[entry_id]
+            return None
+        self._records.move_to_end(entry_id)
+        return record
+
+    def _record(self, entry_id: str) -> _CachedRecord:
+        """Get or create the record for an entry, evicting the LRU one if full."""
+        record = self._lookup(entry_id)
+        if record is None:
+            record = _CachedRecord(expires_at=time.monotonic() + self.ttl_seconds)
+            self._records[entry_id] = record
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+                self.evictions += 1
+        return record
@@ -0,0 +1,195 @@
+"""Expiry of context entries written with ``expires_in``."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+import redis.asyncio as redis
+from pydantic import BaseModel
+
+from .config import Settings
+from .context_cache import INVALIDATION_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+# Sorted set of expiring context entry IDs scored by expiry time
+CONTEXT_EXPIRY_KEY = "context_expiry"
+
+# Delete one expired entry with everything hanging off it, unless it was
+# rewritten (and its expiry moved or dropped) since the sweep selected it.
+#
+# KEYS: context_expiry, context_entries, context_versions, context_revisions:{id},
+#       context_history:{id} (legacy history list), context_access:{id},
+#       context_scope:{scope}:{scope_id},
+#       context_readable:{agent}:{scope}:{scope_id} for the writer and each grantee
+# ARGV: entry_id, cutoff score, invalidation channel, invalidation payload ("" for none),
+#       "{scope}:{scope_id}" ("" if unknown), then the agents of the readable sets
+# Returns {1, payload bytes} when deleted, {0, 0} when the entry is still live or
+# was granted to an agent missing from KEYS since the sweep read its grants.
+EXPIRE_CONTEXT_SCRIPT = """
+local entry_id = ARGV[1]
+local score = tonumber(redis.call('ZSCORE', KEYS[1], entry_id))
+if not score or score > tonumber(ARGV[2]) then
+    return {0, 0}
+end
+
+if ARGV[5] ~= '' then
+    -- Leave the entry for the next sweep if a grant raced the sweep
+    local indexed = {}
+    for i = 6, #ARGV do
+        indexed[ARGV[i]] = true
+    end
+    for _, agent in ipairs(redis.call('HKEYS', KEYS[6])) do
+        if not indexed[agent] then
+            return {0, 0}
+        end
+    end
+end
+
+local size = redis.call('HSTRLEN', KEYS[2], entry_id)
+for i = 8, #KEYS do
+    redis.call('SREM', KEYS[i], entry_id)
+end
+redis.call('HDEL', KEYS[2], entry_id)
+redis.call('HDEL', KEYS[3], entry_id)
+redis.call('DEL', KEYS[4], KEYS[5], KEYS[6])
+redis.call('SREM', KEYS[7], entry_id)
+redis.call('ZREM', KEYS[1], entry_id)
+if ARGV[4] ~= '' then
+    redis.call('PUBLISH', ARGV[3], ARGV[4])
+end
+return {1, size}
+"""
+
+
+class ContextExpirySweeper:
+    """Deletes context entries whose ``expires_at`` has passed.
+
+    Entries live as fields of the shared ``context_entries`` hash, which
+    cannot carry a per-field TTL, so every write with ``expires_in`` records
+    the entry in a sorted set scored by expiry time. The sweeper pops due
+    entries with a range query and removes the entry, its version, history,
+    grants and scope membership atomically. Readers treat entries past
+    ``expires_at`` as missing in between sweeps.
+    """
+
+    def __init__(self, settings: Settings):
+        """Initialize the sweeper from settings."""
+        self.batch_size = settings.context_expiry_batch_size
+        self.interval = settings.context_expiry_interval_seconds
+        self._script = None
+        self.stats: Dict[str, Any] = {
+            "runs": 0,
+            "entries_expired": 0,
+            "bytes_reclaimed": 0,
+            "last_run_at": None,
+            "last_run_seconds": 0.0,
+        }
+
+    @staticmethod
+    def score(expires_at: datetime) -> float:
+        """Convert an expiry time (naive timestamps are UTC) to a score."""
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at.timestamp()
+
+    async def sweep(
+        self,
+        redis_client: redis.Redis,
+        decode: Callable[[str], BaseModel],
+        invalidation: Optional[Callable[[str], str]] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Delete every entry that expired before ``now``."""
+        started = time.perf_counter()
+        cutoff = self.score(now or datetime.utcnow())
+        if self._script is None or self._script.registered_client is not redis_client:
+            self._script = redis_client.register_script(EXPIRE_CONTEXT_SCRIPT)
+        expired_entries = 0
+        reclaimed_bytes = 0
+
+        while True:
+            entry_ids = await redis_client.zrangebyscore(
+                CONTEXT_EXPIRY_KEY, "-inf", cutoff, start=0, num=self.batch_size
+            )
+            if not entry_ids:
+                break
+
+            # The scope and listing sets are only known from the stored entry
+            # and its grants
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hmget("context_entries", entry_ids)
+                for entry_id in entry_ids:
+                    pipe.hkeys(f"context_access:{entry_id}")
+                payloads, *grantees = await pipe.execute()
+
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for entry_id, payload, agents in zip(entry_ids, payloads, grantees):
+                    scope = ""
+                    readers = []
+                    if payload:
+                        try:
+                            entry = decode(payload)
+                            scope = f"{entry.scope}:{entry.scope_id}"
+                            readers = list(dict.fromkeys([entry.created_by, *agents]))
+                        except Exception as e:
+                            logger.warning(f"Expiring unreadable context entry {entry_id}: {e}")
+                    await self._script(
+                        keys=[
+                            CONTEXT_EXPIRY_KEY,
+                            "context_entries",
+                            "context_versions",
+                            f"context_revisions:{entry_id}",
+                            f"context_history:{entry_id}",
+                            f"context_access:{entry_id}",
+                            f"context_scope:{scope or entry_id}",
+                            *(f"context_readable:{agent}:{scope}" for agent in readers)
+                        ],
+                        args=[
+                            entry_id,
+                            cutoff,
+                            INVALIDATION_CHANNEL if invalidation else "",
+                            invalidation(entry_id) if invalidation else "",
+                            scope,
+                            *readers
+                        ],
+                        client=pipe
+                    )
+                results = await pipe.execute()
+
+            for deleted, size in results:
+                if deleted:
+                    expired_entries += 1
+                    reclaimed_bytes += int(size)
+            if len(entry_ids) < self.batch_size:
+                break
+
+        elapsed = time.perf_counter() - started
+        self.stats["runs"] += 1
+        self.stats["entries_expired"] += expired_entries
+        self.stats["bytes_reclaimed"] += reclaimed_bytes
+        self.stats["last_run_at"] = datetime.utcnow()
+        self.stats["last_run_seconds"] = elapsed
+
+        if expired_entries:
+            logger.info(
+                f"Expired {expired_entries} context entries "
+                f"({reclaimed_bytes} bytes) in {elapsed:.3f}s"
+            )
+        return {"entries_expired": expired_entries, "bytes_reclaimed": reclaimed_bytes}
+
+    async def run(
+        self,
+        redis_client: redis.Redis,
+        decode: Callable[[str], BaseModel],
+        invalidation: Optional[Callable[[str], str]] = None
+    ) -> None:
+        """Sweep expired entries every ``interval`` seconds until cancelled."""
+        while True:
+            try:
+                await self.sweep(redis_client, decode, invalidation)
+            except Exception as e:
+                logger.error(f"Context expiry sweep failed: {e}")
+            await asyncio.sleep(self.interval)
@@ -1,18 +1,113 @@
 """Context management system for agent conversations and state."""
 
-import json
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from uuid import uuid4
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 from pydantic import BaseModel
 
+from ..core.codec import get_codec
 from ..core.config import get_settings
+from .context_cache import INVALIDATION_CHANNEL, MISSING, ContextCache
+from .context_expiry import CONTEXT_EXPIRY_KEY, ContextExpirySweeper
+from .json_delta import make_patch, apply_patch
 
 logger = logging.getLogger(__name__)
 
+# Number of versions kept in each context_revisions hash
+CONTEXT_HISTORY_LIMIT = 100
+
+# Every Nth version is stored in full, the ones in between as a JSON patch
+# against the previous version
+CONTEXT_SNAPSHOT_INTERVAL = 10
+
+# Attempts at an unconditional set_context before giving up on contention
+CONTEXT_CAS_RETRIES = 10
+
+# Set once every stored entry has been added to the per-agent listing index
+CONTEXT_ACCESS_INDEX_MARKER = "context_readable_indexed"
+
+# Compare-and-set of a context entry. The current version lives in the
+# context_versions hash; entries written before it existed fall back to the
+# version inside the stored JSON.
+#
+# History is a hash of version number -> record. A delta record is only
+# stored when the previous version is present, so every retained version can
+# be rebuilt from the snapshot that starts its block. Whole blocks are
+# dropped once they fall out of the history limit.
+#
+# Every key the script touches is passed in KEYS; the writer's listing set is
+# named client-side.
+#
+# KEYS: context_entries, context_versions, context_revisions:{id},
+#       context_scope:{scope}:{scope_id}, context_expiry,
+#       context_readable:{writer}:{scope}:{scope_id}
+# ARGV: entry_id, base_version, entry payload, full history record ("" for none),
+#       history limit, TTL seconds (0 for none), invalidation channel,
+#       invalidation payload ("" for none), expiry score ("" for none),
+#       delta history record ("" for none), snapshot interval
+# Returns {1, new_version} when stored, {0, current_version} on a conflict.
+SET_CONTEXT_SCRIPT = """
+local entry_id = ARGV[1]
+local base_version = tonumber(ARGV[2])
+local current = tonumber(redis.call('HGET', KEYS[2], entry_id))
+if not current then
+    local existing = redis.call('HGET', KEYS[1], entry_id)
+    if not existing then
+        current = 0
+    elseif string.sub(existing, 1, 1) == '{' then
+        local ok, decoded = pcall(cjson.decode, existing)
+        current = ok and tonumber(decoded['version']) or base_version
+    else
+        current = base_version
+    end
+end
+if current ~= base_version then
+    return {0, current}
+end
+
+local version = base_version + 1
+redis.call('HSET', KEYS[1], entry_id, ARGV[3])
+redis.call('HSET', KEYS[2], entry_id, version)
+if ARGV[4] ~= '' then
+    if ARGV[10] ~= '' and redis.call('HEXISTS', KEYS[3], version - 1) == 1 then
+        redis.call('HSET', KEYS[3], version, ARGV[10])
+    else
+        redis.call('HSET', KEYS[3], version, ARGV[4])
+    end
+    local interval = tonumber(ARGV[11])
+    local keep_from = math.floor((version - tonumber(ARGV[5]) + 1) / interval) * interval
+    for old = math.max(keep_from - interval, 1), keep_from - 1 do
+        redis.call('HDEL', KEYS[3], old)
+    end
+end
+if tonumber(ARGV[6]) > 0 then
+    redis.call('EXPIRE', KEYS[3], ARGV[6])
+else
+    redis.call('PERSIST', KEYS[3])
+end
+if ARGV[9] ~= '' then
+    redis.call('ZADD', KEYS[5], ARGV[9], entry_id)
+else
+    redis.call('ZREM', KEYS[5], entry_id)
+end
+redis.call('SADD', KEYS[4], entry_id)
+redis.call('SADD', KEYS[6], entry_id)
+if ARGV[8] ~= '' then
+    redis.call('PUBLISH', ARGV[7], ARGV[8])
+end
+return {1, version}
+"""
+
+
+def _glob_escape(text: str) -> str:
+    """Escape Redis glob special characters so ``text`` matches literally."""
+    return "".join(f"\\{char}" if char in "*?[]\\" else char for char in text)
+
 
 class ContextScope(str):
     """Context scope constants."""
@@ -53,6 +148,11 @@ class ContextVersion(BaseModel):
     change_reason: Optional[str] = None
 
 
+class ContextRevision(ContextVersion):
+    """Stored history record: a full value, or a patch against the previous version."""
+    patch: Optional[List[Dict[str, Any]]] = None
+
+
 class ContextAccessControl(BaseModel):
     """Access control for context entries."""
     entry_id: str
@@ -62,6 +162,19 @@ class ContextAccessControl(BaseModel):
     granted_at: datetime
 
 
+class ContextVersionConflict(Exception):
+    """Raised when a context write was based on a stale version."""
+    
+    def __init__(self, entry_id: str, expected_version: int, actual_version: int):
+        self.entry_id = entry_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+        super().__init__(
+            f"Version conflict on {entry_id}: expected v{expected_version}, "
+            f"found v{actual_version}"
+        )
+
+
 class ContextManager:
     """Manages context storage, versioning, and access control for agents."""
     
@@ -69,6 +182,16 @@ class ContextManager:
         """Initialize the context manager."""
         self.settings = get_settings()
         self.redis_client: Optional[redis.Redis] = None
+        self.codec = get_codec(self.settings.payload_codec)
+        self._set_script: Optional[AsyncScript] = None
+        self.cache: Optional[ContextCache] = None
+        if self.settings.context_cache_enabled:
+            self.cache = ContextCache(
+                max_entries=self.settings.context_cache_size,
+                ttl_seconds=self.settings.context_cache_ttl_seconds
+            )
+        self.expiry_sweeper = ContextExpirySweeper(self.settings)
+        self._expiry_task: Optional[asyncio.Task] = None
         
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -79,6 +202,8 @@ class ContextManager:
                 decode_responses=True
             )
             await self.redis_client.ping()
+            if self.cache:
+                await self.cache.start_listener(self.redis_client)
             logger.info("Connected to Redis context store")
         except Exception as e:
             logger.error(f"Failed to connect to Redis for context: {e}")
@@ -86,10 +211,52 @@ class ContextManager:
     
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
+        if self._expiry_task:
+            self._expiry_task.cancel()
+            try:
+                await self._expiry_task
+            except asyncio.CancelledError:
+                pass
+            self._expiry_task = None
+        if self.cache:
+            await self.cache.stop_listener()
         if self.redis_client:
             await self.redis_client.close()
             logger.info("Disconnected from Redis context store")
     
+    async def start_expiry_sweeper(self) -> None:
+        """Start the background task that deletes expired entries."""
+        if not self.redis_client:
+            await self.connect()
+        
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(
+                self.expiry_sweeper.run(
+                    self.redis_client,
+                    self._decode_entry,
+                    self._expiry_invalidation if self.cache else None
+                )
+            )
+            logger.info(
+                f"Context expiry sweeper started (every {self.expiry_sweeper.interval}s)"
+            )
+    
+    async def expire_context(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Delete every entry that expired before ``now`` (one sweep)."""
+        if not self.redis_client:
+            await self.connect()
+        
+        return await self.expiry_sweeper.sweep(
+            self.redis_client,
+            self._decode_entry,
+            self._expiry_invalidation if self.cache else None,
+            now
+        )
+    
+    def get_expiry_stats(self) -> Dict[str, Any]:
+        """Get counters of the expiry sweeper."""
+        return dict(self.expiry_sweeper.stats)
+    
     async def set_context(
         self,
         key: str,
@@ -99,70 +266,60 @@ class ContextManager:
         created_by: str,
         metadata: Optional[Dict[str, Any]] = None,
         expires_in: Optional[timedelta] = None,
-        change_reason: Optional[str] = None
+        change_reason: Optional[str] = None,
+        expected_version: Optional[int] = None
     ) -> ContextEntry:
-        """Set a context entry with versioning."""
+        """Set a context entry with versioning.
+        
+        The write is an atomic compare-and-set on the entry version. Pass
+        ``expected_version`` (0 for "must not exist") for optimistic locking;
+        a mismatch raises ContextVersionConflict. Without it, concurrent
+        writers are retried so that no version is lost.
+        """
         if not self.redis_client:
             await self.connect()
         
         entry_id = f"{scope}:{scope_id}:{key}"
-        now = datetime.utcnow()
-        expires_at = now + expires_in if expires_in else None
-        
-        # Get existing entry for versioning
-        existing_entry = await self.get_context(key, scope, scope_id, created_by)
-        version = (existing_entry.version + 1) if existing_entry else 1
-        
-        # Create new context entry
-        entry = ContextEntry(
-            id=entry_id,
-            key=key,
-            value=value,
-            scope=scope,
-            scope_id=scope_id,
-            created_by=created_by,
-            created_at=existing_entry.created_at if existing_entry else now,
-            updated_at=now,
-            version=version,
-            metadata=metadata or {},
-            expires_at=expires_at
-        )
         
-        try:
-            # Store the entry
-            entry_data = entry.model_dump_json()
-            await self.redis_client.hset("context_entries", entry_id, entry_data)
+        for _ in range(CONTEXT_CAS_RETRIES):
+            now = datetime.utcnow()
             
-            # Store version history
-            if existing_entry:
-                version_entry = ContextVersion(
-                    version=version,
-                    value=value,
-                    updated_by=created_by,
-                    updated_at=now,
-                    change_reason=change_reason
-                )
-                await self.redis_client.lpush(
-                    f"context_history:{entry_id}",
-                    version_entry.model_dump_json()
-                )
-                # Keep only last 100 versions
-                await self.redis_client.ltrim(f"context_history:{entry_id}", 0, 99)
+            # Usually served by the local cache; the script re-checks the version.
+            # An expired entry that was not swept yet still holds the version.
+            existing_entry = await self._get_entry(entry_id, include_expired=True)
+            current_version = existing_entry.version if existing_entry else 0
+            if existing_entry and self._is_expired(existing_entry, now):
+                existing_entry = None
+            base_version = current_version if expected_version is None else expected_version
             
-            # Set expiration if specified
-            if expires_at:
-                expire_seconds = int((expires_at - now).total_seconds())
-                await self.redis_client.expire(f"context_entries:{entry_id}", expire_seconds)
+            entry, history_data = self._build_write(
+                key, value, scope, scope_id, created_by, metadata,
+                expires_in, change_reason, existing_entry, base_version, now
+            )
             
-            # Index by scope for querying
-            await self.redis_client.sadd(f"context_scope:{scope}:{scope_id}", entry_id)
+            try:
+                stored, actual_version = await self._run_set_script(
+                    entry,
+                    base_version,
+                    history_data,
+                    int(expires_in.total_seconds()) if expires_in else 0
+                )
+            except Exception as e:
+                logger.error(f"Failed to set context {entry_id}: {e}")
+                raise
             
-            logger.debug(f"Context set: {entry_id} v{version}")
-            return entry
+            if stored:
+                self._cache_written(entry)
+                logger.debug(f"Context set: {entry_id} v{entry.version}")
+                return entry
             
-        except Exception as e:
-            logger.error(f"Failed to set context {entry_id}: {e}")
-            raise
+            if self.cache:
+                self.cache.invalidate(entry_id)
+            if expected_version is not None:
+                raise ContextVersionConflict(entry_id, expected_version, actual_version)
+            logger.debug(f"Version race on {entry_id} (v{base_version} != v{actual_version}), retrying")
+        
+        raise ContextVersionConflict(entry_id, base_version, actual_version)
     
     async def get_context(
         self,
@@ -185,26 +342,21 @@ class ContextManager:
                 return None
             
             # Get current entry
-            if version is None:
-                entry_data = await self.redis_client.hget("context_entries", entry_id)
-                if entry_data:
-                    return ContextEntry(**json.loads(entry_data))
-            else:
-                # Get specific version from history
-                history = await self.redis_client.lrange(f"context_history:{entry_id}", 0, -1)
-                for version_data in history:
-                    version_entry = ContextVersion(**json.loads(version_data))
-                    if version_entry.version == version:
-                        # Reconstruct entry with historical value
-                        current_entry_data = await self.redis_client.hget("context_entries", entry_id)
-                        if current_entry_data:
-                            current_entry = ContextEntry(**json.loads(current_entry_data))
-                            current_entry.value = version_entry.value
-                            current_entry.version = version
-                            current_entry.updated_at = version_entry.updated_at
-                            return current_entry
+            current_entry = await self._get_entry(entry_id)
+            if version is None or current_entry is None or version == current_entry.version:
+                return current_entry
+            if not 1 <= version < current_entry.version:
+                return None
             
-            return None
+            # Reconstruct entry with historical value
+            version_entry = (await self._load_versions(entry_id, version, version)).get(version)
+            if version_entry is None:
+                return None
+            return current_entry.model_copy(update={
+                "value": version_entry.value,
+                "version": version,
+                "updated_at": version_entry.updated_at
+            })
             
         except Exception as e:
             logger.error(f"Failed to get context {entry_id}: {e}")
@@ -229,11 +381,24 @@ class ContextManager:
                 logger.warning(f"Access denied for {requester_id} to delete {entry_id}")
                 return False
             
+            # Drop the entry from the listing index of everyone it was indexed for
+            entry = await self._get_entry(entry_id, include_expired=True)
+            indexed_agents = set(await self.redis_client.hkeys(f"context_access:{entry_id}"))
+            if entry:
+                indexed_agents.add(entry.created_by)
+            for agent_id in indexed_agents:
+                await self.redis_client.srem(self._readable_key(agent_id, scope, scope_id), entry_id)
+            
             # Delete entry and related data
             await self.redis_client.hdel("context_entries", entry_id)
-            await self.redis_client.delete(f"context_history:{entry_id}")
+            await self.redis_client.hdel("context_versions", entry_id)
+            await self.redis_client.delete(
+                f"context_revisions:{entry_id}", f"context_history:{entry_id}"
+            )
             await self.redis_client.delete(f"context_access:{entry_id}")
             await self.redis_client.srem(f"context_scope:{scope}:{scope_id}", entry_id)
+            await self.redis_client.zrem(CONTEXT_EXPIRY_KEY, entry_id)
+            await self._publish_invalidation(entry_id)
             
             logger.debug(f"Context deleted: {entry_id}")
             return True
@@ -249,34 +414,130 @@ class ContextManager:
         requester_id: str,
         key_pattern: Optional[str] = None
     ) -> List[ContextEntry]:
-        """List context entries in a scope."""
+        """List context entries in a scope.
+        
+        Only candidates the requester may read are loaded: the whole scope
+        if its default rules allow reading, otherwise the requester's
+        listing index (entries they wrote or were granted). ``key_pattern``
+        is matched server side.
+        """
         if not self.redis_client:
             await self.connect()
         
         try:
-            # Get all entry IDs in scope
-            entry_ids = await self.redis_client.smembers(f"context_scope:{scope}:{scope_id}")
-            
-            entries = []
-            for entry_id in entry_ids:
-                # Filter by key pattern if specified
-                if key_pattern:
-                    key = entry_id.split(":")[-1]
-                    if key_pattern not in key:
-                        continue
-                
-                # Check access permissions
-                if await self._check_access(entry_id, requester_id, AccessLevel.READ):
-                    entry_data = await self.redis_client.hget("context_entries", entry_id)
-                    if entry_data:
-                        entries.append(ContextEntry(**json.loads(entry_data)))
-            
+            entry_ids = await self._candidate_ids(scope, scope_id, requester_id, key_pattern)
+            entries = await self._read_many(entry_ids, requester_id)
             return sorted(entries, key=lambda e: e.updated_at, reverse=True)
             
         except Exception as e:
             logger.error(f"Failed to list context for {scope}:{scope_id}: {e}")
             return []
     
+    async def get_many(
+        self,
+        keys: List[str],
+        scope: str,
+        scope_id: str,
+        requester_id: str
+    ) -> Dict[str, ContextEntry]:
+        """Get several entries of a scope at once.
+        
+        Keys that do not exist or that the requester may not read are left
+        out. Values and ACLs not in the local cache are loaded in a single
+        pipelined round trip.
+        """
+        if not self.redis_client:
+            await self.connect()
+        
+        entry_ids = [f"{scope}:{scope_id}:{key}" for key in keys]
+        try:
+            entries = await self._read_many(entry_ids, requester_id)
+            return {entry.key: entry for entry in entries}
+        except Exception as e:
+            logger.error(f"Failed to get context batch for {scope}:{scope_id}: {e}")
+            return {}
+    
+    async def set_many(
+        self,
+        values: Dict[str, Any],
+        scope: str,
+        scope_id: str,
+        created_by: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        expires_in: Optional[timedelta] = None,
+        change_reason: Optional[str] = None
+    ) -> List[ContextEntry]:
+        """Set several entries of a scope at once.
+        
+        Each key is an independent compare-and-set; the base versions are
+        loaded in one round trip and all writes go out in one pipeline. Keys
+        that lose a race with another writer are retried individually.
+        """
+        if not self.redis_client:
+            await self.connect()
+        
+        now = datetime.utcnow()
+        entry_ids = {key: f"{scope}:{scope_id}:{key}" for key in values}
+        existing, _ = await self._load_many(list(entry_ids.values()))
+        expire_seconds = int(expires_in.total_seconds()) if expires_in else 0
+        
+        writes = []
+        for key, value in values.items():
+            existing_entry = existing.get(entry_ids[key])
+            base_version = existing_entry.version if existing_entry else 0
+            if existing_entry and self._is_expired(existing_entry, now):
+                existing_entry = None
+            entry, history_data = self._build_write(
+                key, value, scope, scope_id, created_by, metadata,
+                expires_in, change_reason, existing_entry, base_version, now
+            )
+            writes.append((entry, base_version, history_data))
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for entry, base_version, history_data in writes:
+                    await self._run_set_script(
+                        entry, base_version, history_data, expire_seconds, client=pipe
+                    )
+                results = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to set context batch for {scope}:{scope_id}: {e}")
+            raise
+        
+        stored_entries = []
+        for (entry, _, _), (stored, _) in zip(writes, results):
+            if stored:
+                self._cache_written(entry)
+                stored_entries.append(entry)
+            else:
+                if self.cache:
+                    self.cache.invalidate(entry.id)
+                stored_entries.append(await self.set_context(
+                    entry.key, values[entry.key], scope, scope_id, created_by,
+                    metadata, expires_in, change_reason
+                ))
+        
+        logger.debug(f"Context batch set: {len(stored_entries)} entries in {scope}:{scope_id}")
+        return stored_entries
+    
+    async def snapshot(
+        self,
+        scope: str,
+        scope_id: str,
+        requester_id: str
+    ) -> Dict[str, ContextEntry]:
+        """Get every entry of a scope the requester may read, keyed by key."""
+        if not self.redis_client:
+            await self.connect()
+        
+        try:
+            entry_ids = await self._candidate_ids(scope, scope_id, requester_id)
+            entries = await self._read_many(entry_ids, requester_id)
+            return {entry.key: entry for entry in entries}
+        except Exception as e:
+            logger.error(f"Failed to snapshot context for {scope}:{scope_id}: {e}")
+            return {}
+    
     async def get_context_history(
         self,
         key: str,
@@ -297,14 +558,18 @@ class ContextManager:
                 logger.warning(f"Access denied for {requester_id} to read history {entry_id}")
                 return []
             
-            # Get version history
-            history_data = await self.redis_client.lrange(f"context_history:{entry_id}", 0, limit-1)
-            
-            versions = []
-            for version_data in history_data:
-                versions.append(ContextVersion(**json.loads(version_data)))
+            # Get version history, newest first
+            entry = await self._get_entry(entry_id)
+            if not entry or limit < 1:
+                return []
+            first = max(entry.version - limit + 1, 1)
+            versions = await self._load_versions(entry_id, first, entry.version)
             
-            return versions
+            return [
+                versions[version]
+                for version in range(entry.version, first - 1, -1)
+                if version in versions
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get context history {entry_id}: {e}")
@@ -339,11 +604,15 @@ class ContextManager:
                 granted_at=datetime.utcnow()
             )
             
-            await self.redis_client.hset(
-                f"context_access:{entry_id}",
-                agent_id,
-                access_control.model_dump_json()
-            )
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(
+                    f"context_access:{entry_id}",
+                    agent_id,
+                    self.codec.encode(access_control)
+                )
+                pipe.sadd(self._readable_key(agent_id, scope, scope_id), entry_id)
+                await pipe.execute()
+            await self._publish_invalidation(entry_id)
             
             logger.debug(f"Access granted: {agent_id} -> {access_level} on {entry_id}")
             return True
@@ -372,7 +641,14 @@ class ContextManager:
                 logger.warning(f"Access denied for {revoked_by} to revoke access to {entry_id}")
                 return False
             
-            await self.redis_client.hdel(f"context_access:{entry_id}", agent_id)
+            entry = await self._get_entry(entry_id, include_expired=True)
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.hdel(f"context_access:{entry_id}", agent_id)
+                # The writer of the current version stays indexed
+                if not entry or entry.created_by != agent_id:
+                    pipe.srem(self._readable_key(agent_id, scope, scope_id), entry_id)
+                await pipe.execute()
+            await self._publish_invalidation(entry_id)
             
             logger.debug(f"Access revoked: {agent_id} from {entry_id}")
             return True
@@ -392,45 +668,464 @@ class ContextManager:
             return False
         
         try:
-            # Parse entry ID to get creator info
-            scope, scope_id, key = entry_id.split(":", 2)
-            
-            # Get entry to check creator
-            entry_data = await self.redis_client.hget("context_entries", entry_id)
-            if entry_data:
-                entry = ContextEntry(**json.loads(entry_data))
-                # Creator always has admin access
-                if entry.created_by == agent_id:
-                    return True
+            entry = await self._get_entry(entry_id, include_expired=True)
+            access_control = None
+            if not entry or entry.created_by != agent_id:
+                access_control = await self._get_access_control(entry_id, agent_id)
             
-            # Check explicit access permissions
-            access_data = await self.redis_client.hget(f"context_access:{entry_id}", agent_id)
-            if access_data:
-                access_control = ContextAccessControl(**json.loads(access_data))
-                return self._access_level_sufficient(access_control.access_level, required_level)
-            
-            # Default access rules based on scope
-            if scope == ContextScope.AGENT:
-                # Agent can access their own context
-                return scope_id == agent_id
-            elif scope == ContextScope.CONVERSATION:
-                # Check if agent is part of the conversation
-                # This could be enhanced to check conversation participants
-                return agent_id in scope_id.split(":")
-            elif scope == ContextScope.GROUP:
-                # Check if agent is member of the group
-                # This would require integration with group membership
-                return True  # Simplified for now
-            elif scope == ContextScope.GLOBAL:
-                # Global context readable by all, writable by admins only
-                return required_level == AccessLevel.READ
-            
-            return False
+            return self._access_allowed(entry_id, agent_id, required_level, entry, access_control)
             
         except Exception as e:
             logger.error(f"Error checking access for {agent_id} to {entry_id}: {e}")
             return False
     
+    def _access_allowed(
+        self,
+        entry_id: str,
+        agent_id: str,
+        required_level: str,
+        entry: Optional[ContextEntry],
+        access_control: Optional[ContextAccessControl]
+    ) -> bool:
+        """Apply the access rules to an already loaded entry and grant."""
+        # Parse entry ID to get scope info
+        scope, scope_id, key = entry_id.split(":", 2)
+        
+        # Creator always has admin access
+        if entry and entry.created_by == agent_id:
+            return True
+        
+        # Check explicit access permissions
+        if access_control:
+            return self._access_level_sufficient(access_control.access_level, required_level)
+        
+        return self._default_access(scope, scope_id, agent_id, required_level)
+    
+    @staticmethod
+    def _default_access(scope: str, scope_id: str, agent_id: str, required_level: str) -> bool:
+        """Apply the scope rules for agents that neither wrote nor were granted an entry."""
+        if scope == ContextScope.AGENT:
+            # Agent can access their own context
+            return scope_id == agent_id
+        elif scope == ContextScope.CONVERSATION:
+            # Check if agent is part of the conversation
+            # This could be enhanced to check conversation participants
+            return agent_id in scope_id.split(":")
+        elif scope == ContextScope.GROUP:
+            # Check if agent is member of the group
+            # This would require integration with group membership
+            return True  # Simplified for now
+        elif scope == ContextScope.GLOBAL:
+            # Global context readable by all, writable by admins only
+            return required_level == AccessLevel.READ
+        
+        return False
+    
+    @staticmethod
+    def _readable_key(agent_id: str, scope: str, scope_id: str) -> str:
+        """Key of the set of entries in a scope an agent wrote or was granted."""
+        return f"context_readable:{agent_id}:{scope}:{scope_id}"
+    
+    async def _candidate_ids(
+        self,
+        scope: str,
+        scope_id: str,
+        requester_id: str,
+        key_pattern: Optional[str] = None
+    ) -> List[str]:
+        """Find the entries of a scope the requester may be able to read.
+        
+        The result is a superset of the readable entries (the index is not
+        pruned when a later writer takes over an entry); callers apply the
+        exact access rules to the loaded entries.
+        """
+        if self._default_access(scope, scope_id, requester_id, AccessLevel.READ):
+            set_key = f"context_scope:{scope}:{scope_id}"
+        else:
+            set_key = self._readable_key(requester_id, scope, scope_id)
+        
+        if not key_pattern:
+            return list(await self.redis_client.smembers(set_key))
+        
+        match = f"{_glob_escape(f'{scope}:{scope_id}:')}*{_glob_escape(key_pattern)}*"
+        return [
+            entry_id
+            async for entry_id in self.redis_client.sscan_iter(set_key, match=match, count=1000)
+            # The glob also matches across ":" inside keys; only the last segment counts
+            if key_pattern in entry_id.split(":")[-1]
+        ]
+    
+    async def rebuild_access_index(self, force: bool = False) -> int:
+        """Index every stored entry for its writer and grantees.
+        
+        Entries written before the listing index existed are only listed for
+        agents with default scope access until this has run once. Later calls
+        are no-ops unless ``force`` is set.
+        """
+        if not self.redis_client:
+            await self.connect()
+        
+        if not force and await self.redis_client.exists(CONTEXT_ACCESS_INDEX_MARKER):
+            return 0
+        
+        indexed = 0
+        cursor = 0
+        while True:
+            cursor, batch = await self.redis_client.hscan(
+                "context_entries", cursor=cursor, count=1000
+            )
+            entry_ids = list(batch)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for entry_id in entry_ids:
+                    pipe.hkeys(f"context_access:{entry_id}")
+                grantees = await pipe.execute()
+            
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for entry_id, agents in zip(entry_ids, grantees):
+                    try:
+                        entry = self._decode_entry(batch[entry_id])
+                    except Exception as e:
+                        logger.warning(f"Skipping unreadable context entry {entry_id}: {e}")
+                        continue
+                    for agent_id in {entry.created_by, *agents}:
+                        pipe.sadd(self._readable_key(agent_id, entry.scope, entry.scope_id), entry_id)
+                results = await pipe.execute()
+            indexed += sum(results)
+            if cursor == 0:
+                break
+        
+        await self.redis_client.set(CONTEXT_ACCESS_INDEX_MARKER, datetime.utcnow().isoformat())
+        if indexed:
+            logger.info(f"Indexed {indexed} context entries for listing")
+        return indexed
+    
+    async def _read_many(self, entry_ids: List[str], requester_id: str) -> List[ContextEntry]:
+        """Load entries and the requester's grants, keeping the readable ones."""
+        entries, grants = await self._load_many(entry_ids, requester_id)
+        return [
+            entry for entry_id, entry in entries.items()
+            if entry and not self._is_expired(entry) and self._access_allowed(
+                entry_id, requester_id, AccessLevel.READ, entry, grants.get(entry_id)
+            )
+        ]
+    
+    async def _load_many(
+        self,
+        entry_ids: List[str],
+        agent_id: Optional[str] = None
+    ) -> Tuple[Dict[str, Optional[ContextEntry]], Dict[str, Optional[ContextAccessControl]]]:
+        """Load entries (and an agent's grants on them) in one round trip.
+        
+        Cached records are used as is; everything else is fetched with one
+        HMGET plus one HGET per grant in a single pipeline. Expired entries
+        are returned as stored.
+        """
+        entries: Dict[str, Optional[ContextEntry]] = {}
+        grants: Dict[str, Optional[ContextAccessControl]] = {}
+        missing_entries = []
+        missing_grants = []
+        
+        for entry_id in entry_ids:
+            cached = self.cache.get_entry(entry_id) if self.cache else MISSING
+            if cached is MISSING:
+                missing_entries.append(entry_id)
+            else:
+                entries[entry_id] = cached
+            
+            if agent_id is None:
+                continue
+            # The creator needs no grant lookup
+            if cached is not MISSING and cached is not None and cached.created_by == agent_id:
+                continue
+            cached_grant = self.cache.get_access(entry_id, agent_id) if self.cache else MISSING
+            if cached_grant is MISSING:
+                missing_grants.append(entry_id)
+            else:
+                grants[entry_id] = cached_grant
+        
+        if not missing_entries and not missing_grants:
+            return entries, grants
+        
+        generation = self.cache.generation if self.cache else None
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            if missing_entries:
+                pipe.hmget("context_entries", missing_entries)
+            for entry_id in missing_grants:
+                pipe.hget(f"context_access:{entry_id}", agent_id)
+            results = await pipe.execute()
+        
+        if missing_entries:
+            for entry_id, entry_data in zip(missing_entries, results[0]):
+                entry = self.codec.decode(entry_data, ContextEntry) if entry_data else None
+                entries[entry_id] = entry
+                if self.cache:
+                    self.cache.put_entry(entry_id, entry, generation)
+            results = results[1:]
+        
+        for entry_id, access_data in zip(missing_grants, results):
+            access_control = (
+                self.codec.decode(access_data, ContextAccessControl) if access_data else None
+            )
+            grants[entry_id] = access_control
+            if self.cache:
+                self.cache.put_access(entry_id, agent_id, access_control, generation)
+        
+        return entries, grants
+    
+    async def _load_versions(
+        self,
+        entry_id: str,
+        first: int,
+        last: int
+    ) -> Dict[int, ContextVersion]:
+        """Rebuild versions ``first`` to ``last`` of an entry from its history.
+        
+        Fetches the snapshot that starts the block of ``first`` and every
+        record up to ``last`` in one round trip, then applies the deltas in
+        order. Versions missing from the history are left out; history
+        written before the revisions hash existed is read as a fallback.
+        """
+        start = (first // CONTEXT_SNAPSHOT_INTERVAL) * CONTEXT_SNAPSHOT_INTERVAL
+        numbers = list(range(max(start, 1), last + 1))
+        records = await self.redis_client.hmget(f"context_revisions:{entry_id}", numbers)
+        
+        versions: Dict[int, ContextVersion] = {}
+        value = MISSING
+        for number, record_data in zip(numbers, records):
+            if not record_data:
+                value = MISSING
+                continue
+            record = self.codec.decode(record_data, ContextRevision)
+            if record.patch is None:
+                value = record.value
+            elif value is not MISSING:
+                value = apply_patch(value, record.patch)
+            else:
+                continue
+            if number >= first:
+                versions[number] = ContextVersion(
+                    version=number,
+                    value=value,
+                    updated_by=record.updated_by,
+                    updated_at=record.updated_at,
+                    change_reason=record.change_reason
+                )
+        
+        if len(versions) < last - first + 1:
+            for version_data in await self.redis_client.lrange(f"context_history:{entry_id}", 0, -1):
+                version_entry = self.codec.decode(version_data, ContextVersion)
+                if first <= version_entry.version <= last:
+                    versions.setdefault(version_entry.version, version_entry)
+        return versions
+    
+    async def _get_entry(
+        self,
+        entry_id: str,
+        include_expired: bool = False
+    ) -> Optional[ContextEntry]:
+        """Get the current version of an entry, from the local cache if possible.
+        
+        Entries past ``expires_at`` are treated as missing unless
+        ``include_expired`` is set.
+        """
+        if self.cache:
+            cached = self.cache.get_entry(entry_id)
+            if cached is not MISSING:
+                return self._unexpired(cached, include_expired)
+            generation = self.cache.generation
+        
+        entry_data = await self.redis_client.hget("context_entries", entry_id)
+        entry = self._decode_entry(entry_data) if entry_data else None
+        
+        if self.cache:
+            self.cache.put_entry(entry_id, entry, generation)
+        return self._unexpired(entry, include_expired)
+    
+    def _decode_entry(self, payload: str) -> ContextEntry:
+        """Decode a stored context entry."""
+        return self.codec.decode(payload, ContextEntry)
+    
+    @staticmethod
+    def _is_expired(entry: ContextEntry, now: Optional[datetime] = None) -> bool:
+        """Check whether an entry is past its ``expires_at``."""
+        return entry.expires_at is not None and entry.expires_at <= (now or datetime.utcnow())
+    
+    def _unexpired(
+        self,
+        entry: Optional[ContextEntry],
+        include_expired: bool = False
+    ) -> Optional[ContextEntry]:
+        """Hide an expired entry that the sweeper has not deleted yet."""
+        if entry is None or include_expired or not self._is_expired(entry):
+            return entry
+        return None
+    
+    def _expiry_invalidation(self, entry_id: str) -> str:
+        """Drop an expired entry locally and build the message for other processes."""
+        self.cache.invalidate(entry_id)
+        return self.cache.invalidation_message(entry_id)
+    
+    async def _get_access_control(
+        self,
+        entry_id: str,
+        agent_id: str
+    ) -> Optional[ContextAccessControl]:
+        """Get an agent's explicit grant on an entry, from the local cache if possible."""
+        if self.cache:
+            cached = self.cache.get_access(entry_id, agent_id)
+            if cached is not MISSING:
+                return cached
+            generation = self.cache.generation
+        
+        access_data = await self.redis_client.hget(f"context_access:{entry_id}", agent_id)
+        access_control = (
+            self.codec.decode(access_data, ContextAccessControl) if access_data else None
+        )
+        
+        if self.cache:
+            self.cache.put_access(entry_id, agent_id, access_control, generation)
+        return access_control
+    
+    def _build_write(
+        self,
+        key: str,
+        value: Any,
+        scope: str,
+        scope_id: str,
+        created_by: str,
+        metadata: Optional[Dict[str, Any]],
+        expires_in: Optional[timedelta],
+        change_reason: Optional[str],
+        existing_entry: Optional[ContextEntry],
+        base_version: int,
+        now: datetime
+    ) -> Tuple[ContextEntry, Tuple[str, str]]:
+        """Build the next version of an entry and its history records.
+        
+        The history is returned as (full record, delta record); either is
+        empty when there is nothing to store.
+        """
+        entry = ContextEntry(
+            id=f"{scope}:{scope_id}:{key}",
+            key=key,
+            value=value,
+            scope=scope,
+            scope_id=scope_id,
+            created_by=created_by,
+            created_at=existing_entry.created_at if existing_entry else now,
+            updated_at=now,
+            version=base_version + 1,
+            metadata=metadata or {},
+            expires_at=now + expires_in if expires_in else None
+        )
+        
+        # Version history starts with the first update
+        history_data = ("", "")
+        if base_version > 0:
+            revision = ContextRevision(
+                version=entry.version,
+                value=value,
+                updated_by=created_by,
+                updated_at=now,
+                change_reason=change_reason
+            )
+            full_data = self.codec.encode(revision)
+            delta_data = ""
+            # A delta needs the exact previous value; the script falls back to
+            # the full record if the previous version is not in history
+            if (
+                entry.version % CONTEXT_SNAPSHOT_INTERVAL != 0
+                and existing_entry is not None
+                and existing_entry.version == base_version
+            ):
+                revision.value = None
+                revision.patch = make_patch(existing_entry.value, value)
+                delta_data = self.codec.encode(revision)
+                if len(delta_data) >= len(full_data):
+                    delta_data = ""
+            history_data = (full_data, delta_data)
+        return entry, history_data
+    
+    def _cache_written(self, entry: ContextEntry) -> None:
+        """Replace the cached copy of an entry after a successful write.
+        
+        The cache holds the stored value decoded again rather than the
+        caller's object, so later deltas are taken against what was stored
+        even if the caller changes its value afterwards.
+        """
+        if self.cache:
+            self.cache.invalidate(entry.id, entry.version)
+            self.cache.put_entry(entry.id, self._decode_entry(self.codec.encode(entry)))
+    
+    async def _run_set_script(
+        self,
+        entry: ContextEntry,
+        base_version: int,
+        history_data: Tuple[str, str],
+        expire_seconds: int,
+        client: Optional[redis.client.Pipeline] = None
+    ) -> Tuple[bool, int]:
+        """Run the compare-and-set script for an entry in one round trip.
+        
+        With a pipeline as ``client`` the call is only queued and the result
+        comes back from ``pipe.execute()``.
+        """
+        if self._set_script is None or self._set_script.registered_client is not self.redis_client:
+            self._set_script = self.redis_client.register_script(SET_CONTEXT_SCRIPT)
+        
+        invalidation = (
+            self.cache.invalidation_message(entry.id, entry.version) if self.cache else ""
+        )
+        result = self._set_script(
+            keys=[
+                "context_entries",
+                "context_versions",
+                f"context_revisions:{entry.id}",
+                f"context_scope:{entry.scope}:{entry.scope_id}",
+                CONTEXT_EXPIRY_KEY,
+                self._readable_key(entry.created_by, entry.scope, entry.scope_id)
+            ],
+            args=[
+                entry.id,
+                base_version,
+                self.codec.encode(entry),
+                history_data[0],
+                CONTEXT_HISTORY_LIMIT,
+                expire_seconds,
+                INVALIDATION_CHANNEL,
+                invalidation,
+                self.expiry_sweeper.score(entry.expires_at) if entry.expires_at else "",
+                history_data[1],
+                CONTEXT_SNAPSHOT_INTERVAL
+            ],
+            client=client
+        )
+        if client is not None:
+            await result
+            return False, 0
+        stored, version = await result
+        return bool(stored), int(version)
+    
+    async def _publish_invalidation(self, entry_id: str, version: Optional[int] = None) -> None:
+        """Drop an entry from the local cache and tell other processes to do the same."""
+        if not self.cache:
+            return
+        
+        self.cache.invalidate(entry_id, version)
+        try:
+            await self.redis_client.publish(
+                INVALIDATION_CHANNEL,
+                self.cache.invalidation_message(entry_id, version)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish context invalidation for {entry_id}: {e}")
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get local cache statistics."""
+        if not self.cache:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.get_stats()}
+    
     def _access_level_sufficient(self, granted_level: str, required_level: str) -> bool:
         """Check if granted access level is sufficient for required level."""
         level_hierarchy = {
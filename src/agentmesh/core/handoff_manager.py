@@ -1,20 +1,117 @@
 """Handoff management system for agent transitions and workflow orchestration."""
 
+import asyncio
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import uuid4
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 from pydantic import BaseModel
 
+from ..core.codec import get_codec
 from ..core.config import get_settings
-from ..messaging.message_bus import get_message_bus, MessageType
+from ..messaging.message_bus import get_message_bus, Message, MessageType
 from .context_manager import get_context_manager, ContextScope
 
 logger = logging.getLogger(__name__)
 
+# Set once every stored handoff has been added to the per-agent history index
+HANDOFF_HISTORY_INDEX_MARKER = "handoff_history_indexed"
+
+# Sorted set of unanswered handoff IDs scored by expires_at
+HANDOFF_EXPIRY_KEY = "handoff_expiry"
+
+# Set once handoffs initiated before the expiry index have been scheduled
+HANDOFF_EXPIRY_INDEX_MARKER = "handoff_expiry_indexed"
+
+# Statuses after which a handoff can no longer expire; a claimed one is being worked on
+FINAL_HANDOFF_STATUSES = {"claimed", "accepted", "rejected", "completed", "cancelled", "expired"}
+
+# One page of an agent's handoff history, newest first, with the requests
+# and statuses of the page. Handoffs created at the same instant are ordered
+# by ID (descending), so the (score, ID) cursor never skips or repeats one.
+#
+# KEYS: handoff_history:{agent}, handoff_requests, handoff_status
+# ARGV: max score ("+inf" for the first page), last handoff ID ("" for none), limit
+# Returns {ids, requests, statuses, scores}.
+HISTORY_PAGE_SCRIPT = """
+local max_score = ARGV[1]
+local last_id = ARGV[2]
+local limit = tonumber(ARGV[3])
+local skip = 0
+if last_id ~= '' then
+    skip = redis.call('ZCOUNT', KEYS[1], max_score, max_score)
+end
+local rows = redis.call('ZREVRANGEBYSCORE', KEYS[1], max_score, '-inf',
+                        'WITHSCORES', 'LIMIT', 0, limit + skip)
+
+local ids = {}
+local scores = {}
+for i = 1, #rows, 2 do
+    local id = rows[i]
+    local after_cursor = last_id == '' or tonumber(rows[i + 1]) ~= tonumber(max_score) or id < last_id
+    if after_cursor and #ids < limit then
+        table.insert(ids, id)
+        table.insert(scores, rows[i + 1])
+    end
+end
+if #ids == 0 then
+    return {{}, {}, {}, {}}
+end
+return {
+    ids,
+    redis.call('HMGET', KEYS[2], unpack(ids)),
+    redis.call('HMGET', KEYS[3], unpack(ids)),
+    scores
+}
+"""
+
+# Claim the highest-priority pending handoff of an agent in one step: pop it,
+# check its expiry against the expiry index, and either mark it claimed or
+# expired. Both outcomes take it out of the expiry index, so a claimed handoff
+# is never expired under its worker. A handoff already popped by a blocking
+# wake-up is passed in as the first candidate.
+#
+# KEYS: pending_handoffs:{agent}, handoff_requests, handoff_status, handoff_expiry
+# ARGV: now (expiry score), claimed status JSON, expired status JSON, candidate ID ("" for none)
+# Returns {claimed ID, claimed request, expired IDs, expired requests}; the
+# claimed ID is "" if nothing could be claimed.
+CLAIM_HANDOFF_SCRIPT = """
+local now = tonumber(ARGV[1])
+local candidate = ARGV[4]
+local expired_ids = {}
+local expired_requests = {}
+while true do
+    local handoff_id = candidate
+    candidate = ''
+    if handoff_id == '' then
+        local popped = redis.call('ZPOPMAX', KEYS[1])
+        if #popped == 0 then
+            return {'', '', expired_ids, expired_requests}
+        end
+        handoff_id = popped[1]
+    end
+
+    local request = redis.call('HGET', KEYS[2], handoff_id)
+    if request then
+        local expires = redis.call('ZSCORE', KEYS[4], handoff_id)
+        redis.call('ZREM', KEYS[4], handoff_id)
+        if expires and tonumber(expires) < now then
+            redis.call('HSET', KEYS[3], handoff_id, ARGV[3])
+            table.insert(expired_ids, handoff_id)
+            table.insert(expired_requests, request)
+        else
+            redis.call('HSET', KEYS[3], handoff_id, ARGV[2])
+            return {handoff_id, request, expired_ids, expired_requests}
+        end
+    end
+end
+"""
+
 
 class HandoffReason(str):
     """Handoff reason constants."""
@@ -30,6 +127,7 @@ class HandoffReason(str):
 class HandoffStatus(str):
     """Handoff status constants."""
     INITIATED = "initiated"
+    CLAIMED = "claimed"
     ACCEPTED = "accepted"
     REJECTED = "rejected"
     COMPLETED = "completed"
@@ -65,7 +163,7 @@ class HandoffAuditEntry(BaseModel):
     """Audit entry for handoff events."""
     id: str
     handoff_id: str
-    event_type: str  # 'created', 'accepted', 'rejected', 'completed', 'cancelled'
+    event_type: str  # 'created', 'claimed', 'accepted', 'rejected', 'completed', 'cancelled'
     agent_id: str
     timestamp: datetime
     details: Dict[str, Any] = {}
@@ -92,8 +190,21 @@ class HandoffManager:
         """Initialize the handoff manager."""
         self.settings = get_settings()
         self.redis_client: Optional[redis.Redis] = None
+        self.codec = get_codec(self.settings.payload_codec)
         self.message_bus = get_message_bus()
         self.context_manager = get_context_manager()
+        self._history_script: Optional[AsyncScript] = None
+        self._claim_script: Optional[AsyncScript] = None
+        self._expiry_task: Optional[asyncio.Task] = None
+        self.expiry_stats: Dict[str, Any] = {
+            "runs": 0,
+            "handoffs_expired": 0,
+            "backlog": 0,
+            "scheduled": 0,
+            "last_run_at": None,
+            "last_run_seconds": 0.0,
+            "max_run_seconds": 0.0,
+        }
         
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -111,6 +222,13 @@ class HandoffManager:
     
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
+        if self._expiry_task:
+            self._expiry_task.cancel()
+            try:
+                await self._expiry_task
+            except asyncio.CancelledError:
+                pass
+            self._expiry_task = None
         if self.redis_client:
             await self.redis_client.close()
             logger.info("Disconnected from Redis handoff store")
@@ -154,7 +272,7 @@ class HandoffManager:
             await self.redis_client.hset(
                 "handoff_requests",
                 handoff_id,
-                handoff_request.model_dump_json()
+                self.codec.encode(handoff_request)
             )
             
             # Add to pending handoffs for the target agent
@@ -163,10 +281,17 @@ class HandoffManager:
                 {handoff_id: priority}
             )
             
-            # Set expiration if specified
+            # Index in the history of both agents
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                self._index_history(pipe, handoff_request)
+                await pipe.execute()
+            
+            # Schedule expiration if specified
             if expires_at:
-                expire_seconds = int((expires_at - now).total_seconds())
-                await self.redis_client.expire(f"handoff_requests:{handoff_id}", expire_seconds)
+                await self.redis_client.zadd(
+                    HANDOFF_EXPIRY_KEY,
+                    {handoff_id: self._expiry_score(expires_at)}
+                )
             
             # Create audit entry
             await self._create_audit_entry(
@@ -218,7 +343,7 @@ class HandoffManager:
             if not handoff_data:
                 raise ValueError(f"Handoff request {handoff_id} not found")
             
-            handoff_request = HandoffRequest(**json.loads(handoff_data))
+            handoff_request = self.codec.decode(handoff_data, HandoffRequest)
             
             # Verify agent is the target
             if handoff_request.to_agent_id != agent_id:
@@ -244,11 +369,12 @@ class HandoffManager:
             await self.redis_client.hset(
                 "handoff_responses",
                 handoff_id,
-                response.model_dump_json()
+                self.codec.encode(response)
             )
             
             # Remove from pending handoffs
             await self.redis_client.zrem(f"pending_handoffs:{agent_id}", handoff_id)
+            await self.redis_client.zrem(HANDOFF_EXPIRY_KEY, handoff_id)
             
             # Update handoff status
             status = HandoffStatus.ACCEPTED if accepted else HandoffStatus.REJECTED
@@ -311,7 +437,7 @@ class HandoffManager:
             if not handoff_data:
                 return False
             
-            handoff_request = HandoffRequest(**json.loads(handoff_data))
+            handoff_request = self.codec.decode(handoff_data, HandoffRequest)
             
             # Only the initiating agent can cancel
             if handoff_request.from_agent_id != agent_id:
@@ -338,6 +464,7 @@ class HandoffManager:
             
             # Remove from pending handoffs
             await self.redis_client.zrem(f"pending_handoffs:{handoff_request.to_agent_id}", handoff_id)
+            await self.redis_client.zrem(HANDOFF_EXPIRY_KEY, handoff_id)
             
             # Create audit entry
             await self._create_audit_entry(
@@ -387,7 +514,7 @@ class HandoffManager:
             for handoff_id in handoff_ids:
                 handoff_data = await self.redis_client.hget("handoff_requests", handoff_id)
                 if handoff_data:
-                    handoff = HandoffRequest(**json.loads(handoff_data))
+                    handoff = self.codec.decode(handoff_data, HandoffRequest)
                     
                     # Check if expired
                     if handoff.expires_at and datetime.utcnow() > handoff.expires_at:
@@ -402,37 +529,291 @@ class HandoffManager:
             logger.error(f"Failed to get pending handoffs for {agent_id}: {e}")
             return []
     
+    async def claim_next_handoff(
+        self,
+        agent_id: str,
+        timeout: float = 0.0
+    ) -> Optional[HandoffRequest]:
+        """Claim the highest-priority pending handoff for an agent.
+        
+        The pop, the expiry check and the status write happen in one Lua
+        script, so concurrent workers never claim the same handoff and a
+        popped handoff is never left looking pending. With a ``timeout``,
+        BZPOPMAX blocks for up to that many seconds as a wake-up signal and
+        the handoff it pops is handed to the script. Expired handoffs popped
+        on the way are marked expired and their initiators notified.
+        Returns None if nothing was claimed.
+        """
+        if not self.redis_client:
+            await self.connect()
+        
+        pending_key = f"pending_handoffs:{agent_id}"
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        try:
+            if (
+                self._claim_script is None
+                or self._claim_script.registered_client is not self.redis_client
+            ):
+                self._claim_script = self.redis_client.register_script(CLAIM_HANDOFF_SCRIPT)
+            
+            candidate = ""
+            while True:
+                now = datetime.utcnow()
+                handoff_id, handoff_data, expired_ids, expired_requests = await self._claim_script(
+                    keys=[pending_key, "handoff_requests", "handoff_status", HANDOFF_EXPIRY_KEY],
+                    args=[
+                        self._expiry_score(now),
+                        json.dumps({
+                            "status": HandoffStatus.CLAIMED,
+                            "updated_at": now.isoformat(),
+                            "updated_by": agent_id
+                        }),
+                        json.dumps({
+                            "status": HandoffStatus.EXPIRED,
+                            "updated_at": now.isoformat(),
+                            "expired_at": now.isoformat()
+                        }),
+                        candidate
+                    ]
+                )
+                if expired_ids:
+                    await self._expire_batch(
+                        [self.codec.decode(data, HandoffRequest) for data in expired_requests], now
+                    )
+                
+                if handoff_id:
+                    await self._create_audit_entry(
+                        handoff_id=handoff_id,
+                        event_type="claimed",
+                        agent_id=agent_id
+                    )
+                    logger.info(f"Handoff {handoff_id} claimed by {agent_id}")
+                    return self.codec.decode(handoff_data, HandoffRequest)
+                
+                remaining = deadline - loop.time()
+                if timeout <= 0 or remaining <= 0:
+                    return None
+                popped = await self.redis_client.bzpopmax(pending_key, timeout=remaining)
+                if not popped:
+                    return None
+                candidate = popped[1]
+            
+        except Exception as e:
+            logger.error(f"Failed to claim handoff for {agent_id}: {e}")
+            raise
+    
     async def get_handoff_history(
         self,
         agent_id: str,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None
     ) -> List[HandoffSummary]:
-        """Get handoff history for an agent."""
+        """Get handoff history for an agent, most recent first."""
+        summaries, _ = await self.get_handoff_history_page(agent_id, limit, cursor)
+        return summaries
+    
+    async def get_handoff_history_page(
+        self,
+        agent_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[HandoffSummary], Optional[str]]:
+        """Get one page of an agent's handoff history and the cursor of the next.
+        
+        Reads the agent's history index and hydrates the page's requests and
+        statuses in a single round trip, so the cost depends on the page
+        size only. The returned cursor is None on the last page.
+        """
         if not self.redis_client:
             await self.connect()
         
         try:
-            # Get handoffs where agent was involved
-            pattern = f"*{agent_id}*"
-            handoff_keys = await self.redis_client.scan_iter(
-                match=f"handoff_requests:*",
-                count=1000
+            max_score, last_id = "+inf", ""
+            if cursor:
+                max_score, last_id = cursor.split(":", 1)
+            
+            if (
+                self._history_script is None
+                or self._history_script.registered_client is not self.redis_client
+            ):
+                self._history_script = self.redis_client.register_script(HISTORY_PAGE_SCRIPT)
+            handoff_ids, requests, statuses, scores = await self._history_script(
+                keys=[f"handoff_history:{agent_id}", "handoff_requests", "handoff_status"],
+                args=[max_score, last_id, limit]
             )
             
             summaries = []
-            async for key in handoff_keys:
-                handoff_id = key.split(":")[-1]
-                summary = await self._create_handoff_summary(handoff_id)
-                if summary and (summary.from_agent_id == agent_id or summary.to_agent_id == agent_id):
+            for handoff_id, handoff_data, status_data in zip(handoff_ids, requests, statuses):
+                summary = self._build_handoff_summary(handoff_id, handoff_data, status_data)
+                if summary:
                     summaries.append(summary)
             
-            # Sort by creation time, most recent first
-            summaries.sort(key=lambda s: s.created_at, reverse=True)
-            return summaries[:limit]
+            next_cursor = None
+            if len(handoff_ids) == limit:
+                next_cursor = f"{scores[-1]}:{handoff_ids[-1]}"
+            return summaries, next_cursor
             
         except Exception as e:
             logger.error(f"Failed to get handoff history for {agent_id}: {e}")
-            return []
+            return [], None
+    
+    async def start_expiry_scheduler(self) -> None:
+        """Start the background task that expires due handoffs."""
+        if not self.redis_client:
+            await self.connect()
+        
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._run_expiry_scheduler())
+            logger.info(
+                f"Handoff expiry scheduler started "
+                f"(every {self.settings.handoff_expiry_interval_seconds}s)"
+            )
+    
+    async def expire_due_handoffs(self, now: Optional[datetime] = None) -> int:
+        """Expire every unanswered handoff whose expires_at is before ``now``.
+        
+        Due handoffs are read from the expiry index in batches. Each worker
+        only expires the IDs its own ZREM removed, so several API processes
+        can run the scheduler side by side. Statuses, pending-set removals
+        and audit entries of a batch go out in one transaction, and the
+        initiators are notified with one bus pipeline.
+        """
+        if not self.redis_client:
+            await self.connect()
+        
+        started = time.perf_counter()
+        now = now or datetime.utcnow()
+        cutoff = self._expiry_score(now)
+        batch_size = self.settings.handoff_expiry_batch_size
+        expired = 0
+        
+        while True:
+            handoff_ids = await self.redis_client.zrangebyscore(
+                HANDOFF_EXPIRY_KEY, "-inf", cutoff, start=0, num=batch_size
+            )
+            if not handoff_ids:
+                break
+            
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for handoff_id in handoff_ids:
+                    pipe.zrem(HANDOFF_EXPIRY_KEY, handoff_id)
+                pipe.hmget("handoff_requests", handoff_ids)
+                pipe.hmget("handoff_status", handoff_ids)
+                results = await pipe.execute()
+            claimed = results[:len(handoff_ids)]
+            requests, statuses = results[len(handoff_ids):]
+            
+            due = []
+            for handoff_id, removed, handoff_data, status_data in zip(
+                handoff_ids, claimed, requests, statuses
+            ):
+                if not removed or not handoff_data:
+                    continue
+                if status_data and json.loads(status_data).get("status") in FINAL_HANDOFF_STATUSES:
+                    continue
+                due.append(self.codec.decode(handoff_data, HandoffRequest))
+            
+            if due:
+                await self._expire_batch(due, now)
+                expired += len(due)
+            if len(handoff_ids) < batch_size:
+                break
+        
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.zcount(HANDOFF_EXPIRY_KEY, "-inf", self._expiry_score(datetime.utcnow()))
+            pipe.zcard(HANDOFF_EXPIRY_KEY)
+            backlog, scheduled = await pipe.execute()
+        
+        elapsed = time.perf_counter() - started
+        self.expiry_stats["runs"] += 1
+        self.expiry_stats["handoffs_expired"] += expired
+        self.expiry_stats["backlog"] = backlog
+        self.expiry_stats["scheduled"] = scheduled
+        self.expiry_stats["last_run_at"] = datetime.utcnow()
+        self.expiry_stats["last_run_seconds"] = elapsed
+        self.expiry_stats["max_run_seconds"] = max(self.expiry_stats["max_run_seconds"], elapsed)
+        
+        if expired:
+            logger.info(f"Expired {expired} handoffs in {elapsed:.3f}s")
+        return expired
+    
+    def get_expiry_stats(self) -> Dict[str, Any]:
+        """Get counters of the expiry scheduler."""
+        return dict(self.expiry_stats)
+    
+    async def backfill_expiry_index(self, force: bool = False) -> int:
+        """Schedule expiry of handoffs initiated before the expiry index existed.
+        
+        Runs once (guarded by a marker key) unless ``force`` is set; handoffs
+        that were already answered are dropped by the next sweep.
+        """
+        if not self.redis_client:
+            await self.connect()
+        
+        if not force and await self.redis_client.exists(HANDOFF_EXPIRY_INDEX_MARKER):
+            return 0
+        
+        indexed = 0
+        cursor = 0
+        while True:
+            cursor, batch = await self.redis_client.hscan(
+                "handoff_requests", cursor=cursor, count=1000
+            )
+            scores = {}
+            for handoff_id, handoff_data in batch.items():
+                try:
+                    handoff = self.codec.decode(handoff_data, HandoffRequest)
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable handoff {handoff_id}: {e}")
+                    continue
+                if handoff.expires_at:
+                    scores[handoff_id] = self._expiry_score(handoff.expires_at)
+            if scores:
+                indexed += await self.redis_client.zadd(HANDOFF_EXPIRY_KEY, scores, nx=True)
+            if cursor == 0:
+                break
+        
+        await self.redis_client.set(HANDOFF_EXPIRY_INDEX_MARKER, datetime.utcnow().isoformat())
+        if indexed:
+            logger.info(f"Scheduled expiry of {indexed} existing handoffs")
+        return indexed
+    
+    async def rebuild_history_index(self, force: bool = False) -> int:
+        """Index every stored handoff in the history of both of its agents.
+        
+        Handoffs initiated before the history index existed are missing from
+        history until this has run once. Later calls are no-ops unless
+        ``force`` is set.
+        """
+        if not self.redis_client:
+            await self.connect()
+        
+        if not force and await self.redis_client.exists(HANDOFF_HISTORY_INDEX_MARKER):
+            return 0
+        
+        indexed = 0
+        cursor = 0
+        while True:
+            cursor, batch = await self.redis_client.hscan(
+                "handoff_requests", cursor=cursor, count=1000
+            )
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for handoff_id, handoff_data in batch.items():
+                    try:
+                        self._index_history(pipe, self.codec.decode(handoff_data, HandoffRequest))
+                    except Exception as e:
+                        logger.warning(f"Skipping unreadable handoff {handoff_id}: {e}")
+                results = await pipe.execute()
+            indexed += sum(results)
+            if cursor == 0:
+                break
+        
+        await self.redis_client.set(HANDOFF_HISTORY_INDEX_MARKER, datetime.utcnow().isoformat())
+        if indexed:
+            logger.info(f"Indexed {indexed} handoff history entries")
+        return indexed
     
     async def get_handoff_audit(
         self,
@@ -447,7 +828,7 @@ class HandoffManager:
             
             audit_entries = []
             for entry_data in audit_data:
-                audit_entries.append(HandoffAuditEntry(**json.loads(entry_data)))
+                audit_entries.append(self.codec.decode(entry_data, HandoffAuditEntry))
             
             return sorted(audit_entries, key=lambda e: e.timestamp)
             
@@ -514,6 +895,57 @@ class HandoffManager:
             }
         )
     
+    async def _run_expiry_scheduler(self) -> None:
+        """Expire due handoffs every interval until cancelled."""
+        try:
+            await self.backfill_expiry_index()
+        except Exception as e:
+            logger.error(f"Failed to backfill handoff expiry index: {e}")
+        
+        while True:
+            try:
+                await self.expire_due_handoffs()
+            except Exception as e:
+                logger.error(f"Handoff expiry sweep failed: {e}")
+            await asyncio.sleep(self.settings.handoff_expiry_interval_seconds)
+    
+    async def _expire_batch(self, handoffs: List[HandoffRequest], now: datetime) -> None:
+        """Mark a batch of handoffs expired and notify their initiators."""
+        status_data = json.dumps({
+            "status": HandoffStatus.EXPIRED,
+            "updated_at": now.isoformat(),
+            "expired_at": now.isoformat()
+        })
+        
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset("handoff_status", mapping={handoff.id: status_data for handoff in handoffs})
+            for handoff in handoffs:
+                pipe.zrem(f"pending_handoffs:{handoff.to_agent_id}", handoff.id)
+                pipe.lpush(
+                    f"handoff_audit:{handoff.id}",
+                    self._encode_audit_entry(
+                        handoff.id, "expired", "system", {"expired_at": now.isoformat()}
+                    )
+                )
+            await pipe.execute()
+        
+        await self.message_bus.send_messages([
+            Message(
+                id=str(uuid4()),
+                sender_id="system",
+                receiver_id=handoff.from_agent_id,
+                message_type=MessageType.HANDOFF,
+                content=f"Handoff to {handoff.to_agent_id} expired: {handoff.message}",
+                metadata={
+                    "handoff_id": handoff.id,
+                    "expired": True,
+                    "response_type": "handoff_expired"
+                },
+                timestamp=now
+            )
+            for handoff in handoffs
+        ])
+    
     async def _expire_handoff(self, handoff_id: str, handoff_request: HandoffRequest) -> None:
         """Mark handoff as expired."""
         now = datetime.utcnow()
@@ -530,6 +962,7 @@ class HandoffManager:
         
         # Remove from pending
         await self.redis_client.zrem(f"pending_handoffs:{handoff_request.to_agent_id}", handoff_id)
+        await self.redis_client.zrem(HANDOFF_EXPIRY_KEY, handoff_id)
         
         await self._create_audit_entry(
             handoff_id=handoff_id,
@@ -546,6 +979,19 @@ class HandoffManager:
         details: Dict[str, Any] = None
     ) -> None:
         """Create an audit entry for a handoff event."""
+        await self.redis_client.lpush(
+            f"handoff_audit:{handoff_id}",
+            self._encode_audit_entry(handoff_id, event_type, agent_id, details)
+        )
+    
+    def _encode_audit_entry(
+        self,
+        handoff_id: str,
+        event_type: str,
+        agent_id: str,
+        details: Dict[str, Any] = None
+    ) -> str:
+        """Build and encode an audit entry for a handoff event."""
         audit_entry = HandoffAuditEntry(
             id=str(uuid4()),
             handoff_id=handoff_id,
@@ -554,24 +1000,36 @@ class HandoffManager:
             timestamp=datetime.utcnow(),
             details=details or {}
         )
-        
-        await self.redis_client.lpush(
-            f"handoff_audit:{handoff_id}",
-            audit_entry.model_dump_json()
-        )
+        return self.codec.encode(audit_entry)
     
-    async def _create_handoff_summary(self, handoff_id: str) -> Optional[HandoffSummary]:
-        """Create a summary for a handoff."""
+    @staticmethod
+    def _expiry_score(expires_at: datetime) -> float:
+        """Convert an expiry time (naive timestamps are UTC) to a score."""
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at.timestamp()
+    
+    def _index_history(self, pipe: redis.client.Pipeline, handoff_request: HandoffRequest) -> None:
+        """Queue the history index entries of a handoff for both of its agents."""
+        score = handoff_request.created_at.replace(tzinfo=timezone.utc).timestamp()
+        for agent_id in {handoff_request.from_agent_id, handoff_request.to_agent_id}:
+            # NX keeps the original position when rebuilding
+            pipe.zadd(f"handoff_history:{agent_id}", {handoff_request.id: score}, nx=True)
+    
+    def _build_handoff_summary(
+        self,
+        handoff_id: str,
+        handoff_data: Optional[str],
+        status_data: Optional[str]
+    ) -> Optional[HandoffSummary]:
+        """Build the summary of a handoff from its stored request and status."""
         try:
-            # Get handoff request
-            handoff_data = await self.redis_client.hget("handoff_requests", handoff_id)
             if not handoff_data:
                 return None
             
-            handoff_request = HandoffRequest(**json.loads(handoff_data))
+            handoff_request = self.codec.decode(handoff_data, HandoffRequest)
             
             # Get status
-            status_data = await self.redis_client.hget("handoff_status", handoff_id)
             status_info = json.loads(status_data) if status_data else {"status": HandoffStatus.INITIATED}
             
             # Calculate duration if completed
@@ -0,0 +1,90 @@
+"""Minimal JSON Patch (RFC 6902) diff and apply for context history deltas."""
+
+import copy
+from typing import Any, Dict, List
+
+# A patch is a list of operations such as {"op": "replace", "path": "/a/0", "value": 1}
+Patch = List[Dict[str, Any]]
+
+
+def _escape(token: str) -> str:
+    """Escape a JSON Pointer reference token."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    """Unescape a JSON Pointer reference token."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> Patch:
+    """Build the operations that turn ``old`` into ``new``.
+
+    Objects are diffed key by key and lists of equal length element by
+    element; anything else that changed is replaced as a whole. The result
+    is valid RFC 6902, though not always the shortest patch.
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(old, dict):
+        ops: Patch = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and len(old) == len(new):
+        ops = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            ops.extend(make_patch(old_item, new_item, f"{path}/{index}"))
+        return ops
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def apply_patch(value: Any, patch: Patch) -> Any:
+    """Apply a patch made by ``make_patch`` and return the new value.
+
+    ``value`` is not modified. Containers on the patched paths are copied;
+    unchanged parts are shared with ``value``, so rebuilding a chain of
+    versions does not copy the whole document at every step.
+    """
+    result = value
+    for op in patch:
+        if op["op"] not in ("add", "remove", "replace"):
+            raise ValueError(f"Unsupported patch operation: {op['op']}")
+        if op["path"] == "":
+            result = copy.deepcopy(op.get("value"))
+            continue
+
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        result = copy.copy(result)
+        parent = result
+        for token in tokens[:-1]:
+            key = int(token) if isinstance(parent, list) else token
+            parent[key] = copy.copy(parent[key])
+            parent = parent[key]
+        last = tokens[-1]
+
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del parent[index]
+            else:
+                parent[index] = copy.deepcopy(op["value"])
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op["value"])
+    return result
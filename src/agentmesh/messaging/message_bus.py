@@ -1,7 +1,6 @@
 """Message bus implementation for agent communication."""
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
@@ -10,11 +9,21 @@ from uuid import uuid4
 import redis.asyncio as redis
 from pydantic import BaseModel
 
+from ..core.codec import get_codec
 from ..core.config import get_settings
 from ..models.agent import AgentInfo
+from .retention import MessageCompactor
+from .streams import StreamTransport
+from .subscriber import SharedSubscriber, Subscription
 
 logger = logging.getLogger(__name__)
 
+# Number of message IDs kept per conversation list
+CONVERSATION_HISTORY_LIMIT = 1000
+
+# Number of message IDs kept per agent message list
+AGENT_MESSAGES_LIMIT = 10000
+
 
 class MessageType(str):
     """Message type constants."""
@@ -41,6 +50,7 @@ class Message(BaseModel):
 class MessageResult(BaseModel):
     """Result of message sending operation."""
     message_id: str
+    receiver_id: Optional[str] = None
     success: bool
     delivered_at: Optional[datetime] = None
     error: Optional[str] = None
@@ -55,6 +65,13 @@ class MessageBus:
         self.redis_client: Optional[redis.Redis] = None
         self.subscribers: Dict[str, set] = {}
         self.message_handlers: Dict[str, List] = {}
+        self.stream_transport: Optional[StreamTransport] = None
+        if self.settings.message_transport == "streams":
+            self.stream_transport = StreamTransport(self.settings)
+        self.shared_subscriber: Optional[SharedSubscriber] = None
+        self.codec = get_codec(self.settings.payload_codec)
+        self.compactor = MessageCompactor(self.settings)
+        self._compactor_task: Optional[asyncio.Task] = None
         
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -72,10 +89,37 @@ class MessageBus:
 
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
+        if self._compactor_task:
+            self._compactor_task.cancel()
+            try:
+                await self._compactor_task
+            except asyncio.CancelledError:
+                pass
+            self._compactor_task = None
+        if self.shared_subscriber:
+            await self.shared_subscriber.close()
+            self.shared_subscriber = None
         if self.redis_client:
             await self.redis_client.close()
             logger.info("Disconnected from Redis message bus")
 
+    async def start_compactor(self) -> None:
+        """Start the background task that deletes expired messages."""
+        if not self.redis_client:
+            await self.connect()
+
+        if self._compactor_task is None or self._compactor_task.done():
+            self._compactor_task = asyncio.create_task(
+                self.compactor.run(self.redis_client, self.decode_message)
+            )
+            logger.info(
+                f"Message compactor started (retention {self.settings.message_retention_hours}h)"
+            )
+
+    def get_retention_stats(self) -> Dict[str, Any]:
+        """Get counters of the message compactor."""
+        return dict(self.compactor.stats)
+
     async def send_message(
         self,
         sender_id: str,
@@ -101,20 +145,20 @@ class MessageBus:
         )
 
         try:
-            # Store message in Redis
-            await self._store_message(message)
-            
-            # Publish to receiver's channel
-            channel = f"agent:{receiver_id}"
-            await self.redis_client.publish(channel, message.model_dump_json())
-            
-            # Store in conversation history
-            await self._store_conversation_message(sender_id, receiver_id, message)
+            payload = self.codec.encode(message)
+
+            # Store, index, publish and trim in a single MULTI/EXEC round trip
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                self._store_message(pipe, message, payload)
+                self._deliver(pipe, receiver_id, payload)
+                self._store_conversation_message(pipe, sender_id, receiver_id, message)
+                await pipe.execute()
             
             logger.debug(f"Message sent from {sender_id} to {receiver_id}")
             
             return MessageResult(
                 message_id=message.id,
+                receiver_id=receiver_id,
                 success=True,
                 delivered_at=datetime.utcnow()
             )
@@ -123,10 +167,54 @@ class MessageBus:
             logger.error(f"Failed to send message: {e}")
             return MessageResult(
                 message_id=message.id,
+                receiver_id=receiver_id,
                 success=False,
                 error=str(e)
             )
 
+    async def send_messages(self, messages: List[Message]) -> List[MessageResult]:
+        """Send several prepared direct messages in one round trip."""
+        if not self.redis_client:
+            await self.connect()
+
+        if not messages:
+            return []
+
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                for message in messages:
+                    payload = self.codec.encode(message)
+                    self._store_message(pipe, message, payload)
+                    self._deliver(pipe, message.receiver_id, payload)
+                    self._store_conversation_message(
+                        pipe, message.sender_id, message.receiver_id, message
+                    )
+                await pipe.execute()
+
+            delivered_at = datetime.utcnow()
+            logger.debug(f"Sent {len(messages)} messages in one batch")
+            return [
+                MessageResult(
+                    message_id=message.id,
+                    receiver_id=message.receiver_id,
+                    success=True,
+                    delivered_at=delivered_at
+                )
+                for message in messages
+            ]
+
+        except Exception as e:
+            logger.error(f"Failed to send message batch: {e}")
+            return [
+                MessageResult(
+                    message_id=message.id,
+                    receiver_id=message.receiver_id,
+                    success=False,
+                    error=str(e)
+                )
+                for message in messages
+            ]
+
     async def broadcast_message(
         self,
         sender_id: str,
@@ -135,40 +223,53 @@ class MessageBus:
         message_type: str = MessageType.BROADCAST,
         metadata: Optional[Dict[str, Any]] = None
     ) -> List[MessageResult]:
-        """Broadcast a message to all agents in a group."""
+        """Broadcast a message to all agents in a group.
+        
+        The message is stored once for the whole group, so it has no
+        receiver_id; members find it in their inbox index and through its
+        group_id. metadata["broadcast_id"] is the message's own ID.
+        """
         if not self.redis_client:
             await self.connect()
 
+        message_id = str(uuid4())
         message = Message(
-            id=str(uuid4()),
+            id=message_id,
             sender_id=sender_id,
             group_id=group_id,
             message_type=message_type,
             content=content,
-            metadata=metadata or {},
+            metadata={**(metadata or {}), "broadcast_id": message_id},
             timestamp=datetime.utcnow()
         )
 
         try:
-            # Store message in Redis
-            await self._store_message(message)
-            
-            # Get group members
             group_members = await self._get_group_members(group_id)
+            recipients = [m for m in group_members if m != sender_id]  # Don't send to self
+            payload = self.codec.encode(message)
             
-            results = []
-            for member_id in group_members:
-                if member_id != sender_id:  # Don't send to self
-                    result = await self.send_message(
-                        sender_id=sender_id,
-                        receiver_id=member_id,
-                        content=content,
-                        message_type=message_type,
-                        metadata={**(metadata or {}), "broadcast_id": message.id}
-                    )
-                    results.append(result)
+            # Store the payload once, then fan out index + publish per member
+            # in the same round trip
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                self._store_message(pipe, message, payload)
+                for member_id in recipients:
+                    self._index_agent_message(pipe, member_id, message.id)
+                    self._deliver(pipe, member_id, payload)
+                    self._store_conversation_message(pipe, sender_id, member_id, message)
+                await pipe.execute()
+            
+            delivered_at = datetime.utcnow()
+            logger.debug(f"Broadcast {message.id} from {sender_id} to {len(recipients)} members of {group_id}")
             
-            return results
+            return [
+                MessageResult(
+                    message_id=message.id,
+                    receiver_id=member_id,
+                    success=True,
+                    delivered_at=delivered_at
+                )
+                for member_id in recipients
+            ]
             
         except Exception as e:
             logger.error(f"Failed to broadcast message: {e}")
@@ -183,10 +284,31 @@ class MessageBus:
         agent_id: str,
         callback
     ) -> None:
-        """Subscribe an agent to receive messages."""
+        """Subscribe an agent to receive messages.
+        
+        With the streams transport this joins the agent's consumer group and
+        only acknowledges messages the callback handled without raising.
+        """
         if not self.redis_client:
             await self.connect()
 
+        if self.stream_transport:
+            async def handle_payload(payload: str) -> None:
+                try:
+                    parsed_message = self.decode_message(payload)
+                except Exception as e:
+                    # Undecodable entries are acknowledged rather than retried
+                    logger.error(f"Dropping malformed message for {agent_id}: {e}")
+                    return
+                await callback(parsed_message)
+
+            logger.info(f"Agent {agent_id} subscribed to message stream")
+            try:
+                await self.stream_transport.consume(self.redis_client, agent_id, handle_payload)
+            except Exception as e:
+                logger.error(f"Subscription error for {agent_id}: {e}")
+            return
+
         channel = f"agent:{agent_id}"
         pubsub = self.redis_client.pubsub()
         
@@ -197,8 +319,7 @@ class MessageBus:
             async for message in pubsub.listen():
                 if message['type'] == 'message':
                     try:
-                        msg_data = json.loads(message['data'])
-                        parsed_message = Message(**msg_data)
+                        parsed_message = self.decode_message(message['data'])
                         await callback(parsed_message)
                     except Exception as e:
                         logger.error(f"Error processing message for {agent_id}: {e}")
@@ -209,30 +330,47 @@ class MessageBus:
             await pubsub.unsubscribe(channel)
             await pubsub.close()
 
+    async def open_subscription(self, agent_id: str) -> Subscription:
+        """Open a queue of an agent's pub/sub messages on the shared connection.
+        
+        Unlike subscribe_to_messages this does not hold a Redis connection per
+        agent; close the subscription with close_subscription.
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        if not self.shared_subscriber:
+            self.shared_subscriber = SharedSubscriber(
+                self.redis_client,
+                queue_size=self.settings.subscriber_queue_size
+            )
+        return await self.shared_subscriber.subscribe(agent_id)
+
+    async def close_subscription(self, subscription: Subscription) -> None:
+        """Close a subscription opened with open_subscription."""
+        if self.shared_subscriber:
+            await self.shared_subscriber.unsubscribe(subscription)
+
     async def get_conversation_history(
         self,
         agent1_id: str,
         agent2_id: str,
-        limit: int = 50
+        limit: int = 50,
+        before: Optional[str] = None,
+        after: Optional[str] = None
     ) -> List[Message]:
-        """Get conversation history between two agents."""
+        """Get conversation history between two agents.
+        
+        Pass the id of a previously returned message as ``before`` to page
+        towards older messages or as ``after`` to page towards newer ones.
+        """
         if not self.redis_client:
             await self.connect()
 
-        # Create conversation key (sorted to ensure consistency)
-        conv_key = f"conversation:{':'.join(sorted([agent1_id, agent2_id]))}"
+        conv_key = self._conversation_key(agent1_id, agent2_id)
         
         try:
-            # Get message IDs from conversation list
-            message_ids = await self.redis_client.lrange(conv_key, 0, limit-1)
-            
-            messages = []
-            for msg_id in message_ids:
-                msg_data = await self.redis_client.hget("messages", msg_id)
-                if msg_data:
-                    messages.append(Message(**json.loads(msg_data)))
-            
-            return list(reversed(messages))  # Most recent first
+            return await self._read_message_page(conv_key, limit, before, after)
             
         except Exception as e:
             logger.error(f"Failed to get conversation history: {e}")
@@ -241,73 +379,128 @@ class MessageBus:
     async def get_agent_messages(
         self,
         agent_id: str,
-        limit: int = 50
+        limit: int = 50,
+        before: Optional[str] = None,
+        after: Optional[str] = None
     ) -> List[Message]:
-        """Get all messages for an agent."""
+        """Get all messages for an agent, paged like get_conversation_history."""
         if not self.redis_client:
             await self.connect()
 
         try:
-            # Get message IDs for the agent
-            message_ids = await self.redis_client.lrange(
-                f"agent_messages:{agent_id}", 0, limit-1
+            return await self._read_message_page(
+                f"agent_messages:{agent_id}", limit, before, after
             )
             
-            messages = []
-            for msg_id in message_ids:
-                msg_data = await self.redis_client.hget("messages", msg_id)
-                if msg_data:
-                    messages.append(Message(**json.loads(msg_data)))
-            
-            return list(reversed(messages))  # Most recent first
-            
         except Exception as e:
             logger.error(f"Failed to get agent messages: {e}")
             return []
 
-    async def _store_message(self, message: Message) -> None:
-        """Store message in Redis."""
-        if not self.redis_client:
-            return
+    async def _read_message_page(
+        self,
+        list_key: str,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Message]:
+        """Read one page of a newest-first message ID list, oldest message first.
+        
+        Costs at most three round trips (LPOS, LRANGE, HMGET) regardless of
+        the page size or how deep the cursor is.
+        """
+        cursor = before or after
+        if cursor:
+            index = await self.redis_client.lpos(list_key, cursor)
+            if index is None:
+                return []
+            if before:
+                start, end = index + 1, index + limit
+            else:
+                start, end = max(0, index - limit), index - 1
+                if end < 0:
+                    return []
+        else:
+            start, end = 0, limit - 1
+
+        message_ids = await self.redis_client.lrange(list_key, start, end)
+        messages = await self._hydrate_messages(message_ids)
+        
+        return list(reversed(messages))  # Oldest first
 
-        # Store in messages hash
-        await self.redis_client.hset(
-            "messages",
-            message.id,
-            message.model_dump_json()
-        )
+    async def _hydrate_messages(self, message_ids: List[str]) -> List[Message]:
+        """Fetch and parse stored messages with a single HMGET."""
+        if not message_ids:
+            return []
+
+        raw_messages = await self.redis_client.hmget("messages", message_ids)
+        return [
+            self.decode_message(msg_data)
+            for msg_data in raw_messages
+            if msg_data
+        ]
+
+    def decode_message(self, payload: str) -> Message:
+        """Decode a stored or published message payload in any codec format."""
+        return self.codec.decode(payload, Message)
+
+    def _deliver(self, pipe: redis.client.Pipeline, receiver_id: str, payload: str) -> None:
+        """Queue delivery of a payload to an agent on the configured transport."""
+        if self.stream_transport:
+            self.stream_transport.publish(pipe, receiver_id, payload)
+        else:
+            pipe.publish(f"agent:{receiver_id}", payload)
+
+    def _store_message(
+        self,
+        pipe: redis.client.Pipeline,
+        message: Message,
+        payload: Optional[str] = None
+    ) -> None:
+        """Queue the commands that store and index a message on a pipeline."""
+        # Store in messages hash and index it for retention
+        pipe.hset("messages", message.id, payload or self.codec.encode(message))
+        self.compactor.index(pipe, message.id, message.timestamp)
         
         # Add to sender's message list
-        await self.redis_client.lpush(
-            f"agent_messages:{message.sender_id}",
-            message.id
-        )
+        self._index_agent_message(pipe, message.sender_id, message.id)
         
         # Add to receiver's message list (if not broadcast)
         if message.receiver_id:
-            await self.redis_client.lpush(
-                f"agent_messages:{message.receiver_id}",
-                message.id
-            )
+            self._index_agent_message(pipe, message.receiver_id, message.id)
 
-    async def _store_conversation_message(
+    def _index_agent_message(
         self,
+        pipe: redis.client.Pipeline,
+        agent_id: str,
+        message_id: str
+    ) -> None:
+        """Queue the commands that add a message to an agent's capped list."""
+        list_key = f"agent_messages:{agent_id}"
+        pipe.lpush(list_key, message_id)
+        pipe.ltrim(list_key, 0, AGENT_MESSAGES_LIMIT - 1)
+        pipe.expire(list_key, self.compactor.retention_seconds)
+
+    def _store_conversation_message(
+        self,
+        pipe: redis.client.Pipeline,
         agent1_id: str,
         agent2_id: str,
         message: Message
     ) -> None:
-        """Store message in conversation history."""
-        if not self.redis_client:
-            return
-
-        # Create conversation key (sorted to ensure consistency)
-        conv_key = f"conversation:{':'.join(sorted([agent1_id, agent2_id]))}"
+        """Queue the commands that append a message to conversation history."""
+        conv_key = self._conversation_key(agent1_id, agent2_id)
         
         # Add message to conversation
-        await self.redis_client.lpush(conv_key, message.id)
+        pipe.lpush(conv_key, message.id)
         
         # Keep only recent messages (configurable limit)
-        await self.redis_client.ltrim(conv_key, 0, 999)  # Keep last 1000 messages
+        pipe.ltrim(conv_key, 0, CONVERSATION_HISTORY_LIMIT - 1)
+        pipe.expire(conv_key, self.compactor.retention_seconds)
+
+    @staticmethod
+    def _conversation_key(agent1_id: str, agent2_id: str) -> str:
+        """Build the conversation key (sorted to ensure consistency)."""
+        return f"conversation:{':'.join(sorted([agent1_id, agent2_id]))}"
 
     async def _get_group_members(self, group_id: str) -> List[str]:
         """Get members of a group."""
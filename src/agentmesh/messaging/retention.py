@@ -0,0 +1,161 @@
+"""Retention and garbage collection for stored bus messages."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+import redis.asyncio as redis
+from pydantic import BaseModel
+
+from ..core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Sorted set of message IDs scored by message timestamp
+MESSAGE_INDEX_KEY = "messages_by_time"
+
+# Set once every stored message has been indexed
+MESSAGE_INDEX_MARKER = "messages_by_time_indexed"
+
+
+class MessageCompactor:
+    """Deletes messages older than ``message_retention_hours``.
+
+    Every stored message is indexed in a sorted set by timestamp, so expired
+    messages are found with a range query instead of scanning the whole
+    ``messages`` hash. Per-agent and conversation lists are capped and carry
+    a TTL at write time; IDs left behind in them by the compactor are skipped
+    when history is hydrated.
+    """
+
+    def __init__(self, settings: Settings):
+        """Initialize the compactor from settings."""
+        self.retention_seconds = settings.message_retention_hours * 3600
+        self.batch_size = settings.message_compaction_batch_size
+        self.interval = settings.message_compaction_interval_seconds
+        self.stats: Dict[str, Any] = {
+            "runs": 0,
+            "messages_reclaimed": 0,
+            "bytes_reclaimed": 0,
+            "last_run_at": None,
+            "last_run_seconds": 0.0,
+        }
+
+    @staticmethod
+    def score(timestamp: datetime) -> float:
+        """Convert a message timestamp (naive timestamps are UTC) to a score."""
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+
+    def index(self, pipe: redis.client.Pipeline, message_id: str, timestamp: datetime) -> None:
+        """Queue the index entry for a newly stored message."""
+        pipe.zadd(MESSAGE_INDEX_KEY, {message_id: self.score(timestamp)})
+
+    async def compact(
+        self,
+        redis_client: redis.Redis,
+        now: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Delete every message older than the retention window."""
+        started = time.perf_counter()
+        cutoff = self.score(now or datetime.utcnow()) - self.retention_seconds
+        reclaimed_messages = 0
+        reclaimed_bytes = 0
+
+        while True:
+            message_ids = await redis_client.zrangebyscore(
+                MESSAGE_INDEX_KEY, "-inf", cutoff, start=0, num=self.batch_size
+            )
+            if not message_ids:
+                break
+
+            # Measure before deleting so the reclaimed bytes can be reported
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for message_id in message_ids:
+                    pipe.hstrlen("messages", message_id)
+                sizes = await pipe.execute()
+
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.hdel("messages", *message_ids)
+                pipe.zrem(MESSAGE_INDEX_KEY, *message_ids)
+                await pipe.execute()
+
+            reclaimed_messages += sum(1 for size in sizes if size)
+            reclaimed_bytes += sum(
+                size + len(message_id)
+                for message_id, size in zip(message_ids, sizes)
+                if size
+            )
+            if len(message_ids) < self.batch_size:
+                break
+
+        elapsed = time.perf_counter() - started
+        self.stats["runs"] += 1
+        self.stats["messages_reclaimed"] += reclaimed_messages
+        self.stats["bytes_reclaimed"] += reclaimed_bytes
+        self.stats["last_run_at"] = datetime.utcnow()
+        self.stats["last_run_seconds"] = elapsed
+
+        if reclaimed_messages:
+            logger.info(
+                f"Compacted {reclaimed_messages} expired messages "
+                f"({reclaimed_bytes} bytes) in {elapsed:.3f}s"
+            )
+        return {"messages_reclaimed": reclaimed_messages, "bytes_reclaimed": reclaimed_bytes}
+
+    async def backfill_index(
+        self,
+        redis_client: redis.Redis,
+        decode: Callable[[str], BaseModel],
+        force: bool = False
+    ) -> int:
+        """Index messages stored before the retention index existed.
+
+        Later calls are no-ops unless ``force`` is set.
+        """
+        if not force and await redis_client.exists(MESSAGE_INDEX_MARKER):
+            return 0
+
+        indexed = 0
+        cursor = 0
+        while True:
+            cursor, batch = await redis_client.hscan(
+                "messages", cursor=cursor, count=self.batch_size
+            )
+            scores = {}
+            for message_id, payload in batch.items():
+                try:
+                    scores[message_id] = self.score(decode(payload).timestamp)
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable message {message_id}: {e}")
+            if scores:
+                # NX keeps the scores of messages that are already indexed
+                indexed += await redis_client.zadd(MESSAGE_INDEX_KEY, scores, nx=True)
+            if cursor == 0:
+                break
+
+        await redis_client.set(MESSAGE_INDEX_MARKER, datetime.utcnow().isoformat())
+        if indexed:
+            logger.info(f"Indexed {indexed} messages for retention")
+        return indexed
+
+    async def run(
+        self,
+        redis_client: redis.Redis,
+        decode: Callable[[str], BaseModel]
+    ) -> None:
+        """Compact expired messages every ``interval`` seconds until cancelled."""
+        try:
+            await self.backfill_index(redis_client, decode)
+        except Exception as e:
+            logger.error(f"Failed to backfill message retention index: {e}")
+
+        while True:
+            try:
+                await self.compact(redis_client)
+            except Exception as e:
+                logger.error(f"Message compaction failed: {e}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,178 @@
+"""Redis Streams transport for durable agent message delivery."""
+
+import logging
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from ..core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+MessageCallback = Callable[[str], Awaitable[Any]]
+
+
+class StreamTransport:
+    """Per-agent inboxes on Redis Streams with consumer groups.
+
+    Every agent gets a capped stream (``agent_stream:{agent_id}``). Consumers
+    read through a shared consumer group, so several API workers can serve the
+    same inbox without duplicating deliveries, and entries are only removed
+    from the pending list once the callback succeeded (XACK). Entries left
+    pending by a dead consumer are taken over with XAUTOCLAIM once they have
+    been idle for ``stream_claim_idle_ms``.
+    """
+
+    def __init__(self, settings: Settings):
+        """Initialize the stream transport from settings."""
+        self.maxlen = settings.stream_maxlen
+        self.group = settings.stream_consumer_group
+        self.block_ms = settings.stream_block_ms
+        self.batch_size = settings.stream_batch_size
+        self.claim_idle_ms = settings.stream_claim_idle_ms
+        self.consumer_name = f"{socket.gethostname()}-{os.getpid()}"
+
+    @staticmethod
+    def stream_key(agent_id: str) -> str:
+        """Get the stream key holding an agent's inbox."""
+        return f"agent_stream:{agent_id}"
+
+    def publish(self, pipe: redis.client.Pipeline, agent_id: str, payload: str) -> None:
+        """Queue an XADD of a message payload onto a pipeline."""
+        pipe.xadd(
+            self.stream_key(agent_id),
+            {"data": payload},
+            maxlen=self.maxlen,
+            approximate=True
+        )
+
+    async def ensure_group(self, redis_client: redis.Redis, agent_id: str) -> None:
+        """Create the consumer group for an agent inbox if it does not exist."""
+        try:
+            # Start from the beginning so entries written while nobody was
+            # consuming are still delivered
+            await redis_client.xgroup_create(
+                self.stream_key(agent_id), self.group, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def consume(
+        self,
+        redis_client: redis.Redis,
+        agent_id: str,
+        callback: MessageCallback,
+        consumer_name: Optional[str] = None
+    ) -> None:
+        """Deliver an agent's inbox to ``callback`` until cancelled.
+
+        The callback receives the raw payload; an entry is acknowledged only
+        after the callback returns without raising.
+        """
+        consumer = consumer_name or self.consumer_name
+        await self.ensure_group(redis_client, agent_id)
+        logger.info(f"Consumer {consumer} reading stream {self.stream_key(agent_id)}")
+
+        claim_cursor = "0-0"
+        last_claim = 0.0
+        while True:
+            # Periodically take over entries stuck with dead consumers
+            if time.monotonic() - last_claim >= self.claim_idle_ms / 1000:
+                claim_cursor = await self.read_batch(
+                    redis_client, agent_id, callback, consumer, claim_cursor
+                )
+                last_claim = time.monotonic()
+            else:
+                await self.read_batch(redis_client, agent_id, callback, consumer)
+
+    async def read_batch(
+        self,
+        redis_client: redis.Redis,
+        agent_id: str,
+        callback: MessageCallback,
+        consumer_name: Optional[str] = None,
+        claim_cursor: Optional[str] = None
+    ) -> Optional[str]:
+        """Run one consumer iteration over an agent inbox.
+
+        When ``claim_cursor`` is given, idle entries of other consumers are
+        reclaimed first. Returns the next XAUTOCLAIM cursor.
+        """
+        stream = self.stream_key(agent_id)
+        consumer = consumer_name or self.consumer_name
+
+        if claim_cursor is not None:
+            claim_cursor, entries = await self._reclaim(
+                redis_client, stream, consumer, claim_cursor
+            )
+            await self._process(redis_client, stream, entries, callback)
+
+        response = await redis_client.xreadgroup(
+            self.group,
+            consumer,
+            {stream: ">"},
+            count=self.batch_size,
+            block=self.block_ms
+        )
+        for _, entries in response or []:
+            await self._process(redis_client, stream, entries, callback)
+        return claim_cursor
+
+    async def pending_count(self, redis_client: redis.Redis, agent_id: str) -> int:
+        """Get the number of delivered but unacknowledged entries."""
+        try:
+            summary = await redis_client.xpending(self.stream_key(agent_id), self.group)
+            return summary["pending"]
+        except ResponseError:
+            return 0
+
+    async def _reclaim(
+        self,
+        redis_client: redis.Redis,
+        stream: str,
+        consumer: str,
+        start_id: str
+    ) -> Tuple[str, List[Tuple[str, Any]]]:
+        """Claim entries that have been pending longer than the idle threshold."""
+        result = await redis_client.xautoclaim(
+            stream,
+            self.group,
+            consumer,
+            min_idle_time=self.claim_idle_ms,
+            start_id=start_id,
+            count=self.batch_size
+        )
+        next_id, entries = result[0], result[1]
+        if entries:
+            logger.info(f"Consumer {consumer} reclaimed {len(entries)} entries from {stream}")
+        return next_id, entries
+
+    async def _process(
+        self,
+        redis_client: redis.Redis,
+        stream: str,
+        entries: List[Tuple[str, Any]],
+        callback: MessageCallback
+    ) -> None:
+        """Run the callback for each entry and acknowledge the successful ones."""
+        acked = []
+        for entry_id, fields in entries:
+            payload = (fields or {}).get("data")
+            if payload is None:
+                # Trimmed or malformed entry - nothing to deliver
+                acked.append(entry_id)
+                continue
+            try:
+                await callback(payload)
+                acked.append(entry_id)
+            except Exception as e:
+                # Leave it pending so it is redelivered after the idle timeout
+                logger.error(f"Error processing entry {entry_id} from {stream}: {e}")
+
+        if acked:
+            await redis_client.xack(stream, self.group, *acked)
@@ -0,0 +1,157 @@
+"""Shared pub/sub subscriber multiplexing agent channels over one connection."""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """A bounded in-process queue of payloads for one agent channel.
+
+    The shared reader never waits on a slow consumer: when the queue is full
+    the oldest payload is dropped and counted, so one stalled WebSocket cannot
+    hold up delivery to every other agent on the process. Dropped messages are
+    still stored and can be fetched through the history endpoints.
+    """
+
+    def __init__(self, agent_id: str, maxsize: int):
+        """Initialize a subscription for an agent."""
+        self.agent_id = agent_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.delivered = 0
+        self.dropped = 0
+
+    def deliver(self, payload: str) -> None:
+        """Queue a payload, evicting the oldest one if the consumer is behind."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            if self.dropped == 1:
+                logger.warning(
+                    f"Subscriber queue for {self.agent_id} is full, dropping oldest messages"
+                )
+        self.queue.put_nowait(payload)
+        self.delivered += 1
+
+    async def get(self) -> str:
+        """Wait for the next payload."""
+        return await self.queue.get()
+
+
+class SharedSubscriber:
+    """One pub/sub connection per process serving every agent subscription.
+
+    Channels are subscribed when the first local subscription for an agent is
+    opened and unsubscribed when the last one closes. A single reader task
+    dispatches incoming payloads to the per-subscription queues.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        queue_size: int = 1000,
+        poll_timeout: float = 1.0
+    ):
+        """Initialize the shared subscriber."""
+        self.redis_client = redis_client
+        self.queue_size = queue_size
+        self.poll_timeout = poll_timeout
+        self.pubsub: Optional[redis.client.PubSub] = None
+        self.subscriptions: Dict[str, Set[Subscription]] = {}
+        self.delivered = 0
+        self.dropped = 0
+        self._lock = asyncio.Lock()
+        self._reader_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @staticmethod
+    def channel(agent_id: str) -> str:
+        """Get the pub/sub channel carrying an agent's messages."""
+        return f"agent:{agent_id}"
+
+    async def subscribe(self, agent_id: str) -> Subscription:
+        """Open a subscription to an agent's channel."""
+        subscription = Subscription(agent_id, self.queue_size)
+        async with self._lock:
+            if self.pubsub is None:
+                self.pubsub = self.redis_client.pubsub()
+                self._closed = False
+
+            subscriptions = self.subscriptions.setdefault(agent_id, set())
+            if not subscriptions:
+                await self.pubsub.subscribe(self.channel(agent_id))
+            subscriptions.add(subscription)
+
+            if self._reader_task is None or self._reader_task.done():
+                self._reader_task = asyncio.create_task(self._reader())
+
+        logger.debug(f"Opened shared subscription for agent {agent_id}")
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        """Close a subscription, dropping the channel if nobody else uses it."""
+        agent_id = subscription.agent_id
+        async with self._lock:
+            subscriptions = self.subscriptions.get(agent_id)
+            if not subscriptions or subscription not in subscriptions:
+                return
+
+            subscriptions.discard(subscription)
+            self.dropped += subscription.dropped
+            if not subscriptions:
+                del self.subscriptions[agent_id]
+                try:
+                    await self.pubsub.unsubscribe(self.channel(agent_id))
+                except Exception as e:
+                    logger.warning(f"Error unsubscribing from {agent_id}: {e}")
+
+        logger.debug(f"Closed shared subscription for agent {agent_id}")
+
+    async def close(self) -> None:
+        """Stop the reader task and close the pub/sub connection."""
+        self._closed = True
+        if self._reader_task:
+            await self._reader_task
+            self._reader_task = None
+        if self.pubsub:
+            await self.pubsub.aclose()
+            self.pubsub = None
+        self.subscriptions.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get delivery statistics for the shared subscriber."""
+        live = [s for subscriptions in self.subscriptions.values() for s in subscriptions]
+        return {
+            "channels": len(self.subscriptions),
+            "subscriptions": len(live),
+            "delivered": self.delivered,
+            "dropped": self.dropped + sum(s.dropped for s in live),
+            "queued": sum(s.queue.qsize() for s in live),
+        }
+
+    async def _reader(self) -> None:
+        """Read the shared connection and fan payloads out to local queues."""
+        while not self._closed:
+            try:
+                message = await self.pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self.poll_timeout
+                )
+            except Exception as e:
+                logger.error(f"Shared subscriber read error: {e}")
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            if message and message["type"] == "message":
+                self._dispatch(message["channel"], message["data"])
+
+    def _dispatch(self, channel: str, payload: str) -> None:
+        """Deliver a payload to every local subscription of a channel."""
+        agent_id = channel.split(":", 1)[1]
+        for subscription in self.subscriptions.get(agent_id, ()):
+            subscription.deliver(payload)
+            self.delivered += 1
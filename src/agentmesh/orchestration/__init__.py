@@ -2,10 +2,12 @@
 
 from .sequential import SequentialOrchestrator
 from .round_robin import RoundRobinOrchestrator
-from .graph import GraphOrchestrator, WorkflowNode, WorkflowEdge, NodeStatus, EdgeType, ParallelExecution
+from .graph import GraphOrchestrator, WorkflowNode, WorkflowEdge, NodeStatus, EdgeType, ParallelExecution, SchedulingPolicy, JoinPolicy, JoinState
 from .swarm import SwarmOrchestrator, SwarmMetrics, HandoffDecision, SwarmParticipant, SwarmStatus, HandoffType
 from .base import BaseOrchestrator, OrchestrationPattern, WorkflowConfig, WorkflowStatus, TaskResult, AgentExecutionError
 from .round_robin import TerminationCondition
+from .result_cache import ResultCache, get_result_cache
+from .run_history import RunHistory, WorkflowHistory, get_run_history
 
 __all__ = [
     "BaseOrchestrator",
@@ -19,11 +21,19 @@ __all__ = [
     "TaskResult",
     "TerminationCondition",
     "AgentExecutionError",
+    "ResultCache",
+    "get_result_cache",
+    "RunHistory",
+    "WorkflowHistory",
+    "get_run_history",
     "WorkflowNode",
     "WorkflowEdge",
     "NodeStatus",
     "EdgeType",
     "ParallelExecution",
+    "SchedulingPolicy",
+    "JoinPolicy",
+    "JoinState",
     "SwarmMetrics",
     "HandoffDecision", 
     "SwarmParticipant",
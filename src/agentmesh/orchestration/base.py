@@ -10,6 +10,9 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
+from ..core.agent_manager import get_agent_manager
+from .result_cache import MISSING, ResultCache, get_result_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +54,7 @@ class WorkflowConfig(BaseModel):
     timeout: Optional[int] = None  # Timeout in seconds
     retry_attempts: int = 3
     failure_policy: str = "fail_fast"  # "fail_fast" or "continue"
+    cache_results: bool = False  # reuse results of identical agent calls, see ResultCache
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -74,6 +78,8 @@ class BaseOrchestrator(ABC):
         self.workflow_id = str(uuid4())
         self.context = WorkflowContext(workflow_id=self.workflow_id)
         self.logger = logging.getLogger(f"{self.__class__.__name__}.{self.workflow_id[:8]}")
+        self.result_cache: Optional[ResultCache] = get_result_cache() if config.cache_results else None
+        self.cache_stats = {"hits": 0, "misses": 0}
 
     @abstractmethod
     async def execute(self, task: str, **kwargs) -> TaskResult:
@@ -145,6 +151,39 @@ class BaseOrchestrator(ABC):
             "updated_at": self.context.updated_at.isoformat()
         }
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get result cache hits and misses of this workflow."""
+        lookups = self.cache_stats["hits"] + self.cache_stats["misses"]
+        return {
+            "enabled": self.result_cache is not None,
+            **self.cache_stats,
+            "hit_rate": self.cache_stats["hits"] / lookups if lookups else 0.0
+        }
+
+    async def _result_cache_key(self, agent_id: str, task: str, upstream_outputs: Any) -> str:
+        """Key an agent call by the agent's configuration, its task and its inputs."""
+        agent_config = await get_agent_manager().get_agent_config(agent_id)
+        return ResultCache.make_key(
+            agent_config.model_dump(mode="json") if agent_config else agent_id,
+            task,
+            upstream_outputs
+        )
+
+    def _cached_result(self, key: str) -> Any:
+        """Look up a cached agent result, ``MISSING`` if there is none."""
+        result = self.result_cache.get(key)
+        self.cache_stats["hits" if result is not MISSING else "misses"] += 1
+        return result
+
+    async def _invoke_agent(self, agent_id: str, prompt: str) -> str:
+        """Run an agent on a prompt through the agent executor."""
+        response = await get_agent_manager().invoke_agent(agent_id, prompt)
+        self.logger.debug(
+            f"Agent {agent_id} answered on {response.provider} in {response.latency:.2f}s "
+            f"after {response.queued:.2f}s queued"
+        )
+        return response.content
+
     def _update_context(self, result: TaskResult) -> None:
         """Update workflow context with task result."""
         self.context.history.append(result)
@@ -1,7 +1,10 @@
 """Graph-based workflow orchestration implementation."""
 
 import asyncio
+import heapq
+import itertools
 import logging
+import time
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from enum import Enum
@@ -14,10 +17,15 @@ from .base import (
     TaskResult,
     AgentExecutionError
 )
+from .result_cache import MISSING
+from .run_history import WorkflowHistory
 from ..models.message import BaseChatMessage, TextMessage, SystemMessage
 
 logger = logging.getLogger(__name__)
 
+# Weight of the latest run in a node's smoothed duration history
+DURATION_SMOOTHING = 0.3
+
 
 class NodeStatus(Enum):
     """Status of a workflow node."""
@@ -37,6 +45,46 @@ class EdgeType(Enum):
     SYNCHRONIZE = "synchronize"  # Wait for multiple paths
 
 
+class SchedulingPolicy(Enum):
+    """Order in which ready nodes get concurrency capacity."""
+    FIFO = "fifo"  # In the order they became ready
+    CRITICAL_PATH = "critical_path"  # Longest expected remaining path first
+
+
+class JoinPolicy(Enum):
+    """How many inputs a join node waits for."""
+    ALL = "all"  # Every input
+    QUORUM = "quorum"  # Any k inputs
+    FIRST = "first"  # The first input to complete
+
+
+def _reduce_concat(accumulator: Optional[str], node_id: str, output: Dict[str, Any]) -> str:
+    """Join the ``result`` of each input, one per line."""
+    line = f"{node_id}: {output.get('result')}"
+    return f"{accumulator}\n{line}" if accumulator else line
+
+
+def _reduce_merge(accumulator: Optional[Dict[str, Any]], node_id: str, output: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge input outputs into one dict, later inputs overriding earlier ones."""
+    return {**(accumulator or {}), **output}
+
+
+def _reduce_vote(accumulator: Optional[Dict[str, int]], node_id: str, output: Dict[str, Any]) -> Dict[str, int]:
+    """Count how many inputs returned each ``result``."""
+    votes = dict(accumulator or {})
+    result = str(output.get("result"))
+    votes[result] = votes.get(result, 0) + 1
+    return votes
+
+
+# Named reducers usable from workflow configuration
+JOIN_REDUCERS: Dict[str, Callable[[Any, str, Dict[str, Any]], Any]] = {
+    "concat": _reduce_concat,
+    "merge": _reduce_merge,
+    "vote": _reduce_vote,
+}
+
+
 @dataclass
 class WorkflowNode:
     """Represents a node in the workflow graph."""
@@ -65,6 +113,35 @@ class WorkflowEdge:
     condition_data: Optional[Dict[str, Any]] = None
     weight: float = 1.0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    gating: bool = False  # condition only decides whether the target runs; its output is not fed
+
+
+@dataclass
+class JoinState:
+    """A join node and the inputs that have reached it in the current run.
+    
+    Inputs are the sources of the node's synchronize edges and the nodes of
+    parallel branches it synchronizes. Each completed input is folded into
+    ``accumulator`` as it arrives; the join fires once enough have arrived.
+    """
+    node_id: str
+    policy: JoinPolicy = JoinPolicy.ALL
+    quorum: Optional[int] = None
+    reducer: Optional[Callable[[Any, str, Dict[str, Any]], Any]] = None
+    cancel_stragglers: bool = True
+    inputs: Set[str] = field(default_factory=set)
+    arrived: List[str] = field(default_factory=list)
+    accumulator: Any = None
+    fired: bool = False
+    skipped: List[str] = field(default_factory=list)
+
+    def required(self) -> int:
+        """Number of inputs the join waits for."""
+        if self.policy == JoinPolicy.FIRST:
+            return min(1, len(self.inputs))
+        if self.policy == JoinPolicy.QUORUM:
+            return min(self.quorum, len(self.inputs))
+        return len(self.inputs)
 
 
 @dataclass
@@ -100,11 +177,41 @@ class GraphOrchestrator(BaseOrchestrator):
         self.edges: Dict[str, WorkflowEdge] = {}
         self.execution_graph: Dict[str, List[str]] = {}  # adjacency list
         self.reverse_graph: Dict[str, List[str]] = {}  # reverse adjacency list
+        self._edge_index: Dict[Tuple[str, str], WorkflowEdge] = {}  # (source, target) -> edge
+        self._node_branches: Dict[str, List[str]] = {}  # node -> parallel branches it is in
+        self.joins: Dict[str, JoinState] = {}  # join node -> join state, see set_join
+        self._node_joins: Dict[str, List[str]] = {}  # node -> join nodes it is an input of
+        self._unmet: Dict[str, int] = {}  # node -> incoming edges not yet satisfied
+        self._ready: Dict[str, float] = {}  # nodes ready to start -> when they became ready
+        self.max_concurrency: Optional[int] = None  # nodes running at once, None for no limit
+        self.agent_concurrency: Dict[str, int] = {}  # agent_id -> nodes running at once
+        self._agents_in_flight: Dict[str, int] = {}
+        self.scheduling_policy = SchedulingPolicy.FIFO
+        self.duration_history: Dict[str, float] = {}  # node_id -> smoothed duration in seconds
+        self._priorities: Dict[str, float] = {}  # node_id -> expected remaining path
+        self._ready_heap: List[Tuple[float, int, str]] = []  # (-priority, sequence, node_id)
+        self._ready_sequence = itertools.count()
+        self.queue_stats: Dict[str, Any] = {}  # time spent waiting for capacity
+        self._reset_queue_stats()
+        self.speculative = False  # start likely conditional targets early, see set_speculation
+        self.speculation_threshold = 0.5
+        self.condition_history: Dict[str, List[int]] = {}  # edge_id -> [times taken, times evaluated]
+        self._speculative: Dict[str, str] = {}  # node started ahead of its condition -> edge_id
+        self._speculation_clock: Dict[str, List[Optional[float]]] = {}  # node -> [started, finished]
+        self._discarded_tasks: Set[asyncio.Task] = set()  # cancelled speculative runs
+        self.speculation_stats: Dict[str, Any] = {}
+        self._reset_speculation_stats()
         self.parallel_executions: Dict[str, ParallelExecution] = {}
         self.current_nodes: Set[str] = set()  # currently executing nodes
         self.completed_nodes: Set[str] = set()
         self.failed_nodes: Set[str] = set()
+        self.cached_nodes: Set[str] = set()  # completed from the result cache in the last run
         self.execution_context: Dict[str, Any] = {}
+        self._node_tasks: Dict[str, asyncio.Task] = {}  # running node tasks
+        self._task_nodes: Dict[asyncio.Task, str] = {}  # running node tasks -> node IDs
+        self.checkpoint_store: Optional[Any] = None  # records completed nodes, see enable_checkpoints
+        self.checkpoint_id: Optional[str] = None
+        self._restored_nodes: Dict[str, Dict[str, Any]] = {}
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
 
     def add_node(
@@ -141,6 +248,8 @@ class GraphOrchestrator(BaseOrchestrator):
         self.nodes[node_id] = node
         self.execution_graph[node_id] = []
         self.reverse_graph[node_id] = []
+        self._unmet[node_id] = 0
+        self._mark_ready(node_id)
         
         self.logger.info(f"Added node: {node_id} -> {agent_id}")
         return node
@@ -154,7 +263,8 @@ class GraphOrchestrator(BaseOrchestrator):
         condition: Optional[Callable[[Dict[str, Any]], bool]] = None,
         condition_data: Optional[Dict[str, Any]] = None,
         weight: float = 1.0,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        gating: bool = False
     ) -> WorkflowEdge:
         """Add an edge to the workflow graph.
         
@@ -167,6 +277,8 @@ class GraphOrchestrator(BaseOrchestrator):
             condition_data: Data for condition evaluation
             weight: Edge weight for priority
             metadata: Additional edge metadata
+            gating: Conditional edge whose source output is not passed to the
+                target, so the target may be started speculatively
             
         Returns:
             WorkflowEdge: Created edge
@@ -180,6 +292,12 @@ class GraphOrchestrator(BaseOrchestrator):
         if target_node not in self.nodes:
             raise ValueError(f"Target node {target_node} does not exist")
         
+        if (source_node, target_node) in self._edge_index:
+            raise ValueError(f"Edge from {source_node} to {target_node} already exists")
+        
+        if gating and edge_type != EdgeType.CONDITIONAL:
+            raise ValueError(f"Edge {edge_id} is gating but not conditional")
+        
         edge = WorkflowEdge(
             edge_id=edge_id,
             source_node=source_node,
@@ -188,13 +306,19 @@ class GraphOrchestrator(BaseOrchestrator):
             condition=condition,
             condition_data=condition_data or {},
             weight=weight,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            gating=gating
         )
         
         self.edges[edge_id] = edge
+        self._edge_index[(source_node, target_node)] = edge
         self.execution_graph[source_node].append(target_node)
         self.reverse_graph[target_node].append(source_node)
         
+        if self.nodes[target_node].status == NodeStatus.PENDING and not self._edge_satisfied(edge):
+            self._unmet[target_node] += 1
+            self._ready.pop(target_node, None)
+        
         self.logger.info(f"Added edge: {source_node} -> {target_node} ({edge_type.value})")
         return edge
 
@@ -232,72 +356,209 @@ class GraphOrchestrator(BaseOrchestrator):
         )
         
         self.parallel_executions[branch_id] = parallel_exec
+        for node_id in nodes:
+            self._node_branches.setdefault(node_id, []).append(branch_id)
         
         self.logger.info(f"Added parallel branch: {branch_id} with {len(nodes)} nodes")
         return parallel_exec
 
+    def set_join(
+        self,
+        node_id: str,
+        policy: Union[JoinPolicy, str] = JoinPolicy.ALL,
+        quorum: Optional[int] = None,
+        reducer: Optional[Union[str, Callable[[Any, str, Dict[str, Any]], Any]]] = None,
+        cancel_stragglers: bool = True
+    ) -> JoinState:
+        """Make a node join its synchronize edges and synchronized branches.
+        
+        The node starts once ``policy`` is met (and its other incoming edges
+        are satisfied) and receives the inputs that had arrived by then, in
+        arrival order, or their reduction.
+        
+        Args:
+            node_id: Join node
+            policy: ``all``, ``quorum`` (any ``quorum`` inputs) or ``first``
+            quorum: Inputs to wait for with the quorum policy
+            reducer: Name in ``JOIN_REDUCERS`` or a function
+                ``(accumulator, node_id, output) -> accumulator`` folding
+                each input as it completes
+            cancel_stragglers: Once the join fires, cancel inputs that are
+                still pending or running and feed nothing else
+        """
+        if node_id not in self.nodes:
+            raise ValueError(f"Node {node_id} does not exist")
+        
+        policy = JoinPolicy(policy)
+        if policy == JoinPolicy.QUORUM and (quorum is None or quorum < 1):
+            raise ValueError(f"Quorum join on {node_id} needs a quorum of at least 1")
+        if isinstance(reducer, str):
+            if reducer not in JOIN_REDUCERS:
+                raise ValueError(f"Unknown join reducer: {reducer}")
+            reducer = JOIN_REDUCERS[reducer]
+        
+        join = JoinState(
+            node_id=node_id,
+            policy=policy,
+            quorum=quorum,
+            reducer=reducer,
+            cancel_stragglers=cancel_stragglers
+        )
+        self.joins[node_id] = join
+        self.logger.info(f"Join on {node_id}: {policy.value}" + (f" {quorum}" if quorum else ""))
+        return join
+
     def get_ready_nodes(self) -> List[str]:
         """Get nodes that are ready to execute.
         
+        The ready set is maintained incrementally: every node counts its
+        unsatisfied incoming edges, and starting or completing a node only
+        visits its outgoing edges (see ``_release_dependents``).
+        
         Returns:
             List[str]: List of node IDs ready for execution
         """
-        ready_nodes = []
-        
-        for node_id, node in self.nodes.items():
-            if node.status != NodeStatus.PENDING:
-                continue
-            
-            # Check if all dependencies are satisfied
-            dependencies = self.reverse_graph.get(node_id, [])
-            if not dependencies:
-                # No dependencies, ready to start
-                ready_nodes.append(node_id)
-                continue
-            
-            # Check conditional and parallel dependencies
-            can_execute = True
-            for dep_node_id in dependencies:
-                dep_node = self.nodes[dep_node_id]
-                
-                # Find the edge between dependency and this node
-                edge = self._find_edge(dep_node_id, node_id)
-                if not edge:
-                    continue
-                
-                if edge.edge_type == EdgeType.SEQUENTIAL:
-                    # Sequential dependency must be completed
-                    if dep_node.status != NodeStatus.COMPLETED:
-                        can_execute = False
-                        break
-                
-                elif edge.edge_type == EdgeType.CONDITIONAL:
-                    # Conditional dependency must be completed and condition satisfied
-                    if dep_node.status != NodeStatus.COMPLETED:
-                        can_execute = False
-                        break
-                    
-                    if edge.condition and not self._evaluate_condition(edge, dep_node.output_data):
-                        can_execute = False
-                        break
-                
-                elif edge.edge_type == EdgeType.PARALLEL:
-                    # For parallel edges, dependency should be completed or running
-                    if dep_node.status not in [NodeStatus.COMPLETED, NodeStatus.RUNNING]:
-                        can_execute = False
-                        break
-            
-            if can_execute:
-                ready_nodes.append(node_id)
-        
-        return ready_nodes
+        return list(self._ready)
 
     def _find_edge(self, source_node: str, target_node: str) -> Optional[WorkflowEdge]:
         """Find edge between two nodes."""
-        for edge in self.edges.values():
-            if edge.source_node == source_node and edge.target_node == target_node:
-                return edge
-        return None
+        return self._edge_index.get((source_node, target_node))
+
+    def _edge_satisfied(self, edge: WorkflowEdge) -> bool:
+        """Check whether an edge no longer holds back its target."""
+        source = self.nodes[edge.source_node]
+        if edge.edge_type == EdgeType.PARALLEL:
+            # For parallel edges, the source only has to be running
+            return source.status in (NodeStatus.RUNNING, NodeStatus.COMPLETED)
+        if source.status != NodeStatus.COMPLETED:
+            return False
+        if edge.edge_type == EdgeType.CONDITIONAL:
+            return self._evaluate_condition(edge, source.output_data)
+        return True
+
+    def _reset_schedule(self) -> None:
+        """Rebuild dependency counters and the ready set from the graph."""
+        self._ready.clear()
+        self._ready_heap.clear()
+        self._agents_in_flight.clear()
+        if self.scheduling_policy == SchedulingPolicy.CRITICAL_PATH:
+            self._priorities = self._compute_priorities()
+        now = time.perf_counter()
+        for parallel_exec in self.parallel_executions.values():
+            parallel_exec.completed_nodes.clear()
+            parallel_exec.failed_nodes.clear()
+        self._reset_joins()
+        for node_id, node in self.nodes.items():
+            # Edges out of nodes restored as completed are already satisfied;
+            # a join counts as one edge until it fires, whatever the type of
+            # the edges from its inputs
+            join = self.joins.get(node_id)
+            self._unmet[node_id] = sum(
+                1 for source_id in self.reverse_graph[node_id]
+                if not (join and source_id in join.inputs)
+                and not self._edge_satisfied(self._edge_index[(source_id, node_id)])
+            ) + (1 if join and join.required() else 0)
+            if not self._unmet[node_id] and node.status == NodeStatus.PENDING:
+                self._mark_ready(node_id, now)
+        for node_id in sorted(self.completed_nodes, key=lambda n: self.nodes[n].completed_at or datetime.min):
+            self._update_parallel_branches(node_id)
+
+    def _reset_joins(self) -> None:
+        """Collect the inputs of every join node and clear their progress."""
+        self._node_joins.clear()
+        for node_id, join in self.joins.items():
+            join.inputs = {
+                source_id for source_id in self.reverse_graph[node_id]
+                if self._edge_index[(source_id, node_id)].edge_type == EdgeType.SYNCHRONIZE
+            }
+            for parallel_exec in self.parallel_executions.values():
+                if parallel_exec.synchronization_node == node_id:
+                    join.inputs.update(parallel_exec.nodes)
+            join.arrived = []
+            join.accumulator = None
+            join.fired = False
+            join.skipped = []
+            for input_id in join.inputs:
+                self._node_joins.setdefault(input_id, []).append(node_id)
+
+    def _stranded_nodes(self) -> List[str]:
+        """Find pending nodes left behind by a stalled run.
+        
+        Nodes behind a condition that did not hold, or behind skipped or
+        unreachable nodes, stay pending by design. Any other node still
+        pending once nothing is running waits on an edge that never clears.
+        """
+        closed: Dict[str, bool] = {}
+        
+        def edge_closed(edge: WorkflowEdge) -> bool:
+            source = self.nodes[edge.source_node]
+            if node_closed(edge.source_node):
+                return True
+            return (
+                source.status == NodeStatus.COMPLETED
+                and edge.edge_type == EdgeType.CONDITIONAL
+                and not self._evaluate_condition(edge, source.output_data)
+            )
+        
+        def node_closed(node_id: str) -> bool:
+            if node_id in closed:
+                return closed[node_id]
+            # Provisionally open, so feedback loops terminate
+            closed[node_id] = False
+            node = self.nodes[node_id]
+            if node.status in (NodeStatus.SKIPPED, NodeStatus.FAILED):
+                closed[node_id] = True
+            elif node.status == NodeStatus.PENDING:
+                edges = [self._edge_index[(source_id, node_id)] for source_id in self.reverse_graph[node_id]]
+                join = self.joins.get(node_id)
+                if join:
+                    # A join that has not fired is unreachable once every missing input is
+                    waiting = join.inputs - set(join.arrived)
+                    if not join.fired and waiting and all(node_closed(input_id) for input_id in waiting):
+                        closed[node_id] = True
+                    edges = [edge for edge in edges if edge.source_node not in join.inputs]
+                closed[node_id] = closed[node_id] or any(edge_closed(edge) for edge in edges)
+            return closed[node_id]
+        
+        return sorted(
+            node_id for node_id, node in self.nodes.items()
+            if node.status == NodeStatus.PENDING and not node_closed(node_id)
+        )
+
+    def _mark_ready(self, node_id: str, now: Optional[float] = None) -> None:
+        """Add a node to the ready set."""
+        self._ready[node_id] = time.perf_counter() if now is None else now
+        if self.scheduling_policy == SchedulingPolicy.CRITICAL_PATH:
+            heapq.heappush(self._ready_heap, (
+                -self._priorities.get(node_id, self.estimate_duration(node_id)),
+                next(self._ready_sequence),
+                node_id
+            ))
+
+    def _release_dependents(self, node_id: str, started: bool = False) -> None:
+        """Update the targets of a node that has just started or completed.
+        
+        Parallel edges are satisfied when their source starts, all other
+        edges when it completes (conditional ones only if the condition
+        holds). Targets whose last edge is satisfied become ready.
+        """
+        for target_id in self.execution_graph[node_id]:
+            edge = self._edge_index[(node_id, target_id)]
+            if (edge.edge_type == EdgeType.PARALLEL) != started:
+                continue
+            if target_id in self.joins and node_id in self.joins[target_id].inputs:
+                # Counted by the join as the input arrives
+                continue
+            if self.nodes[target_id].status != NodeStatus.PENDING or target_id in self._speculative:
+                continue
+            satisfied = self._edge_satisfied(edge)
+            if edge.edge_type == EdgeType.CONDITIONAL:
+                self._record_condition(edge, satisfied)
+            if not satisfied:
+                continue
+            self._unmet[target_id] -= 1
+            if self._unmet[target_id] == 0:
+                self._mark_ready(target_id)
 
     def _evaluate_condition(self, edge: WorkflowEdge, output_data: Optional[Dict[str, Any]]) -> bool:
         """Evaluate edge condition."""
@@ -321,6 +582,10 @@ class GraphOrchestrator(BaseOrchestrator):
     async def execute(self, task: str, **kwargs) -> TaskResult:
         """Execute the graph workflow.
         
+        Ready nodes are started as tasks and the scheduler sleeps until one
+        of them finishes, so a node starts as soon as its last dependency
+        completes and the makespan follows the critical path.
+        
         Args:
             task: Task description
             **kwargs: Additional execution parameters
@@ -332,6 +597,7 @@ class GraphOrchestrator(BaseOrchestrator):
         
         start_time = datetime.now()
         messages: List[BaseChatMessage] = []
+        self.context.status = WorkflowStatus.RUNNING
         
         try:
             # Initialize execution context
@@ -344,83 +610,501 @@ class GraphOrchestrator(BaseOrchestrator):
             # Add initial system message
             messages.append(SystemMessage(
                 content=f"Starting graph workflow: {self.config.name}",
-                sender="system",
+                sender_id="system",
                 metadata={"task": task}
             ))
             
-            # Reset node statuses
+            self.current_nodes.clear()
+            self.completed_nodes.clear()
+            self.failed_nodes.clear()
+            self.cached_nodes.clear()
+            
+            # Reset node statuses, keeping nodes restored from a checkpoint
+            restored, self._restored_nodes = self._restored_nodes, {}
             for node in self.nodes.values():
                 node.status = NodeStatus.PENDING
                 node.retry_count = 0
                 node.started_at = None
                 node.completed_at = None
                 node.error = None
+                if node.node_id in restored:
+                    state = restored[node.node_id]
+                    node.status = NodeStatus.COMPLETED
+                    node.output_data = state.get("output_data")
+                    node.started_at = state.get("started_at")
+                    node.completed_at = state.get("completed_at")
+                    node.retry_count = state.get("retry_count", 0)
+                    self.completed_nodes.add(node.node_id)
             
-            self.current_nodes.clear()
-            self.completed_nodes.clear()
-            self.failed_nodes.clear()
+            if self.completed_nodes:
+                messages.append(SystemMessage(
+                    content=f"Resuming with {len(self.completed_nodes)} nodes restored from checkpoint",
+                    sender_id="system",
+                    metadata={"restored_nodes": list(self.completed_nodes)}
+                ))
+            
+            self._node_tasks.clear()
+            self._task_nodes.clear()
+            self._speculative.clear()
+            self._speculation_clock.clear()
+            self._discarded_tasks.clear()
+            self._reset_schedule()
+            self._reset_queue_stats()
+            self._reset_speculation_stats()
             
             # Execute workflow
             while True:
-                ready_nodes = self.get_ready_nodes()
+                await self._start_ready_nodes(task, messages)
                 
-                if not ready_nodes and not self.current_nodes:
+                if not self._node_tasks:
                     # No more nodes to execute
                     break
                 
-                # Start ready nodes
-                for node_id in ready_nodes:
-                    if node_id not in self.current_nodes:
-                        await self._start_node_execution(node_id, task, messages)
-                
                 # Wait for at least one node to complete
-                if self.current_nodes:
-                    await asyncio.sleep(0.1)  # Small delay to prevent busy waiting
-                    await self._check_running_nodes(messages)
+                done, _ = await asyncio.wait(
+                    self._node_tasks.values(), return_when=asyncio.FIRST_COMPLETED
+                )
+                await self._check_running_nodes(done, messages)
+            
+            if self._discarded_tasks:
+                await asyncio.gather(*self._discarded_tasks, return_exceptions=True)
+                self._discarded_tasks.clear()
+            
+            execution_time = (datetime.now() - start_time).total_seconds()
             
             # Check final status
             if self.failed_nodes:
                 error_msg = f"Workflow failed. Failed nodes: {', '.join(self.failed_nodes)}"
                 self.logger.error(error_msg)
+                if self.context.status != WorkflowStatus.CANCELLED:
+                    self.context.status = WorkflowStatus.FAILED
                 
                 return TaskResult(
+                    task_id=f"{self.workflow_id}-final",
+                    agent_id="graph_orchestrator",
                     success=False,
-                    messages=messages,
+                    result=self._build_result(messages),
                     error=error_msg,
-                    metadata={
-                        "completed_nodes": list(self.completed_nodes),
-                        "failed_nodes": list(self.failed_nodes),
-                        "execution_time": (datetime.now() - start_time).total_seconds()
-                    }
+                    execution_time=execution_time
+                )
+            
+            stranded = self._stranded_nodes()
+            if stranded:
+                error_msg = f"Workflow stalled. Nodes that never ran: {', '.join(stranded)}"
+                self.logger.error(error_msg)
+                self.context.status = WorkflowStatus.FAILED
+                
+                return TaskResult(
+                    task_id=f"{self.workflow_id}-final",
+                    agent_id="graph_orchestrator",
+                    success=False,
+                    result=self._build_result(messages),
+                    error=error_msg,
+                    execution_time=execution_time
                 )
             
             self.logger.info(f"Graph workflow completed successfully. Nodes: {len(self.completed_nodes)}")
+            self.context.status = WorkflowStatus.COMPLETED
             
             return TaskResult(
+                task_id=f"{self.workflow_id}-final",
+                agent_id="graph_orchestrator",
                 success=True,
-                messages=messages,
-                metadata={
-                    "completed_nodes": list(self.completed_nodes),
-                    "execution_time": (datetime.now() - start_time).total_seconds(),
-                    "final_context": self.execution_context
-                }
+                result=self._build_result(messages),
+                execution_time=execution_time
             )
         
+        except asyncio.CancelledError:
+            await self._cancel_node_tasks()
+            self.context.status = WorkflowStatus.CANCELLED
+            self.logger.info("Graph workflow cancelled")
+            raise
+        
         except Exception as e:
             error_msg = f"Graph workflow execution failed: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
+            await self._cancel_node_tasks()
+            self.context.status = WorkflowStatus.FAILED
             
             return TaskResult(
+                task_id=f"{self.workflow_id}-final",
+                agent_id="graph_orchestrator",
                 success=False,
-                messages=messages,
+                result=self._build_result(messages),
                 error=error_msg,
-                metadata={
-                    "completed_nodes": list(self.completed_nodes),
-                    "failed_nodes": list(self.failed_nodes),
-                    "execution_time": (datetime.now() - start_time).total_seconds()
-                }
+                execution_time=(datetime.now() - start_time).total_seconds()
             )
 
+    def _build_result(self, messages: List[BaseChatMessage]) -> Dict[str, Any]:
+        """Collect node outputs and the message log for the final result."""
+        return {
+            "outputs": {
+                node_id: self.nodes[node_id].output_data
+                for node_id in self.completed_nodes
+            },
+            "completed_nodes": list(self.completed_nodes),
+            "failed_nodes": list(self.failed_nodes),
+            "messages": [message.to_dict() for message in messages]
+        }
+
+    async def _start_ready_nodes(self, task: str, messages: List[BaseChatMessage]) -> None:
+        """Start every ready node.
+        
+        Nodes whose agent (or the whole workflow) is at its concurrency
+        limit stay in the ready set until a running node finishes. Starting
+        a node can make nodes behind a parallel edge ready, so this repeats
+        until a pass starts nothing.
+        """
+        if self.scheduling_policy == SchedulingPolicy.CRITICAL_PATH:
+            await self._start_by_priority(task, messages)
+            return
+        
+        started = True
+        while started:
+            started = False
+            for node_id in self.get_ready_nodes():
+                if self.max_concurrency and len(self._node_tasks) >= self.max_concurrency:
+                    return
+                if not self._has_agent_capacity(self.nodes[node_id].agent_id):
+                    continue
+                await self._start_node_execution(node_id, task, messages)
+                started = True
+
+    async def _start_by_priority(self, task: str, messages: List[BaseChatMessage]) -> None:
+        """Start ready nodes with the longest expected remaining path first."""
+        deferred = []
+        try:
+            while self._ready_heap:
+                if self.max_concurrency and len(self._node_tasks) >= self.max_concurrency:
+                    return
+                entry = heapq.heappop(self._ready_heap)
+                node_id = entry[2]
+                if node_id not in self._ready:
+                    # Already started, or held back again by a new edge
+                    continue
+                if not self._has_agent_capacity(self.nodes[node_id].agent_id):
+                    deferred.append(entry)
+                    continue
+                await self._start_node_execution(node_id, task, messages)
+        finally:
+            for entry in deferred:
+                heapq.heappush(self._ready_heap, entry)
+
+    def set_scheduling_policy(self, policy: Union[SchedulingPolicy, str]) -> None:
+        """Choose which ready nodes start first when capacity is limited.
+        
+        Args:
+            policy: ``fifo`` (default) or ``critical_path``, which favours
+                nodes with the longest expected path to the end of the graph
+        """
+        self.scheduling_policy = SchedulingPolicy(policy)
+        self.logger.info(f"Scheduling policy: {self.scheduling_policy.value}")
+
+    def estimate_duration(
+        self,
+        node_id: str,
+        agent_averages: Optional[Dict[str, float]] = None
+    ) -> float:
+        """Expected duration of a node from earlier runs.
+        
+        Falls back to the average of other nodes run by the same agent, and
+        to one second for agents that have not run yet.
+        """
+        if node_id in self.duration_history:
+            return self.duration_history[node_id]
+        if agent_averages is None:
+            agent_averages = self._agent_average_durations()
+        return agent_averages.get(self.nodes[node_id].agent_id, 1.0)
+
+    def _agent_average_durations(self) -> Dict[str, float]:
+        """Average smoothed duration of each agent's nodes."""
+        totals: Dict[str, List[float]] = {}
+        for node_id, duration in self.duration_history.items():
+            if node_id in self.nodes:
+                totals.setdefault(self.nodes[node_id].agent_id, []).append(duration)
+        return {agent_id: sum(durations) / len(durations) for agent_id, durations in totals.items()}
+
+    def record_duration(self, node_id: str, seconds: float) -> None:
+        """Fold an observed node duration into its history."""
+        previous = self.duration_history.get(node_id)
+        if previous is None:
+            self.duration_history[node_id] = seconds
+        else:
+            self.duration_history[node_id] = (
+                DURATION_SMOOTHING * seconds + (1 - DURATION_SMOOTHING) * previous
+            )
+
+    def _compute_priorities(self) -> Dict[str, float]:
+        """Expected length of the longest path from each node to the end of the graph.
+        
+        A node's priority is its own expected duration plus the largest
+        priority among its targets, scaled by the edge weight. Nodes are
+        ranked in depth-first post-order from the roots; edges back into the
+        current path (feedback loops) are ignored.
+        """
+        agent_averages = self._agent_average_durations()
+        priorities: Dict[str, float] = {}
+        on_path: Set[str] = set()
+        roots = [node_id for node_id in self.nodes if not self.reverse_graph[node_id]]
+        
+        for root in roots + list(self.nodes):
+            if root in priorities:
+                continue
+            on_path.add(root)
+            stack = [(root, iter(self.execution_graph[root]))]
+            while stack:
+                node_id, targets = stack[-1]
+                for target_id in targets:
+                    if target_id not in priorities and target_id not in on_path:
+                        on_path.add(target_id)
+                        stack.append((target_id, iter(self.execution_graph[target_id])))
+                        break
+                else:
+                    stack.pop()
+                    on_path.discard(node_id)
+                    priorities[node_id] = self.estimate_duration(node_id, agent_averages) + max(
+                        (
+                            self._edge_index[(node_id, target_id)].weight * priorities[target_id]
+                            for target_id in self.execution_graph[node_id]
+                            if target_id in priorities
+                        ),
+                        default=0.0
+                    )
+        
+        return priorities
+
+    def set_concurrency_limits(
+        self,
+        max_concurrency: Optional[int] = None,
+        agent_concurrency: Optional[Dict[str, int]] = None
+    ) -> None:
+        """Limit how many nodes run at once.
+        
+        Args:
+            max_concurrency: Maximum running nodes in the workflow, None for no limit
+            agent_concurrency: Maximum running nodes per agent ID
+        """
+        for limit in [max_concurrency, *(agent_concurrency or {}).values()]:
+            if limit is not None and limit < 1:
+                raise ValueError(f"Concurrency limits must be at least 1, got {limit}")
+        
+        self.max_concurrency = max_concurrency
+        self.agent_concurrency = dict(agent_concurrency or {})
+        self.logger.info(
+            f"Concurrency limits: max={max_concurrency}, per agent={self.agent_concurrency}"
+        )
+
+    def _has_agent_capacity(self, agent_id: str) -> bool:
+        """Check whether another node of an agent may start."""
+        limit = self.agent_concurrency.get(agent_id)
+        return not limit or self._agents_in_flight.get(agent_id, 0) < limit
+
+    def _record_queue_wait(self, node: WorkflowNode, ready_at: float) -> None:
+        """Account the time a node spent in the ready set waiting for capacity."""
+        wait = time.perf_counter() - ready_at
+        stats = self.queue_stats
+        stats["nodes_started"] += 1
+        stats["total_wait_seconds"] += wait
+        stats["max_wait_seconds"] = max(stats["max_wait_seconds"], wait)
+        stats["max_in_flight"] = max(stats["max_in_flight"], len(self._node_tasks) + 1)
+        
+        agent_stats = stats["agents"].setdefault(
+            node.agent_id, {"nodes_started": 0, "total_wait_seconds": 0.0}
+        )
+        agent_stats["nodes_started"] += 1
+        agent_stats["total_wait_seconds"] += wait
+
+    def _reset_queue_stats(self) -> None:
+        """Start queueing metrics for a new run."""
+        self.queue_stats = {
+            "nodes_started": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "max_in_flight": 0,
+            "agents": {}
+        }
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """Get time nodes spent waiting for concurrency capacity in the last run."""
+        started = self.queue_stats.get("nodes_started", 0)
+        return {
+            **self.queue_stats,
+            "max_concurrency": self.max_concurrency,
+            "agent_concurrency": self.agent_concurrency,
+            "in_flight": len(self._node_tasks),
+            "queued": len(self._ready),
+            "avg_wait_seconds": self.queue_stats["total_wait_seconds"] / started if started else 0.0
+        }
+
+    def set_speculation(self, enabled: bool = True, threshold: float = 0.5) -> None:
+        """Start likely conditional targets before their condition is known.
+        
+        When a node starts, each target of a gating edge (see ``add_edge``)
+        that waits on nothing else is started alongside it if the edge was
+        taken in more than ``threshold`` of earlier runs. Gating targets never
+        receive the deciding node's output, so a speculative run does the
+        same work as a normal one. Once the condition is evaluated the run is
+        kept, or cancelled and discarded.
+        
+        Args:
+            enabled: Whether to speculate
+            threshold: Branch probability an edge must exceed
+        """
+        if not 0 <= threshold < 1:
+            raise ValueError(f"Speculation threshold must be in [0, 1), got {threshold}")
+        
+        self.speculative = enabled
+        self.speculation_threshold = threshold
+        self.logger.info(f"Speculation: enabled={enabled}, threshold={threshold}")
+
+    def use_history(self, history: WorkflowHistory) -> None:
+        """Learn from and record into the history of earlier runs of the workflow.
+        
+        Args:
+            history: History shared by every run of the workflow, see
+                ``get_run_history``
+        """
+        self.duration_history = history.durations
+        self.condition_history = history.conditions
+
+    def branch_probability(self, edge_id: str) -> float:
+        """Estimated probability that a conditional edge is taken.
+        
+        Laplace-smoothed from earlier evaluations, so an edge that has never
+        been evaluated starts at one half.
+        """
+        taken, evaluated = self.condition_history.get(edge_id, [0, 0])
+        return (taken + 1) / (evaluated + 2)
+
+    def _record_condition(self, edge: WorkflowEdge, taken: bool) -> None:
+        """Count the outcome of a conditional edge."""
+        history = self.condition_history.setdefault(edge.edge_id, [0, 0])
+        history[0] += int(taken)
+        history[1] += 1
+
+    def _speculate(self, node_id: str) -> None:
+        """Make likely conditional targets of a starting node ready."""
+        sync_nodes = {
+            parallel_exec.synchronization_node
+            for parallel_exec in self.parallel_executions.values()
+        }
+        for target_id in self.execution_graph[node_id]:
+            edge = self._edge_index[(node_id, target_id)]
+            if (
+                not edge.gating  # the target must not need the output it would miss
+                or self.nodes[target_id].status != NodeStatus.PENDING
+                or target_id in self._ready
+                or target_id in sync_nodes
+                or target_id in self.joins
+                or self._unmet[target_id] != 1  # the condition is all it waits for
+                or self.branch_probability(edge.edge_id) <= self.speculation_threshold
+            ):
+                continue
+            
+            self.logger.info(f"Speculatively starting node {target_id} ahead of edge {edge.edge_id}")
+            self._speculative[target_id] = edge.edge_id
+            self.speculation_stats["speculated"] += 1
+            self._mark_ready(target_id)
+
+    async def _settle_speculation(self, node_id: str, messages: List[BaseChatMessage]) -> None:
+        """Keep or discard the speculative targets of a finished node."""
+        for target_id, edge_id in list(self._speculative.items()):
+            edge = self.edges[edge_id]
+            if edge.source_node != node_id:
+                continue
+            
+            del self._speculative[target_id]
+            taken = self._edge_satisfied(edge)
+            if self.nodes[node_id].status == NodeStatus.COMPLETED:
+                self._record_condition(edge, taken)
+            
+            if taken:
+                await self._confirm_speculation(target_id)
+            else:
+                self._discard_speculation(target_id, messages)
+
+    async def _confirm_speculation(self, node_id: str) -> None:
+        """Treat a speculative node as if it had started normally."""
+        node = self.nodes[node_id]
+        self._unmet[node_id] -= 1
+        self.speculation_stats["confirmed"] += 1
+        if node_id not in self._speculation_clock:
+            # Still waiting for capacity, now as an ordinary ready node
+            return
+        
+        self.speculation_stats["saved_seconds"] += self._speculative_runtime(node_id)
+        
+        # Replay what was held back while the node was speculative
+        self._release_dependents(node_id, started=True)
+        if node.status == NodeStatus.COMPLETED:
+            await self._save_checkpoint(node)
+            if node_id not in self._node_tasks:
+                # Its task was already reaped, so release its targets here
+                self._release_dependents(node_id)
+                self._update_parallel_branches(node_id)
+        elif self.speculative:
+            self._speculate(node_id)
+
+    def _discard_speculation(self, node_id: str, messages: List[BaseChatMessage]) -> None:
+        """Cancel a speculative node whose condition did not hold."""
+        node = self.nodes[node_id]
+        self._ready.pop(node_id, None)
+        self._cancel_node_task(node_id)
+        
+        if node.started_at:
+            messages.append(SystemMessage(
+                content=f"Discarded speculative run of node {node.name}",
+                sender_id="system",
+                metadata={"node_id": node_id}
+            ))
+        self._abandon_speculation(node_id)
+
+    def _abandon_speculation(self, node_id: str) -> None:
+        """Return a speculative node to pending and count its work as wasted."""
+        node = self.nodes[node_id]
+        self._speculative.pop(node_id, None)
+        self.speculation_stats["discarded"] += 1
+        if node_id in self._speculation_clock:
+            self.speculation_stats["wasted_seconds"] += self._speculative_runtime(node_id)
+        
+        node.status = NodeStatus.PENDING
+        node.output_data = None
+        node.error = None
+        node.started_at = None
+        node.completed_at = None
+        self.current_nodes.discard(node_id)
+        self.completed_nodes.discard(node_id)
+        self.cached_nodes.discard(node_id)
+
+    def _speculative_runtime(self, node_id: str) -> float:
+        """Time a speculative node has run for, on the event loop clock."""
+        started, finished = self._speculation_clock.pop(node_id)
+        if finished is None:
+            finished = asyncio.get_running_loop().time()
+        return finished - started
+
+    def _reset_speculation_stats(self) -> None:
+        """Start speculation metrics for a new run."""
+        self.speculation_stats = {
+            "speculated": 0,
+            "confirmed": 0,
+            "discarded": 0,
+            "wasted_seconds": 0.0,  # agent time spent on discarded runs
+            "saved_seconds": 0.0  # head start of confirmed runs
+        }
+
+    def get_speculation_stats(self) -> Dict[str, Any]:
+        """Get speculative execution counters of the last run."""
+        return {
+            **self.speculation_stats,
+            "enabled": self.speculative,
+            "threshold": self.speculation_threshold,
+            "in_flight": len(self._speculative),
+            "branch_probabilities": {
+                edge_id: self.branch_probability(edge_id) for edge_id in self.condition_history
+            }
+        }
+
     async def _start_node_execution(
         self,
         node_id: str,
@@ -432,28 +1116,57 @@ class GraphOrchestrator(BaseOrchestrator):
         node.status = NodeStatus.RUNNING
         node.started_at = datetime.now()
         
+        self._record_queue_wait(node, self._ready.pop(node_id, time.perf_counter()))
+        self._agents_in_flight[node.agent_id] = self._agents_in_flight.get(node.agent_id, 0) + 1
         self.current_nodes.add(node_id)
+        if node_id not in self._speculative:
+            # A speculative node holds back its targets until it is confirmed
+            self._release_dependents(node_id, started=True)
+            if self.speculative:
+                self._speculate(node_id)
+        else:
+            self._speculation_clock[node_id] = [asyncio.get_running_loop().time(), None]
         
         self.logger.info(f"Starting node execution: {node_id} ({node.agent_id})")
         
         # Create node-specific task based on dependencies
         node_task = self._prepare_node_task(node_id, task)
         
-        # Start async execution (simulation for now)
-        asyncio.create_task(self._execute_node(node_id, node_task, messages))
+        execution = asyncio.create_task(
+            self._execute_node(node_id, node_task, messages),
+            name=f"graph-node-{node_id}"
+        )
+        self._node_tasks[node_id] = execution
+        self._task_nodes[execution] = node_id
+
+    def _input_nodes(self, node_id: str) -> List[str]:
+        """Upstream nodes whose output is passed to a node; gating edges pass none."""
+        return [
+            dep_node_id for dep_node_id in self.reverse_graph.get(node_id, [])
+            if not self._edge_index[(dep_node_id, node_id)].gating
+        ]
 
     def _prepare_node_task(self, node_id: str, original_task: str) -> str:
         """Prepare task for specific node based on dependencies and context."""
         node = self.nodes[node_id]
+        join = self.joins.get(node_id)
         
         # Collect input from dependency nodes
         dependency_outputs = []
-        dependencies = self.reverse_graph.get(node_id, [])
+        dependencies = [
+            dep_node_id for dep_node_id in self._input_nodes(node_id)
+            if not (join and dep_node_id in join.inputs)
+        ]
+        if join and join.fired and not join.reducer:
+            # Join inputs in arrival order, stragglers excluded
+            dependencies += join.arrived
         
         for dep_node_id in dependencies:
             dep_node = self.nodes[dep_node_id]
             if dep_node.status == NodeStatus.COMPLETED and dep_node.output_data:
-                dependency_outputs.append(f"Output from {dep_node.name}: {dep_node.output_data}")
+                dependency_outputs.append(f"Output from {dep_node.name}: {dep_node.output_data.get('result')}")
+        if join and join.fired and join.reducer:
+            dependency_outputs.append(f"Joined output of {', '.join(join.arrived)}: {join.accumulator}")
         
         # Prepare contextualized task
         if dependency_outputs:
@@ -469,34 +1182,46 @@ class GraphOrchestrator(BaseOrchestrator):
         task: str,
         messages: List[BaseChatMessage]
     ) -> None:
-        """Execute a single node (simulated for now)."""
+        """Execute a single node."""
         node = self.nodes[node_id]
         
         try:
-            # Simulate agent execution
-            await asyncio.sleep(1)  # Simulate processing time
-            
-            # Simulate different outcomes based on node name
-            if "fail" in node.name.lower():
-                raise Exception(f"Simulated failure in node {node_id}")
-            
-            # Simulate successful execution
-            output_data = {
-                "result": f"Completed task: {task}",
-                "node_id": node_id,
-                "agent_id": node.agent_id,
-                "timestamp": datetime.now().isoformat()
-            }
+            cache_key = None
+            output_data = MISSING
+            if self.result_cache:
+                cache_key = await self._result_cache_key(node.agent_id, task, {
+                    dep_node_id: (self.nodes[dep_node_id].output_data or {}).get("result")
+                    for dep_node_id in self._input_nodes(node_id)
+                    if self.nodes[dep_node_id].status == NodeStatus.COMPLETED
+                })
+                output_data = self._cached_result(cache_key)
+            if output_data is MISSING:
+                output_data = await self._run_agent(node, task)
+                if cache_key:
+                    # Only the agent's result; the envelope belongs to this node and run
+                    self.result_cache.put(cache_key, output_data["result"])
+            else:
+                output_data = self._node_output(node, output_data)
+                self.cached_nodes.add(node_id)
+                self.logger.info(f"Reusing cached result for node {node_id}")
             
             node.output_data = output_data
             node.status = NodeStatus.COMPLETED
             node.completed_at = datetime.now()
+            if node_id in self._speculation_clock:
+                self._speculation_clock[node_id][1] = asyncio.get_running_loop().time()
+            if node_id not in self._speculative:
+                await self._save_checkpoint(node)
             
             # Add to messages
             messages.append(TextMessage(
                 content=f"Node {node.name} completed: {output_data['result']}",
-                sender=node.agent_id,
-                metadata={"node_id": node_id, "output_data": output_data}
+                sender_id=node.agent_id,
+                metadata={
+                    "node_id": node_id,
+                    "output_data": output_data,
+                    "cached": node_id in self.cached_nodes
+                }
             ))
             
             self.completed_nodes.add(node_id)
@@ -504,9 +1229,61 @@ class GraphOrchestrator(BaseOrchestrator):
             
             self.logger.info(f"Node completed: {node_id}")
         
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
+            if node_id in self._speculative:
+                # Not retried: the node runs normally if its branch is taken
+                self.logger.info(f"Speculative run of node {node_id} failed: {e}")
+                self._abandon_speculation(node_id)
+                return
             await self._handle_node_failure(node_id, str(e), messages)
 
+    def enable_checkpoints(self, checkpoint_store: Any, checkpoint_id: str) -> None:
+        """Record every completed node so an interrupted run can be resumed.
+        
+        Args:
+            checkpoint_store: Store with an async ``save_node(checkpoint_id, node)``
+            checkpoint_id: ID the run is stored under
+        """
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_id = checkpoint_id
+
+    def restore_completed_nodes(self, nodes: Dict[str, Dict[str, Any]]) -> None:
+        """Mark nodes as already completed for the next execute.
+        
+        Args:
+            nodes: Node ID -> stored ``output_data``, ``started_at``,
+                ``completed_at`` and ``retry_count`` of a checkpointed run
+        """
+        unknown = set(nodes) - set(self.nodes)
+        if unknown:
+            raise ValueError(f"Checkpoint references unknown nodes: {', '.join(sorted(unknown))}")
+        self._restored_nodes = dict(nodes)
+        self.logger.info(f"Restoring {len(nodes)} completed nodes from checkpoint")
+
+    async def _save_checkpoint(self, node: WorkflowNode) -> None:
+        """Record a completed node; a failed write only costs a rerun on resume."""
+        if not self.checkpoint_store:
+            return
+        try:
+            await self.checkpoint_store.save_node(self.checkpoint_id, node)
+        except Exception as e:
+            self.logger.warning(f"Failed to checkpoint node {node.node_id}: {e}")
+
+    async def _run_agent(self, node: WorkflowNode, task: str) -> Dict[str, Any]:
+        """Run the node's agent on its task through the agent executor."""
+        return self._node_output(node, await self._invoke_agent(node.agent_id, task))
+
+    def _node_output(self, node: WorkflowNode, result: Any) -> Dict[str, Any]:
+        """Wrap an agent result in the output data of a node."""
+        return {
+            "result": result,
+            "node_id": node.node_id,
+            "agent_id": node.agent_id,
+            "timestamp": datetime.now().isoformat()
+        }
+
     async def _handle_node_failure(
         self,
         node_id: str,
@@ -532,48 +1309,168 @@ class GraphOrchestrator(BaseOrchestrator):
             
             messages.append(TextMessage(
                 content=f"Node {node.name} failed after {node.max_retries} attempts: {error}",
-                sender="system",
+                sender_id="system",
                 metadata={"node_id": node_id, "error": error}
             ))
             
             self.failed_nodes.add(node_id)
             self.current_nodes.discard(node_id)
 
-    async def _check_running_nodes(self, messages: List[BaseChatMessage]) -> None:
-        """Check status of running nodes and update parallel executions."""
-        # Check parallel execution synchronization
-        for parallel_exec in self.parallel_executions.values():
-            if parallel_exec.synchronization_node:
+    async def _check_running_nodes(
+        self,
+        done: Set[asyncio.Task],
+        messages: List[BaseChatMessage]
+    ) -> None:
+        """Reap finished node tasks and update parallel executions."""
+        for node_task in done:
+            node_id = self._task_nodes.pop(node_task, None)
+            if node_id is None:
+                # A speculative run discarded earlier in this batch
+                continue
+            del self._node_tasks[node_id]
+            self._agents_in_flight[self.nodes[node_id].agent_id] -= 1
+            
+            # _execute_node records its own outcome; this only catches a task
+            # that died without doing so
+            if node_task.cancelled() or node_task.exception():
+                error = "Node task cancelled" if node_task.cancelled() else str(node_task.exception())
+                node = self.nodes[node_id]
+                node.status = NodeStatus.FAILED
+                node.error = error
+                node.completed_at = datetime.now()
+                self.failed_nodes.add(node_id)
+                self.current_nodes.discard(node_id)
+                self.logger.error(f"Node task {node_id} ended abnormally: {error}")
+            
+            node = self.nodes[node_id]
+            if node.status == NodeStatus.COMPLETED and node_id not in self.cached_nodes:
+                # A cached result says nothing about how long the agent takes
+                self.record_duration(node_id, (node.completed_at - node.started_at).total_seconds())
+            if node_id in self._speculative or node.status == NodeStatus.PENDING:
+                # Held back until its condition is known, or an abandoned speculation
+                continue
+            if node.status == NodeStatus.COMPLETED:
+                self._release_dependents(node_id)
+            await self._settle_speculation(node_id, messages)
+            self._update_parallel_branches(node_id)
+
+    def _update_parallel_branches(self, node_id: str) -> None:
+        """Update the parallel branches and joins of a finished node."""
+        for branch_id in self._node_branches.get(node_id, []):
+            parallel_exec = self.parallel_executions[branch_id]
+            if node_id in self.completed_nodes:
+                parallel_exec.completed_nodes.add(node_id)
+            else:
+                parallel_exec.failed_nodes.add(node_id)
+            
+            if parallel_exec.synchronization_node and parallel_exec.synchronization_node not in self.joins:
                 sync_node = self.nodes[parallel_exec.synchronization_node]
                 
                 # Check if all parallel nodes are completed
-                all_completed = all(
-                    node_id in self.completed_nodes or node_id in self.failed_nodes
-                    for node_id in parallel_exec.nodes
+                all_completed = (
+                    len(parallel_exec.completed_nodes) + len(parallel_exec.failed_nodes)
+                    == len(set(parallel_exec.nodes))
                 )
                 
                 if all_completed and sync_node.status == NodeStatus.PENDING:
                     # Mark synchronization node as ready
                     sync_node.status = NodeStatus.READY
+                    self._mark_ready(sync_node.node_id)
+        
+        if node_id in self.completed_nodes:
+            for join_id in self._node_joins.get(node_id, []):
+                self._join_arrival(self.joins[join_id], node_id)
+
+    def _join_arrival(self, join: JoinState, node_id: str) -> None:
+        """Fold a completed input into its join and fire the join once enough have arrived."""
+        if join.fired or node_id in join.arrived:
+            return
+        
+        join.arrived.append(node_id)
+        if join.reducer:
+            join.accumulator = join.reducer(join.accumulator, node_id, self.nodes[node_id].output_data or {})
+        if len(join.arrived) < join.required():
+            return
+        
+        join.fired = True
+        join_node = self.nodes[join.node_id]
+        join_node.input_data = {
+            "join": join.policy.value,
+            "inputs": list(join.arrived),
+            "output": join.accumulator if join.reducer else {
+                input_id: self.nodes[input_id].output_data for input_id in join.arrived
+            }
+        }
+        self.logger.info(
+            f"Join {join.node_id} fired with {len(join.arrived)}/{len(join.inputs)} inputs"
+        )
+        
+        self._unmet[join.node_id] -= 1
+        if self._unmet[join.node_id] == 0 and join_node.status == NodeStatus.PENDING:
+            self._mark_ready(join.node_id)
+        if join.cancel_stragglers and join.policy != JoinPolicy.ALL:
+            self._skip_stragglers(join)
+
+    def _skip_stragglers(self, join: JoinState) -> None:
+        """Cancel the inputs of a fired join that feed nothing else."""
+        for input_id in sorted(join.inputs - set(join.arrived)):
+            node = self.nodes[input_id]
+            if node.status not in (NodeStatus.PENDING, NodeStatus.READY, NodeStatus.RUNNING):
+                continue
+            other_targets = set(self.execution_graph[input_id]) - {join.node_id}
+            other_joins = {
+                self.parallel_executions[branch_id].synchronization_node
+                for branch_id in self._node_branches.get(input_id, [])
+            } - {join.node_id}
+            if other_targets or other_joins or input_id in self._speculative:
+                continue
+            
+            self._ready.pop(input_id, None)
+            self._cancel_node_task(input_id)
+            node.status = NodeStatus.SKIPPED
+            node.completed_at = datetime.now()
+            self.current_nodes.discard(input_id)
+            join.skipped.append(input_id)
+            self.logger.info(f"Skipping straggler {input_id} of join {join.node_id}")
+
+    def _cancel_node_task(self, node_id: str) -> None:
+        """Cancel a node's running task without reaping it as a failure."""
+        node_task = self._node_tasks.pop(node_id, None)
+        if node_task:
+            del self._task_nodes[node_task]
+            self._agents_in_flight[self.nodes[node_id].agent_id] -= 1
+            node_task.cancel()
+            self._discarded_tasks.add(node_task)
+
+    async def _cancel_node_tasks(self) -> None:
+        """Cancel running node tasks and wait for them to unwind."""
+        node_tasks = list(self._node_tasks.values()) + list(self._discarded_tasks)
+        self._discarded_tasks.clear()
+        for node_task in node_tasks:
+            node_task.cancel()
+        if node_tasks:
+            await asyncio.gather(*node_tasks, return_exceptions=True)
 
     async def pause(self) -> bool:
         """Pause workflow execution."""
-        self.status = WorkflowStatus.PAUSED
+        self.context.status = WorkflowStatus.PAUSED
         # In a real implementation, this would pause all running nodes
         self.logger.info("Graph workflow paused")
         return True
 
     async def resume(self) -> bool:
         """Resume workflow execution."""
-        self.status = WorkflowStatus.RUNNING
+        self.context.status = WorkflowStatus.RUNNING
         # In a real implementation, this would resume all paused nodes
         self.logger.info("Graph workflow resumed")
         return True
 
     async def cancel(self) -> bool:
         """Cancel workflow execution."""
-        self.status = WorkflowStatus.CANCELLED
+        self.context.status = WorkflowStatus.CANCELLED
         # Cancel all running nodes
+        for node_task in self._node_tasks.values():
+            node_task.cancel()
         for node_id in list(self.current_nodes):
             node = self.nodes[node_id]
             node.status = NodeStatus.FAILED
@@ -609,6 +1506,7 @@ class GraphOrchestrator(BaseOrchestrator):
                     "target_node": edge.target_node,
                     "edge_type": edge.edge_type.value,
                     "weight": edge.weight,
+                    "gating": edge.gating,
                     "metadata": edge.metadata
                 }
                 for edge_id, edge in self.edges.items()
@@ -622,12 +1520,27 @@ class GraphOrchestrator(BaseOrchestrator):
                 }
                 for branch_id, parallel_exec in self.parallel_executions.items()
             },
+            "joins": {
+                node_id: {
+                    "policy": join.policy.value,
+                    "required": join.required(),
+                    "inputs": sorted(join.inputs),
+                    "arrived": list(join.arrived),
+                    "fired": join.fired,
+                    "skipped": list(join.skipped),
+                    "partial": join.accumulator
+                }
+                for node_id, join in self.joins.items()
+            },
             "execution_state": {
                 "current_nodes": list(self.current_nodes),
                 "completed_nodes": list(self.completed_nodes),
                 "failed_nodes": list(self.failed_nodes),
-                "status": self.status.value
-            }
+                "cached_nodes": list(self.cached_nodes),
+                "status": self.context.status.value
+            },
+            "queueing": self.get_queue_stats(),
+            "speculation": self.get_speculation_stats()
         }
 
     def get_graph_structure(self) -> Dict[str, Any]:
@@ -657,6 +1570,7 @@ class GraphOrchestrator(BaseOrchestrator):
                 "target": edge.target_node,
                 "type": edge.edge_type.value,
                 "weight": edge.weight,
+                "gating": edge.gating,
                 "metadata": edge.metadata,
                 "condition": str(edge.condition.__name__) if edge.condition else None
             }
@@ -682,7 +1596,7 @@ class GraphOrchestrator(BaseOrchestrator):
         """Get current execution state for monitoring."""
         return {
             "workflow_id": self.config.name,
-            "status": self.status.value,
+            "status": self.context.status.value,
             "current_nodes": [
                 {
                     "node_id": node_id,
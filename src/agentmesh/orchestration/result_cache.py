@@ -0,0 +1,106 @@
+"""Content-addressed cache of agent results shared by workflow runs."""
+
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for "not cached", distinct from a cached None result
+MISSING = object()
+
+
+class ResultCache:
+    """Bounded LRU cache of agent results with a TTL.
+
+    Results are keyed by a hash of everything that determines them: the
+    agent's configuration, the task it was given and the outputs it builds
+    on. Identical sub-tasks in later runs (or later in the same run) reuse
+    the stored result instead of calling the agent again. Only successful
+    results are stored, and copies are handed out so callers cannot change
+    a cached value.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 3600.0):
+        """Initialize the cache."""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(agent_config: Any, task: str, upstream_outputs: Any = None) -> str:
+        """Hash an agent call into a cache key.
+
+        Args:
+            agent_config: The agent's configuration (or its ID if unknown)
+            task: The task as given to the agent
+            upstream_outputs: Outputs of the steps the task depends on
+        """
+        payload = json.dumps(
+            {"agent": agent_config, "task": task, "upstream": upstream_outputs},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Get a cached result or ``MISSING``."""
+        cached = self._results.get(key)
+        if cached is not None and cached[0] <= time.monotonic():
+            del self._results[key]
+            cached = None
+        if cached is None:
+            self.misses += 1
+            return MISSING
+        self._results.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(cached[1])
+
+    def put(self, key: str, result: Any) -> None:
+        """Cache a result, evicting the least recently used ones if full."""
+        self._results[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(result))
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._results.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit ratio and size statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._results),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+# Global result cache instance
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Get or create the global result cache instance."""
+    global _result_cache
+    if _result_cache is None:
+        settings = get_settings()
+        _result_cache = ResultCache(
+            max_entries=settings.result_cache_size,
+            ttl_seconds=settings.result_cache_ttl_seconds
+        )
+    return _result_cache
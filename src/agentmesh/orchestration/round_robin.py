@@ -298,24 +298,8 @@ class RoundRobinOrchestrator(BaseOrchestrator):
         message: BaseChatMessage,
         context: Dict[str, Any]
     ) -> str:
-        """Simulate agent execution for testing/demo purposes."""
-        # Simulate processing time
-        await asyncio.sleep(0.1)
-        
-        round_num = context.get("round", 1)
-        message_num = context.get("message_number", 1)
-        
-        # Simulate different agent behaviors in round-robin
-        if "analyst" in agent_id.lower():
-            return f"Analysis from {agent_id} (Round {round_num}): Based on the discussion, I see several key patterns..."
-        elif "designer" in agent_id.lower():
-            return f"Design perspective from {agent_id} (Round {round_num}): From a UX standpoint, we should consider..."
-        elif "developer" in agent_id.lower():
-            return f"Technical input from {agent_id} (Round {round_num}): The implementation approach could be..."
-        elif "manager" in agent_id.lower():
-            return f"Project view from {agent_id} (Round {round_num}): Let's align on priorities and next steps..."
-        else:
-            return f"Contribution from {agent_id} (Round {round_num}): {message.content[:50]}..."
+        """Run the agent on the message through the agent executor."""
+        return await self._invoke_agent(agent_id, message.content)
 
     async def _create_final_result(self, conversation_history: List[str]) -> TaskResult:
         """Create the final aggregated result from the conversation."""
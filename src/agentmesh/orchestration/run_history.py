@@ -0,0 +1,44 @@
+"""Statistics that graph workflows learn from their earlier runs."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class WorkflowHistory:
+    """What earlier runs of one workflow observed."""
+    durations: Dict[str, float] = field(default_factory=dict)  # node_id -> smoothed duration in seconds
+    conditions: Dict[str, List[int]] = field(default_factory=dict)  # edge_id -> [times taken, times evaluated]
+
+
+class RunHistory:
+    """Per-process registry of workflow histories, keyed by workflow name.
+
+    Every run gets a fresh orchestrator, so anything an orchestrator learns
+    about its workflow is lost with it. Orchestrators handed the history of
+    their workflow update it in place, and the next run starts from there.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._workflows: Dict[str, WorkflowHistory] = {}
+
+    def for_workflow(self, name: str) -> WorkflowHistory:
+        """Get the history of a workflow, creating an empty one if needed."""
+        return self._workflows.setdefault(name, WorkflowHistory())
+
+    def clear(self) -> None:
+        """Forget every workflow."""
+        self._workflows.clear()
+
+
+# Global run history instance
+_run_history: Optional[RunHistory] = None
+
+
+def get_run_history() -> RunHistory:
+    """Get or create the global run history instance."""
+    global _run_history
+    if _run_history is None:
+        _run_history = RunHistory()
+    return _run_history
@@ -16,6 +16,7 @@ from .base import (
     WorkflowTimeoutError,
     AgentExecutionError
 )
+from .result_cache import MISSING
 
 logger = logging.getLogger(__name__)
 
@@ -139,19 +140,30 @@ class SequentialOrchestrator(BaseOrchestrator):
                 if not agent_info:
                     raise AgentExecutionError(f"Agent {agent_id} not found")
                 
-                # Create message for agent
-                task_message = TextMessage(
-                    content=message,
-                    sender="workflow_orchestrator",
-                    metadata={
-                        "workflow_id": self.workflow_id,
-                        "context": context
-                    }
-                )
+                # Reuse the result of an identical earlier call
+                cache_key = None
+                result = MISSING
+                if self.result_cache:
+                    cache_key = await self._result_cache_key(agent_id, message, context)
+                    result = self._cached_result(cache_key)
                 
-                # Execute agent (this would integrate with actual agent execution)
-                # For now, we'll simulate execution
-                result = await self._simulate_agent_execution(agent_id, task_message, context)
+                if result is MISSING:
+                    # Create message for agent
+                    task_message = TextMessage(
+                        content=message,
+                        sender_id="workflow_orchestrator",
+                        metadata={
+                            "workflow_id": self.workflow_id,
+                            "context": context
+                        }
+                    )
+                    
+                    # Execute agent
+                    result = await self._simulate_agent_execution(agent_id, task_message, context)
+                    if cache_key:
+                        self.result_cache.put(cache_key, result)
+                else:
+                    self.logger.info(f"Reusing cached result for agent {agent_id}")
                 
                 execution_time = (datetime.now() - start_time).total_seconds()
                 
@@ -185,28 +197,8 @@ class SequentialOrchestrator(BaseOrchestrator):
         message: BaseChatMessage, 
         context: Dict[str, Any]
     ) -> str:
-        """Simulate agent execution for testing/demo purposes.
-        
-        In a real implementation, this would:
-        1. Get the actual agent instance
-        2. Send the message to the agent
-        3. Wait for response
-        4. Return the agent's response
-        """
-        # Simulate processing time
-        await asyncio.sleep(0.1)
-        
-        # Simulate agent response based on agent type/name
-        if "architect" in agent_id.lower():
-            return f"Architecture plan created for: {message.content}"
-        elif "developer" in agent_id.lower():
-            return f"Code implementation for: {message.content}"
-        elif "tester" in agent_id.lower():
-            return f"Test suite created for: {message.content}"
-        elif "reviewer" in agent_id.lower():
-            return f"Code review completed for: {message.content}"
-        else:
-            return f"Task processed by {agent_id}: {message.content}"
+        """Run the agent on the message through the agent executor."""
+        return await self._invoke_agent(agent_id, message.content)
 
     async def pause(self) -> bool:
         """Pause the sequential workflow execution."""
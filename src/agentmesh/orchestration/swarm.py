@@ -1,6 +1,5 @@
 """Swarm orchestration implementation for autonomous agent coordination."""
 
-import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set, Callable, Union
@@ -306,16 +305,14 @@ class SwarmOrchestrator(BaseOrchestrator):
         messages: List[BaseChatMessage]
     ) -> TaskResult:
         """Execute a single agent turn."""
-        # This is a placeholder - in real implementation, this would
-        # interface with actual agents
         self.logger.info(f"Executing agent turn: {agent_id}")
         
-        # Simulate agent execution
-        await asyncio.sleep(0.1)  # Simulate processing time
+        # Give the agent the task and the latest turns of the swarm
+        prompt = "\n".join([task, *(message.content for message in messages[-5:])])
+        content = await self._invoke_agent(agent_id, prompt)
         
-        # Create mock response
         response_message = TextMessage(
-            content=f"Agent {agent_id} processed the task",
+            content=content,
             source=agent_id
         )
         
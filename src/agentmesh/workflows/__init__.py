@@ -9,6 +9,13 @@ from .config import (
     get_config_manager
 )
 
+from .checkpoint import (
+    NodeCheckpoint,
+    WorkflowCheckpoint,
+    WorkflowCheckpointStore,
+    get_checkpoint_store
+)
+
 from .manager import (
     WorkflowExecution,
     WorkflowManager,
@@ -24,6 +31,12 @@ __all__ = [
     "WorkflowConfigManager",
     "get_config_manager",
     
+    # Checkpoints
+    "NodeCheckpoint",
+    "WorkflowCheckpoint",
+    "WorkflowCheckpointStore",
+    "get_checkpoint_store",
+    
     # Management
     "WorkflowExecution",
     "WorkflowManager",
@@ -0,0 +1,206 @@
+"""Durable checkpoints of graph workflow runs for resuming after a crash."""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import redis.asyncio as redis
+from pydantic import BaseModel, Field
+
+from ..core.codec import get_codec
+from ..core.config import get_settings
+from ..orchestration.base import WorkflowStatus
+from ..orchestration.graph import WorkflowNode
+
+logger = logging.getLogger(__name__)
+
+# Sorted set of checkpointed execution IDs scored by last update time
+CHECKPOINT_INDEX_KEY = "workflow_checkpoints"
+
+
+class NodeCheckpoint(BaseModel):
+    """Stored outcome of a completed node."""
+    node_id: str
+    output_data: Optional[Dict[str, Any]] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    retry_count: int = 0
+
+
+class WorkflowCheckpoint(BaseModel):
+    """Everything needed to rebuild a run and skip its completed nodes."""
+    execution_id: str
+    workflow_name: str
+    task: str
+    parameters: Dict[str, Any] = Field(default_factory=dict)
+    config: Dict[str, Any]  # WorkflowConfigFile the run was created from
+    agent_id_mapping: Dict[str, str] = Field(default_factory=dict)
+    status: WorkflowStatus = WorkflowStatus.RUNNING
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    nodes: Dict[str, NodeCheckpoint] = Field(default_factory=dict)
+
+
+class WorkflowCheckpointStore:
+    """Redis store for workflow checkpoints.
+
+    Each run is one hash, ``workflow_checkpoint:{execution_id}``, holding the
+    run description under ``meta``, its status under ``status`` and one
+    ``node:{node_id}`` field per completed node, so recording a node is a
+    single HSET no matter how large the run is.
+    """
+
+    def __init__(self):
+        """Initialize the checkpoint store."""
+        self.settings = get_settings()
+        self.redis_client: Optional[redis.Redis] = None
+        self.codec = get_codec(self.settings.payload_codec)
+        self.ttl_seconds = self.settings.workflow_checkpoint_ttl_seconds
+
+    async def connect(self) -> None:
+        """Connect to Redis."""
+        try:
+            self.redis_client = redis.from_url(
+                self.settings.redis_url,
+                db=self.settings.redis_db + 5,  # Use different DB for checkpoints
+                decode_responses=True
+            )
+            await self.redis_client.ping()
+            logger.info("Connected to Redis checkpoint store")
+        except Exception as e:
+            logger.error(f"Failed to connect to Redis for checkpoints: {e}")
+            raise
+
+    async def disconnect(self) -> None:
+        """Disconnect from Redis."""
+        if self.redis_client:
+            await self.redis_client.close()
+            logger.info("Disconnected from Redis checkpoint store")
+
+    @staticmethod
+    def _key(execution_id: str) -> str:
+        """Hash holding one run's checkpoint."""
+        return f"workflow_checkpoint:{execution_id}"
+
+    async def start(self, checkpoint: WorkflowCheckpoint) -> None:
+        """Record a run that is starting or being resumed.
+
+        Node fields already stored for the run are kept.
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        key = self._key(checkpoint.execution_id)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={
+                "meta": self.codec.encode(checkpoint.model_copy(update={"nodes": {}})),
+                "status": WorkflowStatus.RUNNING.value
+            })
+            pipe.expire(key, self.ttl_seconds)
+            pipe.zadd(CHECKPOINT_INDEX_KEY, {checkpoint.execution_id: datetime.utcnow().timestamp()})
+            await pipe.execute()
+
+    async def save_node(self, execution_id: str, node: WorkflowNode) -> None:
+        """Record a completed node."""
+        if not self.redis_client:
+            await self.connect()
+
+        key = self._key(execution_id)
+        node_checkpoint = NodeCheckpoint(
+            node_id=node.node_id,
+            output_data=node.output_data,
+            started_at=node.started_at,
+            completed_at=node.completed_at,
+            retry_count=node.retry_count
+        )
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, f"node:{node.node_id}", self.codec.encode(node_checkpoint))
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def finish(self, execution_id: str, status: WorkflowStatus) -> None:
+        """Record the final status of a run."""
+        if not self.redis_client:
+            await self.connect()
+
+        key = self._key(execution_id)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, "status", status.value)
+            pipe.expire(key, self.ttl_seconds)
+            pipe.zadd(CHECKPOINT_INDEX_KEY, {execution_id: datetime.utcnow().timestamp()})
+            await pipe.execute()
+
+    async def load(self, execution_id: str) -> Optional[WorkflowCheckpoint]:
+        """Load a run with its completed nodes."""
+        if not self.redis_client:
+            await self.connect()
+
+        fields = await self.redis_client.hgetall(self._key(execution_id))
+        if "meta" not in fields:
+            return None
+
+        checkpoint = self.codec.decode(fields["meta"], WorkflowCheckpoint)
+        checkpoint.status = WorkflowStatus(fields.get("status", checkpoint.status))
+        for field, payload in fields.items():
+            if field.startswith("node:"):
+                node_checkpoint = self.codec.decode(payload, NodeCheckpoint)
+                checkpoint.nodes[node_checkpoint.node_id] = node_checkpoint
+        return checkpoint
+
+    async def delete(self, execution_id: str) -> bool:
+        """Delete a run's checkpoint."""
+        if not self.redis_client:
+            await self.connect()
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(self._key(execution_id))
+            pipe.zrem(CHECKPOINT_INDEX_KEY, execution_id)
+            deleted, _ = await pipe.execute()
+        return bool(deleted)
+
+    async def list_checkpoints(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """List the most recently updated runs, newest first.
+
+        Runs still marked running after their process died are the ones
+        to resume. Index entries whose checkpoint has expired are dropped.
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        execution_ids = await self.redis_client.zrevrange(CHECKPOINT_INDEX_KEY, 0, limit - 1)
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for execution_id in execution_ids:
+                pipe.hmget(self._key(execution_id), ["meta", "status"])
+                pipe.hlen(self._key(execution_id))
+            results = await pipe.execute()
+
+        checkpoints = []
+        expired = []
+        for index, execution_id in enumerate(execution_ids):
+            (meta, status), field_count = results[2 * index], results[2 * index + 1]
+            if not meta:
+                expired.append(execution_id)
+                continue
+            checkpoint = self.codec.decode(meta, WorkflowCheckpoint)
+            checkpoints.append({
+                "execution_id": execution_id,
+                "workflow_name": checkpoint.workflow_name,
+                "status": status,
+                "completed_nodes": field_count - 2,
+                "created_at": checkpoint.created_at.isoformat()
+            })
+
+        if expired:
+            await self.redis_client.zrem(CHECKPOINT_INDEX_KEY, *expired)
+        return checkpoints
+
+
+# Global checkpoint store instance
+_checkpoint_store: Optional[WorkflowCheckpointStore] = None
+
+
+def get_checkpoint_store() -> WorkflowCheckpointStore:
+    """Get or create the global checkpoint store instance."""
+    global _checkpoint_store
+    if _checkpoint_store is None:
+        _checkpoint_store = WorkflowCheckpointStore()
+    return _checkpoint_store
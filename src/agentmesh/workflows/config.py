@@ -30,6 +30,15 @@ class WorkflowTerminationConfig(BaseModel):
     custom_condition: Optional[str] = Field(None, description="Custom termination condition code")
 
 
+class JoinConfig(BaseModel):
+    """Configuration for a node that joins synchronize edges and parallel branches."""
+    
+    policy: str = Field("all", description="Inputs to wait for (all, quorum, first)")
+    quorum: Optional[int] = Field(None, description="Inputs to wait for with the quorum policy")
+    reducer: Optional[str] = Field(None, description="Fold inputs as they arrive (concat, merge, vote)")
+    cancel_stragglers: bool = Field(True, description="Cancel inputs still running once the join fires")
+
+
 class GraphNodeConfig(BaseModel):
     """Configuration for a node in a graph workflow."""
     
@@ -40,6 +49,7 @@ class GraphNodeConfig(BaseModel):
     timeout: Optional[int] = Field(None, description="Node execution timeout")
     input_schema: Optional[Dict[str, Any]] = Field(None, description="Expected input schema")
     output_schema: Optional[Dict[str, Any]] = Field(None, description="Expected output schema")
+    join: Optional[JoinConfig] = Field(None, description="Join semantics for synchronization nodes")
 
 
 class GraphEdgeConfig(BaseModel):
@@ -51,6 +61,7 @@ class GraphEdgeConfig(BaseModel):
     type: str = Field("sequential", description="Edge type (sequential, parallel, conditional, synchronize)")
     condition: Optional[str] = Field(None, description="Condition name for conditional edges")
     weight: float = Field(1.0, description="Edge weight")
+    gating: bool = Field(False, description="Conditional edge that does not pass the source's output, so its target may start speculatively")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional edge metadata")
 
 
@@ -79,6 +90,11 @@ class GraphWorkflowConfig(BaseModel):
     edges: List[GraphEdgeConfig] = Field(..., description="Workflow edges")
     parallel_branches: Optional[List[ParallelBranchConfig]] = Field(None, description="Parallel execution branches")
     conditions: Optional[Dict[str, ConditionConfig]] = Field(None, description="Conditional logic definitions")
+    max_concurrency: Optional[int] = Field(None, description="Maximum nodes running at once")
+    agent_concurrency: Dict[str, int] = Field(default_factory=dict, description="Maximum nodes running at once per agent")
+    scheduling: str = Field("fifo", description="Order of ready nodes under concurrency limits (fifo, critical_path)")
+    speculative: bool = Field(False, description="Start likely conditional branches before their condition is known")
+    speculation_threshold: float = Field(0.5, description="Historical branch probability needed to speculate")
 
 
 class SwarmParticipantConfig(BaseModel):
@@ -133,6 +149,7 @@ class WorkflowConfigFile(BaseModel):
     timeout: Optional[int] = Field(None, description="Overall workflow timeout")
     retry_attempts: int = Field(3, description="Number of retry attempts")
     failure_policy: str = Field("fail_fast", description="Failure handling policy")
+    cache_results: bool = Field(False, description="Reuse results of identical agent calls")
     
     # Metadata
     version: str = Field("1.0", description="Configuration version")
@@ -317,6 +334,35 @@ class WorkflowConfigManager:
             "warnings": warnings
         }
     
+    def _validate_join(self, node: GraphNodeConfig, graph: GraphWorkflowConfig) -> Tuple[List[str], List[str]]:
+        """Validate the join settings of a node."""
+        errors = []
+        warnings = []
+        join = node.join
+        inputs = {
+            edge.source for edge in graph.edges
+            if edge.target == node.id and edge.type == "synchronize"
+        }
+        for branch in graph.parallel_branches or []:
+            if branch.synchronization_node == node.id:
+                inputs.update(branch.nodes)
+        
+        if not inputs:
+            errors.append(f"Join node {node.id} has no synchronize edges or parallel branches")
+        if join.policy not in ["all", "quorum", "first"]:
+            errors.append(f"Unknown join policy on node {node.id}: {join.policy}")
+        if join.policy == "quorum" and (join.quorum is None or not 1 <= join.quorum <= len(inputs)):
+            errors.append(f"Join node {node.id} needs a quorum between 1 and {len(inputs)}")
+        if join.reducer and join.reducer not in ["concat", "merge", "vote"]:
+            errors.append(f"Unknown join reducer on node {node.id}: {join.reducer}")
+        for edge in graph.edges:
+            if edge.target == node.id and edge.source in inputs and edge.type != "synchronize":
+                warnings.append(
+                    f"Edge {edge.id} into join node {node.id} comes from a join input; "
+                    f"the join policy decides when it starts, not the {edge.type} edge"
+                )
+        return errors, warnings
+
     def _validate_graph_config(self, graph: GraphWorkflowConfig, agents: List[Union[str, WorkflowAgentConfig]]) -> Tuple[List[str], List[str]]:
         """Validate graph-specific configuration."""
         errors = []
@@ -353,6 +399,8 @@ class WorkflowConfigManager:
             
             if edge.type == "conditional" and not edge.condition:
                 warnings.append(f"Conditional edge {edge.id} has no condition specified")
+            if edge.gating and edge.type != "conditional":
+                errors.append(f"Edge {edge.id} is gating but not conditional")
         
         # Validate parallel branches
         if graph.parallel_branches:
@@ -364,6 +412,30 @@ class WorkflowConfigManager:
                 if branch.synchronization_node and branch.synchronization_node not in node_ids:
                     errors.append(f"Parallel branch {branch.id} references unknown sync node: {branch.synchronization_node}")
         
+        # Validate concurrency limits
+        if graph.max_concurrency is not None and graph.max_concurrency < 1:
+            errors.append("max_concurrency must be at least 1")
+        for agent, limit in graph.agent_concurrency.items():
+            if agent not in agent_names:
+                errors.append(f"Concurrency limit references unknown agent: {agent}")
+            if limit < 1:
+                errors.append(f"Concurrency limit for agent {agent} must be at least 1")
+        
+        if graph.scheduling not in ["fifo", "critical_path"]:
+            errors.append(f"Unknown scheduling policy: {graph.scheduling}")
+        
+        if not 0 <= graph.speculation_threshold < 1:
+            errors.append("speculation_threshold must be at least 0 and below 1")
+        if graph.speculative and not any(edge.gating for edge in graph.edges):
+            warnings.append("speculative has no effect: no conditional edge is marked gating")
+        
+        # Validate joins
+        for node in graph.nodes:
+            if node.join:
+                join_errors, join_warnings = self._validate_join(node, graph)
+                errors.extend(join_errors)
+                warnings.extend(join_warnings)
+        
         # Check for unreachable nodes (simple check)
         reachable_nodes = set()
         source_nodes = {edge.source for edge in graph.edges}
@@ -421,6 +493,7 @@ class WorkflowConfigManager:
             timeout=config.timeout,
             retry_attempts=config.retry_attempts,
             failure_policy=config.failure_policy,
+            cache_results=config.cache_results,
             metadata=config.metadata
         )
 
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Union, Callable
 from uuid import uuid4
 
 from ..core.agent_manager import get_agent_manager
+from ..core.config import get_settings
 from ..orchestration.base import (
     BaseOrchestrator,
     OrchestrationPattern,
@@ -18,7 +19,9 @@ from ..orchestration.base import (
 from ..orchestration.sequential import SequentialOrchestrator
 from ..orchestration.round_robin import RoundRobinOrchestrator
 from ..orchestration.graph import GraphOrchestrator
+from ..orchestration.run_history import get_run_history
 from ..orchestration.swarm import SwarmOrchestrator
+from .checkpoint import WorkflowCheckpoint, get_checkpoint_store
 from .config import (
     WorkflowConfigFile,
     WorkflowConfigManager,
@@ -48,6 +51,9 @@ class WorkflowExecution(BaseOrchestrator):
         self.created_at = datetime.now()
         self.started_at: Optional[datetime] = None
         self.completed_at: Optional[datetime] = None
+        # Set when created from a config file, so the run can be rebuilt from a checkpoint
+        self.config_file: Optional[WorkflowConfigFile] = None
+        self.agent_id_mapping: Dict[str, str] = {}
 
     async def execute(self, task: str, **kwargs) -> TaskResult:
         """Execute the workflow."""
@@ -91,7 +97,8 @@ class WorkflowExecution(BaseOrchestrator):
                     if self.started_at and self.completed_at
                     else None
                 )
-            }
+            },
+            "result_cache": self.orchestrator.get_cache_stats()
         }
         
         # Add graph-specific information for graph workflows
@@ -110,6 +117,9 @@ class WorkflowManager:
         self.agent_manager = get_agent_manager()
         self.active_workflows: Dict[str, WorkflowExecution] = {}
         self.completed_workflows: Dict[str, WorkflowExecution] = {}
+        self.checkpoint_store = (
+            get_checkpoint_store() if get_settings().workflow_checkpoints_enabled else None
+        )
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
 
     async def create_workflow_from_config(
@@ -127,9 +137,9 @@ class WorkflowManager:
             WorkflowExecution: Created workflow execution
         """
         # Validate configuration
-        errors = self.config_manager.validate_config(config_file)
-        if errors:
-            raise ValueError(f"Configuration validation failed: {'; '.join(errors)}")
+        validation = await self.config_manager.validate_config(config_file)
+        if not validation["valid"]:
+            raise ValueError(f"Configuration validation failed: {'; '.join(validation['errors'])}")
         
         # Resolve agent IDs
         if agent_id_mapping is None:
@@ -145,6 +155,8 @@ class WorkflowManager:
         
         # Create workflow execution
         workflow = WorkflowExecution(orchestration_config, orchestrator)
+        workflow.config_file = config_file
+        workflow.agent_id_mapping = agent_id_mapping
         
         self.logger.info(f"Created workflow: {workflow.workflow_id} ({config_file.pattern})")
         return workflow
@@ -184,11 +196,15 @@ class WorkflowManager:
         """
         # Register workflow
         self.active_workflows[workflow.workflow_id] = workflow
+        checkpointed = await self._start_checkpoint(workflow, task, kwargs)
         
         try:
             self.logger.info(f"Starting workflow execution: {workflow.workflow_id}")
             result = await workflow.execute(task, **kwargs)
             
+            if checkpointed:
+                await self._finish_checkpoint(workflow, result)
+            
             # Move to completed workflows
             self.completed_workflows[workflow.workflow_id] = workflow
             del self.active_workflows[workflow.workflow_id]
@@ -201,6 +217,87 @@ class WorkflowManager:
             # Keep in active workflows for potential retry/inspection
             raise
 
+    async def resume_from_checkpoint(self, execution_id: str) -> TaskResult:
+        """Resume an interrupted graph run from its last checkpoint.
+        
+        The workflow is rebuilt from the stored configuration and only nodes
+        that had not completed are executed again.
+        
+        Args:
+            execution_id: Execution ID of the interrupted run
+            
+        Returns:
+            TaskResult: Execution result
+        """
+        if not self.checkpoint_store:
+            raise ValueError("Workflow checkpoints are disabled")
+        
+        checkpoint = await self.checkpoint_store.load(execution_id)
+        if not checkpoint:
+            raise ValueError(f"No checkpoint found for execution {execution_id}")
+        if checkpoint.status == WorkflowStatus.COMPLETED:
+            raise ValueError(f"Execution {execution_id} already completed")
+        
+        workflow = await self.create_workflow_from_config(
+            WorkflowConfigFile(**checkpoint.config),
+            checkpoint.agent_id_mapping
+        )
+        workflow.execution_id = execution_id
+        workflow.orchestrator.restore_completed_nodes({
+            node_id: node.model_dump() for node_id, node in checkpoint.nodes.items()
+        })
+        
+        self.logger.info(
+            f"Resuming execution {execution_id} with {len(checkpoint.nodes)} completed nodes"
+        )
+        return await self.execute_workflow(workflow, checkpoint.task, **checkpoint.parameters)
+
+    async def list_checkpoints(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """List checkpointed runs, newest first."""
+        if not self.checkpoint_store:
+            return []
+        return await self.checkpoint_store.list_checkpoints(limit)
+
+    async def _start_checkpoint(
+        self,
+        workflow: WorkflowExecution,
+        task: str,
+        parameters: Dict[str, Any]
+    ) -> bool:
+        """Start checkpointing a graph run; returns False if the run is not checkpointed."""
+        if (
+            not self.checkpoint_store
+            or not workflow.config_file
+            or not isinstance(workflow.orchestrator, GraphOrchestrator)
+        ):
+            return False
+        
+        try:
+            await self.checkpoint_store.start(WorkflowCheckpoint(
+                execution_id=workflow.execution_id,
+                workflow_name=workflow.config_file.name,
+                task=task,
+                parameters=parameters,
+                config=workflow.config_file.dict(),
+                agent_id_mapping=workflow.agent_id_mapping
+            ))
+        except Exception as e:
+            self.logger.warning(f"Running {workflow.execution_id} without checkpoints: {e}")
+            return False
+        
+        workflow.orchestrator.enable_checkpoints(self.checkpoint_store, workflow.execution_id)
+        return True
+
+    async def _finish_checkpoint(self, workflow: WorkflowExecution, result: TaskResult) -> None:
+        """Record how a checkpointed run ended."""
+        try:
+            await self.checkpoint_store.finish(
+                workflow.execution_id,
+                WorkflowStatus.COMPLETED if result.success else WorkflowStatus.FAILED
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to finish checkpoint {workflow.execution_id}: {e}")
+
     async def pause_workflow(self, workflow_id: str) -> bool:
         """Pause a running workflow."""
         if workflow_id in self.active_workflows:
@@ -279,6 +376,8 @@ class WorkflowManager:
             # Create graph orchestrator and configure it
             orchestrator = GraphOrchestrator(orchestration_config)
             await self._configure_graph_orchestrator(orchestrator, config_file)
+            # Node durations and branch outcomes carry over to the next run of the workflow
+            orchestrator.use_history(get_run_history().for_workflow(config_file.name))
             return orchestrator
         
         elif pattern == OrchestrationPattern.SWARM:
@@ -338,7 +437,8 @@ class WorkflowManager:
                     edge_type=edge_type,
                     condition=condition_func,
                     weight=edge_config.weight,
-                    metadata=edge_config.metadata
+                    metadata=edge_config.metadata,
+                    gating=edge_config.gating
                 )
             
             # Add parallel branches if specified
@@ -349,6 +449,20 @@ class WorkflowManager:
                         nodes=branch_config.nodes,
                         synchronization_node=branch_config.synchronization_node
                     )
+            
+            for node_config in config_file.graph.nodes:
+                if node_config.join:
+                    orchestrator.set_join(node_config.id, **node_config.join.dict())
+            
+            orchestrator.set_concurrency_limits(
+                max_concurrency=config_file.graph.max_concurrency,
+                agent_concurrency=config_file.graph.agent_concurrency
+            )
+            orchestrator.set_scheduling_policy(config_file.graph.scheduling)
+            orchestrator.set_speculation(
+                config_file.graph.speculative,
+                config_file.graph.speculation_threshold
+            )
         
         else:
             # Default to sequential configuration for backwards compatibility
@@ -417,6 +531,9 @@ class WorkflowManager:
             return None
         
         condition_config = conditions_config[condition_name]
+        if not isinstance(condition_config, dict):
+            # Parsed workflow files hold ConditionConfig models
+            condition_config = condition_config.dict(exclude_none=True)
         condition_type = condition_config.get("type", "evaluation")
         
         if condition_type == "evaluation":
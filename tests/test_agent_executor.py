@@ -0,0 +1,174 @@
+"""Test the async agent execution backend."""
+
+import asyncio
+
+import pytest
+
+from agentmesh.core.agent_executor import (
+    AgentExecutor,
+    AgentInvocationError,
+    AgentRequest,
+    AgentTimeoutError,
+    StubProvider,
+)
+from agentmesh.core.agent_manager import AgentManager, get_agent_manager
+from agentmesh.models.agent import AgentConfig, AgentType
+from agentmesh.orchestration.base import OrchestrationPattern, WorkflowConfig
+from agentmesh.orchestration.graph import GraphOrchestrator
+
+
+class OtherStubProvider(StubProvider):
+    """Stub provider registered under a second name."""
+
+    name = "other"
+
+
+class BlockingProvider(StubProvider):
+    """Stub provider whose calls wait until cancelled."""
+
+    def __init__(self):
+        super().__init__(latency=0)
+        self.block = True
+        self.started = asyncio.Event()
+        self.cancelled = 0
+
+    async def invoke(self, client, request):
+        if not self.block:
+            return await super().invoke(client, request)
+        self.started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+def make_executor(*providers, **kwargs):
+    """Create an executor with the given providers."""
+    executor = AgentExecutor(**kwargs)
+    for provider in providers:
+        executor.register_provider(provider)
+    return executor
+
+
+class TestAgentExecutor:
+    """Test cases for pooled, bounded agent calls."""
+
+    @pytest.mark.asyncio
+    async def test_pool_bounds_calls_and_reuses_clients(self):
+        """Test that a provider never has more calls in flight than clients."""
+        stub = StubProvider(latency=0.02)
+        executor = make_executor(stub, pool_size=2)
+
+        responses = await asyncio.gather(*(
+            executor.execute(AgentRequest(agent_id=f"agent{i}", prompt="hi")) for i in range(6)
+        ))
+
+        assert [response.content for response in responses] == [
+            f"agent{i} response to: hi" for i in range(6)
+        ]
+        stats = executor.get_stats()["providers"]["local"]
+        assert stats["peak_in_flight"] == 2
+        assert stats["succeeded"] == 6
+        assert stats["pool"]["created"] == stub.clients_created == 2
+        assert max(response.queued for response in responses) > 0
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_spans_providers(self):
+        """Test that the executor-wide limit applies across providers."""
+        executor = make_executor(
+            StubProvider(latency=0.02), OtherStubProvider(latency=0.02), max_concurrency=3, pool_size=4
+        )
+
+        await asyncio.gather(*(
+            executor.execute(AgentRequest(agent_id="a", prompt="hi", provider=provider))
+            for provider in ["local", "other"] * 4
+        ))
+
+        stats = executor.get_stats()
+        assert stats["peak_in_flight"] == 3
+        assert stats["providers"]["local"]["succeeded"] == stats["providers"]["other"]["succeeded"] == 4
+
+    @pytest.mark.asyncio
+    async def test_timeout_discards_client(self):
+        """Test that a slow call times out and its client is not reused."""
+        stub = StubProvider(latency=1.0)
+        executor = make_executor(stub, pool_size=1, timeout=0.05)
+
+        with pytest.raises(AgentTimeoutError):
+            await executor.execute(AgentRequest(agent_id="slow", prompt="hi"))
+
+        stub.latency = 0
+        response = await executor.execute(AgentRequest(agent_id="fast", prompt="hi", timeout=1))
+        assert response.usage["client_id"] == 2
+        stats = executor.get_stats()["providers"]["local"]
+        assert stats["timeouts"] == 1
+        assert stats["pool"]["discarded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_reaches_provider(self):
+        """Test that cancelling the caller cancels the call and frees its slot."""
+        provider = BlockingProvider()
+        executor = make_executor(provider, pool_size=1)
+
+        call = asyncio.create_task(executor.execute(AgentRequest(agent_id="a", prompt="hi")))
+        await provider.started.wait()
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        assert provider.cancelled == 1
+        assert executor.get_stats()["providers"]["local"]["cancelled"] == 1
+        # The only slot is free again, with a fresh client
+        provider.block = False
+        response = await asyncio.wait_for(executor.execute(AgentRequest(agent_id="b", prompt="hi")), 1)
+        assert response.usage["client_id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_provider(self):
+        """Test that calls to an unregistered provider fail."""
+        executor = make_executor(StubProvider())
+
+        with pytest.raises(AgentInvocationError):
+            await executor.execute(AgentRequest(agent_id="a", prompt="hi", provider="openai"))
+
+    def test_clients_of_finished_loops_are_counted(self):
+        """Test that pooled clients left on a stopped event loop are reported."""
+        executor = make_executor(StubProvider(latency=0))
+        request = AgentRequest(agent_id="a", prompt="hi")
+
+        asyncio.run(executor.execute(request))
+        asyncio.run(executor.execute(request))
+
+        assert executor.get_stats()["dropped_clients"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unavailable_provider_falls_back_to_default(self):
+        """Test that agents of providers without a backend run on the default one."""
+        manager = AgentManager()
+        manager.executor = make_executor(StubProvider(latency=0))
+        manager.agents["claude"] = {"config": AgentConfig(
+            name="claude", type=AgentType.ASSISTANT, model="claude-sonnet",
+            llm_config={"provider": "anthropic"}
+        )}
+
+        response = await manager.invoke_agent("claude", "hi")
+
+        assert response.provider == "local"
+        assert response.content == "claude response to: hi"
+
+    @pytest.mark.asyncio
+    async def test_graph_nodes_call_agents(self, monkeypatch):
+        """Test that graph nodes run their agents through the executor."""
+        executor = make_executor(StubProvider(latency=0))
+        monkeypatch.setattr(get_agent_manager(), "executor", executor)
+        orchestrator = GraphOrchestrator(WorkflowConfig(
+            name="executed", pattern=OrchestrationPattern.GRAPH, agents=["writer"]
+        ))
+        orchestrator.add_node("draft", "writer", max_retries=1)
+
+        result = await orchestrator.execute("write a haiku")
+
+        assert result.success
+        assert result.result["outputs"]["draft"]["result"].startswith("writer response to:")
+        assert executor.get_stats()["providers"]["local"]["succeeded"] == 1
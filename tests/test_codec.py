@@ -0,0 +1,61 @@
+"""Test the Redis payload codecs."""
+
+from datetime import datetime
+
+import pytest
+
+from agentmesh.core.codec import decode_payload, get_codec
+from agentmesh.messaging.message_bus import Message, MessageType
+
+
+@pytest.fixture
+def message():
+    """Create a sample bus message."""
+    return Message(
+        id="msg-1",
+        sender_id="alice",
+        receiver_id="bob",
+        message_type=MessageType.CHAT,
+        content="hello",
+        metadata={"turn": 1},
+        timestamp=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+def test_round_trip(name, message):
+    """Test that every codec decodes what it encodes."""
+    codec = get_codec(name)
+    if codec.name != name:
+        pytest.skip(f"{name} is not installed")
+
+    assert codec.decode(codec.encode(message), Message) == message
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+def test_legacy_json_still_decodes(name, message):
+    """Test that payloads written before the codec layer remain readable."""
+    assert get_codec(name).decode(message.model_dump_json(), Message) == message
+
+
+def test_readers_decode_other_formats(message):
+    """Test that a JSON reader decodes payloads tagged by another codec."""
+    msgpack_codec = get_codec("msgpack")
+    if msgpack_codec.name != "msgpack":
+        pytest.skip("msgpack is not installed")
+
+    payload = msgpack_codec.encode(message)
+
+    assert payload.startswith("msgpack:")
+    assert get_codec("json").decode(payload, Message) == message
+
+
+def test_unknown_format_is_rejected():
+    """Test that an unknown tag raises instead of being misparsed."""
+    with pytest.raises(ValueError):
+        decode_payload("cbor:AAAA", Message)
+
+
+def test_unavailable_codec_falls_back_to_json():
+    """Test that an unknown codec name falls back to JSON."""
+    assert get_codec("does-not-exist").name == "json"
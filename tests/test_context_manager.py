@@ -0,0 +1,559 @@
+"""Test the Redis-backed ContextManager."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from agentmesh.core.context_expiry import EXPIRE_CONTEXT_SCRIPT
+from agentmesh.core.context_manager import (
+    AccessLevel,
+    ContextManager,
+    ContextScope,
+    ContextVersion,
+    ContextVersionConflict,
+)
+from agentmesh.core.json_delta import apply_patch, make_patch
+
+
+class CountingConnection(fakeredis.FakeAsyncRedisConnection):
+    """Fake connection that counts client -> server round trips."""
+
+    round_trips = 0
+
+    async def send_packed_command(self, command, check_health=True):
+        CountingConnection.round_trips += 1
+        await super().send_packed_command(command, check_health)
+
+
+def make_context_manager(server):
+    """Create a ContextManager on a shared fake Redis server."""
+    manager = ContextManager()
+    manager.redis_client = fakeredis.FakeAsyncRedis(
+        server=server,
+        decode_responses=True,
+        connection_class=CountingConnection,
+    )
+    return manager
+
+
+@pytest.fixture
+def server():
+    """Create a fake Redis server shared by several clients."""
+    return fakeredis.FakeServer()
+
+
+@pytest_asyncio.fixture
+async def context_manager(server):
+    """Create a ContextManager backed by an in-process fake Redis."""
+    manager = make_context_manager(server)
+    await manager.redis_client.ping()
+    CountingConnection.round_trips = 0
+    yield manager
+    await manager.disconnect()
+
+
+class TestContextCache:
+    """Test cases for the local context cache."""
+
+    @pytest.mark.asyncio
+    async def test_hot_reads_are_served_from_memory(self, context_manager):
+        """Test that repeated reads do not touch Redis."""
+        await context_manager.set_context("plan", "v1", ContextScope.AGENT, "alice", "alice")
+        await context_manager.get_context("plan", ContextScope.AGENT, "alice", "alice")
+        CountingConnection.round_trips = 0
+
+        for _ in range(10):
+            entry = await context_manager.get_context("plan", ContextScope.AGENT, "alice", "alice")
+
+        assert entry.value == "v1"
+        assert CountingConnection.round_trips == 0
+        assert context_manager.get_cache_stats()["hit_ratio"] > 0.5
+
+    @pytest.mark.asyncio
+    async def test_writes_from_other_workers_invalidate(self, server, context_manager):
+        """Test that a write in another process evicts the local copy."""
+        other = make_context_manager(server)
+        await context_manager.cache.start_listener(context_manager.redis_client, poll_timeout=0.01)
+
+        await context_manager.set_context("plan", "v1", ContextScope.AGENT, "alice", "alice")
+        assert (await context_manager.get_context(
+            "plan", ContextScope.AGENT, "alice", "alice"
+        )).value == "v1"
+
+        invalidations = context_manager.cache.invalidations
+        await other.set_context("plan", "v2", ContextScope.AGENT, "alice", "alice")
+        for _ in range(50):
+            if context_manager.cache.invalidations > invalidations:
+                break
+            await asyncio.sleep(0.01)
+
+        entry = await context_manager.get_context("plan", ContextScope.AGENT, "alice", "alice")
+        assert entry.value == "v2"
+        assert entry.version == 2
+        await other.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_acl_changes_are_visible_immediately(self, context_manager):
+        """Test that granting and revoking access is not hidden by the cache."""
+        await context_manager.set_context("plan", "v1", ContextScope.AGENT, "alice", "alice")
+        assert await context_manager.get_context("plan", ContextScope.AGENT, "alice", "bob") is None
+
+        await context_manager.grant_access(
+            "plan", ContextScope.AGENT, "alice", "bob", AccessLevel.READ, "alice"
+        )
+        assert await context_manager.get_context("plan", ContextScope.AGENT, "alice", "bob")
+
+        await context_manager.revoke_access("plan", ContextScope.AGENT, "alice", "bob", "alice")
+        assert await context_manager.get_context("plan", ContextScope.AGENT, "alice", "bob") is None
+
+    @pytest.mark.asyncio
+    async def test_cached_values_are_not_shared_with_callers(self, context_manager):
+        """Test that changing a written or read value does not change the cache."""
+        value = {"a": 1}
+        await context_manager.set_context("plan", value, ContextScope.AGENT, "alice", "alice")
+        value["a"] = 2
+
+        # Once from the copy cached on write, once from a fill after a miss
+        for _ in range(2):
+            entry = await context_manager.get_context("plan", ContextScope.AGENT, "alice", "alice")
+            assert entry.value == {"a": 1}
+            entry.value["a"] = 3
+            entry = await context_manager.get_context("plan", ContextScope.AGENT, "alice", "alice")
+            assert entry.value == {"a": 1}
+            context_manager.cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_racing_fill_is_discarded(self, context_manager):
+        """Test that a read started before an invalidation is not cached."""
+        cache = context_manager.cache
+        generation = cache.generation
+        cache.invalidate("agent:alice:plan")
+
+        cache.put_entry("agent:alice:plan", None, generation)
+
+        assert cache.get_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, context_manager):
+        """Test that the least recently used entries are evicted."""
+        context_manager.cache.max_entries = 5
+        for i in range(10):
+            await context_manager.set_context(f"key-{i}", i, ContextScope.AGENT, "alice", "alice")
+
+        stats = context_manager.get_cache_stats()
+        assert stats["size"] == 5
+        assert stats["evictions"] == 5
+
+
+class TestAtomicSetContext:
+    """Test cases for the compare-and-set write path."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writers_do_not_lose_versions(self, server, context_manager):
+        """Test that racing writers each get their own version."""
+        writers = [make_context_manager(server) for _ in range(5)]
+
+        entries = await asyncio.gather(*[
+            writer.set_context("counter", i, ContextScope.AGENT, "alice", "alice")
+            for i, writer in enumerate(writers)
+        ])
+
+        assert sorted(e.version for e in entries) == [1, 2, 3, 4, 5]
+        history = await context_manager.get_context_history(
+            "counter", ContextScope.AGENT, "alice", "alice"
+        )
+        assert len(history) == 4  # history starts with the first update
+
+    @pytest.mark.asyncio
+    async def test_expected_version_mismatch_raises(self, context_manager):
+        """Test optimistic locking with expected_version."""
+        await context_manager.set_context(
+            "plan", "v1", ContextScope.AGENT, "alice", "alice", expected_version=0
+        )
+        await context_manager.set_context(
+            "plan", "v2", ContextScope.AGENT, "alice", "alice", expected_version=1
+        )
+
+        with pytest.raises(ContextVersionConflict) as exc_info:
+            await context_manager.set_context(
+                "plan", "stale", ContextScope.AGENT, "alice", "alice", expected_version=1
+            )
+
+        assert exc_info.value.actual_version == 2
+        entry = await context_manager.get_context("plan", ContextScope.AGENT, "alice", "alice")
+        assert entry.value == "v2"
+
+    @pytest.mark.asyncio
+    async def test_warm_write_is_single_round_trip(self, context_manager):
+        """Test that a write to a cached entry costs one round trip."""
+        await context_manager.set_context("plan", "v1", ContextScope.AGENT, "alice", "alice")
+        CountingConnection.round_trips = 0
+
+        entry = await context_manager.set_context("plan", "v2", ContextScope.AGENT, "alice", "alice")
+
+        assert entry.version == 2
+        assert CountingConnection.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_legacy_entries_keep_their_version(self, context_manager):
+        """Test that entries written before the version hash continue counting."""
+        entry = await context_manager.set_context("plan", "v1", ContextScope.AGENT, "alice", "alice")
+        for _ in range(2):
+            entry = await context_manager.set_context(
+                "plan", "vN", ContextScope.AGENT, "alice", "alice"
+            )
+        await context_manager.redis_client.delete("context_versions")
+        context_manager.cache.clear()
+
+        entry = await context_manager.set_context("plan", "v4", ContextScope.AGENT, "alice", "alice")
+
+        assert entry.version == 4
+
+
+class TestBatchContext:
+    """Test cases for multi-key reads, writes and snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_set_many_then_get_many(self, context_manager):
+        """Test that a batch write is readable as a batch."""
+        entries = await context_manager.set_many(
+            {"a": 1, "b": 2, "c": 3}, ContextScope.AGENT, "alice", "alice"
+        )
+        assert [e.version for e in entries] == [1, 1, 1]
+
+        await context_manager.set_many({"a": 10}, ContextScope.AGENT, "alice", "alice")
+        result = await context_manager.get_many(
+            ["a", "b", "missing"], ContextScope.AGENT, "alice", "alice"
+        )
+
+        assert {key: e.value for key, e in result.items()} == {"a": 10, "b": 2}
+        assert result["a"].version == 2
+
+    @pytest.mark.asyncio
+    async def test_cold_batch_read_is_one_round_trip(self, context_manager):
+        """Test that values and grants for many keys load in one round trip."""
+        await context_manager.set_many(
+            {f"key-{i}": i for i in range(50)}, ContextScope.GLOBAL, "shared", "alice"
+        )
+        context_manager.cache.clear()
+        CountingConnection.round_trips = 0
+
+        result = await context_manager.get_many(
+            [f"key-{i}" for i in range(50)], ContextScope.GLOBAL, "shared", "bob"
+        )
+
+        assert len(result) == 50
+        assert CountingConnection.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_filters_by_access(self, context_manager):
+        """Test that a snapshot only contains readable entries."""
+        await context_manager.set_many({"a": 1, "b": 2}, ContextScope.AGENT, "alice", "alice")
+        await context_manager.grant_access(
+            "b", ContextScope.AGENT, "alice", "bob", AccessLevel.READ, "alice"
+        )
+
+        assert set(await context_manager.snapshot(ContextScope.AGENT, "alice", "alice")) == {"a", "b"}
+        assert set(await context_manager.snapshot(ContextScope.AGENT, "alice", "bob")) == {"b"}
+
+
+class TestContextExpiry:
+    """Test cases for entries written with expires_in."""
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_hidden_before_sweep(self, context_manager):
+        """Test that readers never see an entry past expires_at."""
+        await context_manager.set_context(
+            "token", "abc", ContextScope.AGENT, "alice", "alice",
+            expires_in=timedelta(milliseconds=1)
+        )
+        await asyncio.sleep(0.01)
+
+        assert await context_manager.get_context("token", ContextScope.AGENT, "alice", "alice") is None
+        assert await context_manager.list_context(ContextScope.AGENT, "alice", "alice") == []
+
+    @pytest.mark.asyncio
+    async def test_sweep_removes_entry_and_related_keys(self, context_manager):
+        """Test that a sweep deletes the entry, version, history, grants and scope membership."""
+        for value in ("v1", "v2"):
+            await context_manager.set_context(
+                "token", value, ContextScope.AGENT, "alice", "alice",
+                expires_in=timedelta(hours=1)
+            )
+        await context_manager.set_context("plan", "keep", ContextScope.AGENT, "alice", "alice")
+        await context_manager.grant_access(
+            "token", ContextScope.AGENT, "alice", "bob", AccessLevel.READ, "alice"
+        )
+        client = context_manager.redis_client
+
+        result = await context_manager.expire_context(now=datetime.utcnow() + timedelta(hours=2))
+
+        assert result["entries_expired"] == 1
+        assert await client.hkeys("context_entries") == ["agent:alice:plan"]
+        assert await client.hkeys("context_versions") == ["agent:alice:plan"]
+        assert await client.smembers("context_scope:agent:alice") == {"agent:alice:plan"}
+        assert not await client.exists(
+            "context_revisions:agent:alice:token", "context_access:agent:alice:token"
+        )
+        assert await client.zcard("context_expiry") == 0
+        assert not await client.exists("context_readable:bob:agent:alice")
+
+    @pytest.mark.asyncio
+    async def test_sweep_skips_entry_granted_since_it_was_read(self, context_manager):
+        """Test that an entry is kept when a grantee's listing set was not passed in."""
+        await context_manager.set_context(
+            "token", "v1", ContextScope.AGENT, "alice", "alice",
+            expires_in=timedelta(hours=1)
+        )
+        await context_manager.grant_access(
+            "token", ContextScope.AGENT, "alice", "bob", AccessLevel.READ, "alice"
+        )
+        client = context_manager.redis_client
+        entry_id = "agent:alice:token"
+        expire = client.register_script(EXPIRE_CONTEXT_SCRIPT)
+        cutoff = context_manager.expiry_sweeper.score(datetime.utcnow() + timedelta(hours=2))
+
+        # The sweep only saw the writer, not bob's grant
+        result = await expire(
+            keys=[
+                "context_expiry", "context_entries", "context_versions",
+                f"context_revisions:{entry_id}", f"context_history:{entry_id}",
+                f"context_access:{entry_id}", "context_scope:agent:alice",
+                "context_readable:alice:agent:alice"
+            ],
+            args=[entry_id, cutoff, "", "", "agent:alice", "alice"]
+        )
+
+        assert result == [0, 0]
+        assert await client.hexists("context_entries", entry_id)
+        result = await context_manager.expire_context(now=datetime.utcnow() + timedelta(hours=2))
+        assert result["entries_expired"] == 1
+        assert not await client.exists("context_readable:bob:agent:alice")
+
+    @pytest.mark.asyncio
+    async def test_rewrite_without_expiry_survives_sweep(self, context_manager):
+        """Test that dropping expires_in on a later write cancels the expiry."""
+        await context_manager.set_context(
+            "token", "v1", ContextScope.AGENT, "alice", "alice",
+            expires_in=timedelta(hours=1)
+        )
+        await context_manager.set_context("token", "v2", ContextScope.AGENT, "alice", "alice")
+
+        await context_manager.expire_context(now=datetime.utcnow() + timedelta(hours=2))
+
+        entry = await context_manager.get_context("token", ContextScope.AGENT, "alice", "alice")
+        assert entry.value == "v2"
+        assert entry.version == 2
+
+
+class TestContextHistory:
+    """Test cases for the delta-encoded version history."""
+
+    @staticmethod
+    def document(step):
+        """Build a large value that changes a little on every step."""
+        return {
+            "step": step,
+            "items": [{"id": i, "done": i < step} for i in range(40)],
+            "notes": {f"n{i}": "x" * 50 for i in range(20)},
+        }
+
+    @pytest.mark.asyncio
+    async def test_every_version_is_reconstructed(self, context_manager):
+        """Test that snapshots plus deltas rebuild each retained version."""
+        for step in range(1, 31):
+            await context_manager.set_context(
+                "doc", self.document(step), ContextScope.AGENT, "alice", "alice"
+            )
+
+        for version in range(2, 31):
+            entry = await context_manager.get_context(
+                "doc", ContextScope.AGENT, "alice", "alice", version=version
+            )
+            assert entry.version == version
+            assert entry.value == self.document(version)
+
+        history = await context_manager.get_context_history(
+            "doc", ContextScope.AGENT, "alice", "alice", limit=15
+        )
+        assert [v.version for v in history] == list(range(30, 15, -1))
+        assert [v.value for v in history] == [self.document(v) for v in range(30, 15, -1)]
+
+    @pytest.mark.asyncio
+    async def test_value_changed_between_writes_keeps_history(self, context_manager):
+        """Test that deltas are taken against the stored value, not the caller's object."""
+        for value in ({"a": 1}, {"a": 5}):
+            await context_manager.set_context("doc", value, ContextScope.AGENT, "alice", "alice")
+        value = {"a": 6}
+        await context_manager.set_context("doc", value, ContextScope.AGENT, "alice", "alice")
+        value["a"] = 7
+        await context_manager.set_context("doc", value, ContextScope.AGENT, "alice", "alice")
+        await context_manager.set_context("doc", {"a": 8}, ContextScope.AGENT, "alice", "alice")
+        context_manager.cache.clear()
+
+        entry = await context_manager.get_context(
+            "doc", ContextScope.AGENT, "alice", "alice", version=4
+        )
+        history = await context_manager.get_context_history(
+            "doc", ContextScope.AGENT, "alice", "alice"
+        )
+
+        assert entry.value == {"a": 7}
+        assert [(v.version, v.value) for v in history] == [
+            (5, {"a": 8}), (4, {"a": 7}), (3, {"a": 6}), (2, {"a": 5})
+        ]
+
+    @pytest.mark.asyncio
+    async def test_history_is_trimmed_by_block(self, context_manager, monkeypatch):
+        """Test that old blocks are dropped and the oldest kept version starts with a snapshot."""
+        monkeypatch.setattr("agentmesh.core.context_manager.CONTEXT_HISTORY_LIMIT", 20)
+        for step in range(1, 56):
+            await context_manager.set_context(
+                "doc", self.document(step), ContextScope.AGENT, "alice", "alice"
+            )
+
+        fields = sorted(int(v) for v in await context_manager.redis_client.hkeys(
+            "context_revisions:agent:alice:doc"
+        ))
+        assert fields == list(range(30, 56))
+        entry = await context_manager.get_context(
+            "doc", ContextScope.AGENT, "alice", "alice", version=36
+        )
+        assert entry.value == self.document(36)
+
+    @pytest.mark.asyncio
+    async def test_deltas_shrink_history(self, context_manager):
+        """Test that history stores much less than one full copy per version."""
+        for step in range(1, 41):
+            await context_manager.set_context(
+                "doc", self.document(step), ContextScope.AGENT, "alice", "alice"
+            )
+
+        stored = sum(len(record) for record in await context_manager.redis_client.hvals(
+            "context_revisions:agent:alice:doc"
+        ))
+        full_copy = len(context_manager.codec.encode(await context_manager.get_context(
+            "doc", ContextScope.AGENT, "alice", "alice"
+        )))
+        assert stored < 39 * full_copy / 3
+
+    @pytest.mark.asyncio
+    async def test_version_lookup_is_one_round_trip(self, context_manager):
+        """Test that a warm version lookup costs one round trip."""
+        for step in range(1, 20):
+            await context_manager.set_context(
+                "doc", self.document(step), ContextScope.AGENT, "alice", "alice"
+            )
+        CountingConnection.round_trips = 0
+
+        entry = await context_manager.get_context(
+            "doc", ContextScope.AGENT, "alice", "alice", version=17
+        )
+
+        assert entry.value == self.document(17)
+        assert CountingConnection.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_legacy_history_list_is_still_read(self, context_manager):
+        """Test that history written as a list before the revisions hash is readable."""
+        await context_manager.set_context("plan", "v1", ContextScope.AGENT, "alice", "alice")
+        await context_manager.set_context("plan", "v2", ContextScope.AGENT, "alice", "alice")
+        await context_manager.redis_client.delete("context_revisions:agent:alice:plan")
+        await context_manager.redis_client.lpush(
+            "context_history:agent:alice:plan",
+            context_manager.codec.encode(ContextVersion(
+                version=2, value="v2", updated_by="alice", updated_at=datetime.utcnow()
+            ))
+        )
+        await context_manager.set_context("plan", "v3", ContextScope.AGENT, "alice", "alice")
+
+        history = await context_manager.get_context_history(
+            "plan", ContextScope.AGENT, "alice", "alice"
+        )
+
+        assert [(v.version, v.value) for v in history] == [(3, "v3"), (2, "v2")]
+
+
+@pytest.mark.parametrize("old,new", [
+    ({"a": 1, "b": [1, 2]}, {"a": 2, "b": [1, 3], "c/d": {"e~": None}}),
+    ({"a": [1, 2, 3]}, {"a": [1]}),
+    ([{"x": 1}], [{"x": 1, "y": 2}]),
+    ("text", {"now": "an object"}),
+])
+def test_json_patch_round_trip(old, new):
+    """Test that applying a generated patch reproduces the new value."""
+    patch = make_patch(old, new)
+
+    assert apply_patch(old, patch) == new
+
+
+class TestListingIndex:
+    """Test cases for the per-agent listing index."""
+
+    @pytest.mark.asyncio
+    async def test_listing_loads_only_readable_entries(self, context_manager):
+        """Test that listing a large scope loads only the requester's entries."""
+        await context_manager.set_many(
+            {f"key-{i}": i for i in range(500)}, ContextScope.AGENT, "alice", "alice"
+        )
+        for key in ("key-7", "key-42"):
+            await context_manager.grant_access(
+                key, ContextScope.AGENT, "alice", "bob", AccessLevel.READ, "alice"
+            )
+        context_manager.cache.clear()
+        CountingConnection.round_trips = 0
+
+        entries = await context_manager.list_context(ContextScope.AGENT, "alice", "bob")
+
+        assert sorted(e.key for e in entries) == ["key-42", "key-7"]
+        assert CountingConnection.round_trips == 2
+        assert context_manager.get_cache_stats()["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_revoke_and_delete_update_the_index(self, context_manager):
+        """Test that revoked and deleted entries leave the listing."""
+        await context_manager.set_many({"a": 1, "b": 2}, ContextScope.AGENT, "alice", "alice")
+        for key in ("a", "b"):
+            await context_manager.grant_access(
+                key, ContextScope.AGENT, "alice", "bob", AccessLevel.READ, "alice"
+            )
+
+        await context_manager.revoke_access("a", ContextScope.AGENT, "alice", "bob", "alice")
+        await context_manager.delete_context("b", ContextScope.AGENT, "alice", "alice")
+
+        assert await context_manager.list_context(ContextScope.AGENT, "alice", "bob") == []
+        assert not await context_manager.redis_client.exists("context_readable:bob:agent:alice")
+
+    @pytest.mark.asyncio
+    async def test_key_pattern_is_matched_literally(self, context_manager):
+        """Test that glob characters in key_pattern are not wildcards."""
+        await context_manager.set_many(
+            {"plan*v1": 1, "planXv1": 2, "notes": 3}, ContextScope.GLOBAL, "shared", "alice"
+        )
+
+        entries = await context_manager.list_context(
+            ContextScope.GLOBAL, "shared", "bob", key_pattern="n*"
+        )
+
+        assert [e.key for e in entries] == ["plan*v1"]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_indexes_existing_entries(self, context_manager):
+        """Test that entries written before the index existed become listable."""
+        await context_manager.set_context("plan", "v1", ContextScope.AGENT, "alice", "carol")
+        await context_manager.grant_access(
+            "plan", ContextScope.AGENT, "alice", "bob", AccessLevel.READ, "carol"
+        )
+        client = context_manager.redis_client
+        await client.delete("context_readable:carol:agent:alice", "context_readable:bob:agent:alice")
+
+        assert await context_manager.rebuild_access_index() == 2
+        assert await context_manager.rebuild_access_index() == 0
+
+        for agent_id in ("bob", "carol"):
+            entries = await context_manager.list_context(ContextScope.AGENT, "alice", agent_id)
+            assert [e.key for e in entries] == ["plan"]
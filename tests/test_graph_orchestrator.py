@@ -0,0 +1,538 @@
+"""Test the GraphOrchestrator scheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from agentmesh.orchestration.base import OrchestrationPattern, WorkflowConfig, WorkflowStatus
+from agentmesh.orchestration.graph import EdgeType, GraphOrchestrator, NodeStatus
+from agentmesh.workflows.config import WorkflowConfigFile
+from agentmesh.workflows.manager import WorkflowManager
+
+
+class TimedGraphOrchestrator(GraphOrchestrator):
+    """Graph orchestrator whose nodes sleep for a configured duration."""
+
+    def __init__(self, durations):
+        super().__init__(WorkflowConfig(
+            name="timed", pattern=OrchestrationPattern.GRAPH, agents=["agent"]
+        ))
+        self.durations = durations
+        for node_id in durations:
+            self.add_node(node_id, "agent", max_retries=1)
+
+    async def _run_agent(self, node, task):
+        await asyncio.sleep(self.durations[node.node_id])
+        if node.node_id.startswith("fail"):
+            raise RuntimeError("boom")
+        return {"result": node.node_id, "node_id": node.node_id, "agent_id": node.agent_id}
+
+
+def chain(orchestrator, *node_ids):
+    """Connect nodes with sequential edges."""
+    for source, target in zip(node_ids, node_ids[1:]):
+        orchestrator.add_edge(f"{source}-{target}", source, target)
+
+
+class TestGraphExecution:
+    """Test cases for event-driven graph execution."""
+
+    @pytest.mark.asyncio
+    async def test_makespan_follows_critical_path(self):
+        """Test that each node starts as soon as its dependencies finish."""
+        orchestrator = TimedGraphOrchestrator({
+            "a": 0.02, "b": 0.02, "c": 0.02, "d": 0.02, "e": 0.02, "long": 0.1, "end": 0.02
+        })
+        chain(orchestrator, "a", "b", "c", "d", "e", "end")
+        chain(orchestrator, "a", "long", "end")
+
+        started = time.perf_counter()
+        result = await orchestrator.execute("task")
+        elapsed = time.perf_counter() - started
+
+        assert result.success
+        assert set(result.result["completed_nodes"]) == set(orchestrator.durations)
+        assert orchestrator.context.status == WorkflowStatus.COMPLETED
+        # Critical path a -> long -> end is 0.14s; polling cost 0.1s per transition
+        assert elapsed < 0.25
+
+    @pytest.mark.asyncio
+    async def test_failed_node_fails_workflow(self):
+        """Test that a failing node stops its dependents and fails the result."""
+        orchestrator = TimedGraphOrchestrator({"a": 0.0, "fail": 0.0, "after": 0.0})
+        chain(orchestrator, "a", "fail", "after")
+
+        result = await orchestrator.execute("task")
+
+        assert not result.success
+        assert result.result["failed_nodes"] == ["fail"]
+        assert orchestrator.nodes["after"].status == NodeStatus.PENDING
+        assert orchestrator.context.status == WorkflowStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_nodes(self):
+        """Test that cancel cancels node tasks instead of leaving them running."""
+        orchestrator = TimedGraphOrchestrator({"slow": 10.0})
+        run = asyncio.create_task(orchestrator.execute("task"))
+        await asyncio.sleep(0.01)
+
+        await orchestrator.cancel()
+        result = await asyncio.wait_for(run, timeout=1)
+
+        assert not result.success
+        assert orchestrator.context.status == WorkflowStatus.CANCELLED
+        assert not orchestrator._node_tasks
+
+
+
+class TestReadySet:
+    """Test cases for the incrementally maintained ready set."""
+
+    def test_ready_set_tracks_edges_as_they_are_added(self):
+        """Test that only nodes without unsatisfied incoming edges are ready."""
+        orchestrator = TimedGraphOrchestrator({"a": 0.0, "b": 0.0, "c": 0.0})
+        assert orchestrator.get_ready_nodes() == ["a", "b", "c"]
+
+        chain(orchestrator, "a", "b", "c")
+
+        assert orchestrator.get_ready_nodes() == ["a"]
+        assert orchestrator._find_edge("a", "b").edge_id == "a-b"
+        with pytest.raises(ValueError):
+            orchestrator.add_edge("again", "a", "b")
+
+    @pytest.mark.asyncio
+    async def test_parallel_edge_starts_with_its_source(self):
+        """Test that a parallel target starts while its source is still running."""
+        orchestrator = TimedGraphOrchestrator({"source": 0.05, "sidecar": 0.0})
+        orchestrator.add_edge("p", "source", "sidecar", edge_type=EdgeType.PARALLEL)
+
+        result = await orchestrator.execute("task")
+
+        assert result.success
+        assert orchestrator.nodes["sidecar"].completed_at < orchestrator.nodes["source"].completed_at
+
+    @pytest.mark.asyncio
+    async def test_false_condition_leaves_target_pending(self):
+        """Test that conditional edges only release their target when the condition holds."""
+        orchestrator = TimedGraphOrchestrator({"check": 0.0, "yes": 0.0, "no": 0.0})
+        orchestrator.add_edge(
+            "to-yes", "check", "yes", edge_type=EdgeType.CONDITIONAL,
+            condition=lambda data: data["output_data"]["result"] == "check"
+        )
+        orchestrator.add_edge(
+            "to-no", "check", "no", edge_type=EdgeType.CONDITIONAL,
+            condition=lambda data: data["output_data"]["result"] != "check"
+        )
+
+        result = await orchestrator.execute("task")
+
+        assert result.success
+        assert orchestrator.nodes["yes"].status == NodeStatus.COMPLETED
+        assert orchestrator.nodes["no"].status == NodeStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_synchronization_node_waits_for_branch(self):
+        """Test that a synchronization node is released when its branch finishes."""
+        orchestrator = TimedGraphOrchestrator({"start": 0.0, "left": 0.01, "right": 0.02, "join": 0.0})
+        orchestrator.add_edge("l", "start", "left", edge_type=EdgeType.PARALLEL)
+        orchestrator.add_edge("r", "start", "right", edge_type=EdgeType.PARALLEL)
+        # A conditional edge that never holds, so only the branch can release join
+        orchestrator.add_edge(
+            "j", "start", "join", edge_type=EdgeType.CONDITIONAL, condition=lambda data: False
+        )
+        orchestrator.add_parallel_branch("fan", ["left", "right"], synchronization_node="join")
+
+        result = await orchestrator.execute("task")
+
+        assert result.success
+        assert orchestrator.nodes["join"].started_at >= orchestrator.nodes["right"].completed_at
+        assert orchestrator.parallel_executions["fan"].completed_nodes == {"left", "right"}
+
+
+class TestConcurrencyLimits:
+    """Test cases for workflow and per-agent concurrency limits."""
+
+    @staticmethod
+    def fan_out(width, duration=0.02):
+        """Build a graph of independent nodes split across two agents."""
+        orchestrator = TimedGraphOrchestrator({})
+        for i in range(width):
+            node_id = f"n{i}"
+            orchestrator.durations[node_id] = duration
+            orchestrator.add_node(node_id, "slow" if i % 2 else "fast", max_retries=1)
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_caps_running_nodes(self):
+        """Test that no more than max_concurrency nodes run at once."""
+        orchestrator = self.fan_out(8)
+        orchestrator.set_concurrency_limits(max_concurrency=3)
+
+        result = await orchestrator.execute("task")
+
+        stats = orchestrator.get_queue_stats()
+        assert result.success
+        assert stats["max_in_flight"] == 3
+        assert stats["nodes_started"] == 8
+        # Later nodes waited for roughly two completion rounds
+        assert stats["max_wait_seconds"] >= 0.03
+        assert stats["queued"] == 0 and stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_agent_concurrency_limits_one_agent(self):
+        """Test that a per-agent limit only holds back that agent's nodes."""
+        orchestrator = self.fan_out(8)
+        orchestrator.set_concurrency_limits(agent_concurrency={"slow": 1})
+        running = {"slow": 0, "fast": 0}
+        peak = {"slow": 0, "fast": 0}
+        run_agent = orchestrator._run_agent
+
+        async def tracking_run_agent(node, task):
+            running[node.agent_id] += 1
+            peak[node.agent_id] = max(peak[node.agent_id], running[node.agent_id])
+            try:
+                return await run_agent(node, task)
+            finally:
+                running[node.agent_id] -= 1
+
+        orchestrator._run_agent = tracking_run_agent
+        result = await orchestrator.execute("task")
+
+        assert result.success
+        assert peak == {"slow": 1, "fast": 4}
+        agents = orchestrator.get_queue_stats()["agents"]
+        assert agents["slow"]["total_wait_seconds"] > agents["fast"]["total_wait_seconds"]
+
+    def test_rejects_non_positive_limits(self):
+        """Test that limits below one are rejected."""
+        orchestrator = self.fan_out(1)
+        with pytest.raises(ValueError):
+            orchestrator.set_concurrency_limits(max_concurrency=0)
+        with pytest.raises(ValueError):
+            orchestrator.set_concurrency_limits(agent_concurrency={"slow": 0})
+
+
+class TestCriticalPathScheduling:
+    """Test cases for critical-path priority scheduling."""
+
+    @staticmethod
+    def build(policy):
+        """Build four short nodes next to a short head feeding a long tail."""
+        orchestrator = TimedGraphOrchestrator({
+            "s1": 0.02, "s2": 0.02, "s3": 0.02, "s4": 0.02, "head": 0.02, "tail": 0.1
+        })
+        chain(orchestrator, "head", "tail")
+        orchestrator.set_concurrency_limits(max_concurrency=2)
+        orchestrator.set_scheduling_policy(policy)
+        for node_id, duration in orchestrator.durations.items():
+            orchestrator.record_duration(node_id, duration)
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_long_path_starts_first(self):
+        """Test that the head of the long path gets capacity before short nodes."""
+        fifo = self.build("fifo")
+        critical = self.build("critical_path")
+
+        assert (await fifo.execute("task")).success
+        assert (await critical.execute("task")).success
+
+        assert fifo.nodes["tail"].started_at > fifo.nodes["s4"].started_at
+        assert critical.nodes["tail"].started_at < critical.nodes["s3"].started_at
+        makespan = {
+            name: max(node.completed_at for node in orchestrator.nodes.values())
+            - min(node.started_at for node in orchestrator.nodes.values())
+            for name, orchestrator in [("fifo", fifo), ("critical", critical)]
+        }
+        assert makespan["critical"] < makespan["fifo"]
+
+    def test_priorities_use_edge_weights_and_skip_cycles(self):
+        """Test remaining-path priorities on a weighted graph with a feedback loop."""
+        orchestrator = TimedGraphOrchestrator({"a": 0, "b": 0, "c": 0})
+        chain(orchestrator, "a", "b", "c")
+        orchestrator.add_edge("loop", "c", "a")
+        orchestrator.edges["a-b"].weight = 2.0
+        for node_id in ["b", "c"]:
+            orchestrator.record_duration(node_id, 3.0)
+        orchestrator.record_duration("c", 1.0)
+
+        priorities = orchestrator._compute_priorities()
+
+        # c is smoothed to 0.3 * 1 + 0.7 * 3; a has no history and falls back to its agent
+        assert orchestrator.duration_history["c"] == pytest.approx(2.4)
+        assert orchestrator.estimate_duration("a") == pytest.approx(2.7)
+        assert priorities["b"] == pytest.approx(3.0 + priorities["c"])
+        assert priorities["a"] == pytest.approx(2.7 + 2.0 * priorities["b"])
+
+    def test_rejects_unknown_policy(self):
+        """Test that only known scheduling policies are accepted."""
+        with pytest.raises(ValueError):
+            TimedGraphOrchestrator({}).set_scheduling_policy("random")
+
+
+class TestSpeculativeExecution:
+    """Test cases for starting likely conditional branches early."""
+
+    def build(self, take_branch, gating=True):
+        """decide -(conditional)-> review -> merge, with speculation enabled."""
+        orchestrator = TimedGraphOrchestrator({"decide": 0.05, "review": 0.05, "merge": 0.01})
+        orchestrator.add_edge(
+            "decide-review", "decide", "review",
+            edge_type=EdgeType.CONDITIONAL, condition=lambda data: take_branch, gating=gating
+        )
+        chain(orchestrator, "review", "merge")
+        orchestrator.set_speculation(threshold=0.5)
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_likely_branch_runs_alongside_decision(self):
+        """Test that a branch taken before starts with its deciding node."""
+        orchestrator = self.build(take_branch=True)
+
+        # No history yet: one half is not above the threshold
+        assert (await orchestrator.execute("task")).success
+        assert orchestrator.speculation_stats["speculated"] == 0
+        assert orchestrator.branch_probability("decide-review") == pytest.approx(2 / 3)
+
+        result = await orchestrator.execute("task")
+
+        assert result.success
+        assert set(result.result["completed_nodes"]) == {"decide", "review", "merge"}
+        stats = orchestrator.get_speculation_stats()
+        assert (stats["speculated"], stats["confirmed"], stats["discarded"]) == (1, 1, 0)
+        assert stats["saved_seconds"] > 0.03
+        nodes = orchestrator.nodes
+        assert nodes["review"].started_at < nodes["decide"].completed_at
+        # Targets of a speculative node wait for the condition
+        assert nodes["merge"].started_at >= nodes["decide"].completed_at
+
+    @pytest.mark.asyncio
+    async def test_branch_not_taken_is_discarded(self):
+        """Test that a speculative run is dropped when its condition fails."""
+        orchestrator = self.build(take_branch=False)
+        orchestrator.durations["review"] = 0.2
+        orchestrator.condition_history["decide-review"] = [4, 4]
+
+        result = await orchestrator.execute("task")
+
+        assert result.success
+        assert result.result["completed_nodes"] == ["decide"]
+        assert orchestrator.nodes["review"].status == NodeStatus.PENDING
+        assert orchestrator.nodes["merge"].started_at is None
+        stats = orchestrator.get_speculation_stats()
+        assert (stats["speculated"], stats["confirmed"], stats["discarded"]) == (1, 0, 1)
+        assert stats["wasted_seconds"] == pytest.approx(0.05, abs=0.03)
+        assert orchestrator.condition_history["decide-review"] == [4, 5]
+
+    @pytest.mark.asyncio
+    async def test_failed_speculation_reruns_when_taken(self):
+        """Test that a speculative failure is not final if the branch is taken."""
+        orchestrator = self.build(take_branch=True)
+        orchestrator.condition_history["decide-review"] = [4, 4]
+        run_agent = orchestrator._run_agent
+        calls = []
+
+        async def flaky(node, task):
+            calls.append(node.node_id)
+            if node.node_id == "review" and calls.count("review") == 1:
+                raise RuntimeError("flaky")
+            return await run_agent(node, task)
+
+        orchestrator._run_agent = flaky
+        result = await orchestrator.execute("task")
+
+        assert result.success
+        assert calls.count("review") == 2
+        assert orchestrator.speculation_stats["discarded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_only_gating_edges_are_speculated(self):
+        """Test that a target fed by its condition's source waits for that output."""
+        feeding = self.build(take_branch=True, gating=False)
+        gating = self.build(take_branch=True)
+        for orchestrator in (feeding, gating):
+            orchestrator.condition_history["decide-review"] = [4, 4]
+            assert (await orchestrator.execute("task")).success
+
+        assert feeding.speculation_stats["speculated"] == 0
+        assert feeding.nodes["review"].started_at >= feeding.nodes["decide"].completed_at
+        assert "Output from decide" in feeding._prepare_node_task("review", "task")
+        assert gating.speculation_stats["confirmed"] == 1
+        assert "Output from decide" not in gating._prepare_node_task("review", "task")
+
+    def test_rejects_gating_unconditional_edge(self):
+        """Test that only conditional edges can be gating."""
+        orchestrator = TimedGraphOrchestrator({"a": 0, "b": 0})
+        with pytest.raises(ValueError):
+            orchestrator.add_edge("a-b", "a", "b", gating=True)
+
+
+class TestJoinSemantics:
+    """Test cases for quorum, first-wins and reducing joins."""
+
+    def fan_out(self, durations, edge_type=EdgeType.SYNCHRONIZE):
+        """start -> each worker -> join -> after."""
+        orchestrator = TimedGraphOrchestrator({"start": 0, **durations, "join": 0.01, "after": 0.01})
+        for worker in durations:
+            orchestrator.add_edge(f"start-{worker}", "start", worker)
+            orchestrator.add_edge(f"{worker}-join", worker, "join", edge_type=edge_type)
+        chain(orchestrator, "join", "after")
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_quorum_join_skips_straggler(self):
+        """Test that a k-of-n join starts without waiting for the slowest input."""
+        orchestrator = self.fan_out({"a": 0.02, "b": 0.03, "slow": 1.0})
+        orchestrator.set_join("join", "quorum", quorum=2)
+
+        started = time.perf_counter()
+        result = await orchestrator.execute("task")
+        elapsed = time.perf_counter() - started
+
+        assert result.success
+        assert elapsed < 0.5
+        assert orchestrator.nodes["slow"].status == NodeStatus.SKIPPED
+        assert orchestrator.nodes["after"].status == NodeStatus.COMPLETED
+        assert orchestrator.nodes["join"].input_data["inputs"] == ["a", "b"]
+        join_task = orchestrator._prepare_node_task("join", "task")
+        assert "Output from a" in join_task and "Output from slow" not in join_task
+        assert orchestrator.get_execution_graph()["joins"]["join"]["skipped"] == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_quorum_join_over_branch_with_sequential_edges(self):
+        """Test that a skipped straggler's own edge into the join does not block it."""
+        orchestrator = self.fan_out({"a": 0.01, "b": 0.02, "slow": 1.0}, edge_type=EdgeType.SEQUENTIAL)
+        orchestrator.add_parallel_branch("fan", ["a", "b", "slow"], "join")
+        orchestrator.set_join("join", "quorum", quorum=2)
+
+        result = await orchestrator.execute("task")
+
+        assert result.success
+        assert orchestrator.nodes["slow"].status == NodeStatus.SKIPPED
+        assert orchestrator.nodes["join"].status == NodeStatus.COMPLETED
+        assert orchestrator.nodes["after"].status == NodeStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_stalled_run_fails(self):
+        """Test that a run ending with reachable nodes still pending is not a success."""
+        orchestrator = self.fan_out({"a": 0.01})
+        reset_schedule = orchestrator._reset_schedule
+
+        def reset_with_stuck_edge():
+            reset_schedule()
+            orchestrator._unmet["after"] += 1
+
+        orchestrator._reset_schedule = reset_with_stuck_edge
+        result = await orchestrator.execute("task")
+
+        assert not result.success
+        assert "after" in result.error
+        assert orchestrator.context.status == WorkflowStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_first_wins_on_parallel_branch(self):
+        """Test that a first-wins join over a branch can leave stragglers running."""
+        orchestrator = TimedGraphOrchestrator({"fast": 0.01, "slow": 0.1, "join": 0.01})
+        orchestrator.add_parallel_branch("race", ["fast", "slow"], "join")
+        orchestrator.set_join("join", "first", cancel_stragglers=False)
+
+        result = await orchestrator.execute("task")
+
+        assert result.success
+        nodes = orchestrator.nodes
+        assert nodes["join"].completed_at < nodes["slow"].completed_at
+        assert nodes["join"].input_data["output"] == {"fast": nodes["fast"].output_data}
+
+    @pytest.mark.asyncio
+    async def test_reducer_folds_inputs_as_they_arrive(self):
+        """Test that a reducing join aggregates inputs in completion order."""
+        orchestrator = self.fan_out({"c": 0.03, "a": 0.01, "b": 0.02})
+        orchestrator.set_join("join", reducer="concat")
+
+        assert (await orchestrator.execute("task")).success
+
+        join = orchestrator.joins["join"]
+        assert join.arrived == ["a", "b", "c"]
+        assert join.accumulator == "a: a\nb: b\nc: c"
+        assert "Joined output of a, b, c" in orchestrator._prepare_node_task("join", "task")
+
+    def test_rejects_invalid_join(self):
+        """Test that join settings are checked."""
+        orchestrator = TimedGraphOrchestrator({"join": 0})
+        with pytest.raises(ValueError):
+            orchestrator.set_join("join", "quorum")
+        with pytest.raises(ValueError):
+            orchestrator.set_join("join", reducer="median")
+
+
+class TestWorkflowHistory:
+    """Test cases for learning from earlier runs through the WorkflowManager."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_history(self, monkeypatch):
+        """Start every test with no recorded runs and sleeping agents."""
+        monkeypatch.setattr("agentmesh.orchestration.run_history._run_history", None)
+
+        async def run_agent(self, node, task):
+            await asyncio.sleep(0.1 if node.node_id == "long" else 0.02)
+            return {"result": node.node_id, "node_id": node.node_id, "approved": True}
+
+        monkeypatch.setattr(GraphOrchestrator, "_run_agent", run_agent)
+
+    @staticmethod
+    async def run(config):
+        """Run a workflow once through a manager without checkpoints."""
+        manager = WorkflowManager()
+        manager.checkpoint_store = None
+        workflow = await manager.create_workflow_from_config(config, {})
+        assert (await manager.execute_workflow(workflow, "task")).success
+        return workflow.orchestrator
+
+    @pytest.mark.asyncio
+    async def test_second_run_speculates(self):
+        """Test that branch outcomes of one run make the next one speculate."""
+        config = WorkflowConfigFile(
+            name="review", pattern=OrchestrationPattern.GRAPH, agents=["agent"],
+            graph={
+                "nodes": [{"id": "decide", "agent": "agent"}, {"id": "review", "agent": "agent"}],
+                "edges": [{
+                    "id": "decide-review", "source": "decide", "target": "review",
+                    "type": "conditional", "condition": "approved", "gating": True
+                }],
+                "conditions": {"approved": {"type": "approval"}},
+                "speculative": True
+            }
+        )
+
+        first = await self.run(config)
+        second = await self.run(config)
+
+        assert first is not second
+        assert first.speculation_stats["speculated"] == 0
+        assert second.speculation_stats["confirmed"] == 1
+        assert second.branch_probability("decide-review") == pytest.approx(3 / 4)
+
+    @pytest.mark.asyncio
+    async def test_second_run_schedules_by_earlier_durations(self):
+        """Test that critical-path scheduling uses durations from the previous run."""
+        node_ids = ["s1", "s2", "s3", "long"]
+        config = WorkflowConfigFile(
+            name="report", pattern=OrchestrationPattern.GRAPH, agents=["agent"],
+            graph={
+                "nodes": [{"id": node_id, "agent": "agent"} for node_id in node_ids],
+                "edges": [],
+                "max_concurrency": 1,
+                "scheduling": "critical_path"
+            }
+        )
+
+        first = await self.run(config)
+        second = await self.run(config)
+
+        def start_order(orchestrator):
+            return sorted(node_ids, key=lambda node_id: orchestrator.nodes[node_id].started_at)
+
+        # Nothing is known on the first run, so every node is estimated alike
+        assert start_order(first)[-1] == "long"
+        assert start_order(second)[0] == "long"
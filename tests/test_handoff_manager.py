@@ -0,0 +1,258 @@
+"""Test the Redis-backed HandoffManager."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from agentmesh.core.context_manager import ContextManager
+from agentmesh.core.handoff_manager import HandoffManager, HandoffReason, HandoffStatus
+from agentmesh.messaging.message_bus import MessageBus
+
+
+def make_handoff_manager(server):
+    """Create a HandoffManager whose stores share one fake Redis server."""
+    manager = HandoffManager()
+    manager.redis_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    manager.message_bus = MessageBus()
+    manager.message_bus.redis_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    manager.context_manager = ContextManager()
+    manager.context_manager.redis_client = fakeredis.FakeAsyncRedis(
+        server=server, decode_responses=True
+    )
+    return manager
+
+
+@pytest.fixture
+def server():
+    """Create a fake Redis server shared by several clients."""
+    return fakeredis.FakeServer()
+
+
+@pytest_asyncio.fixture
+async def handoff_manager(server):
+    """Create a HandoffManager backed by an in-process fake Redis."""
+    manager = make_handoff_manager(server)
+    yield manager
+    await manager.redis_client.aclose()
+
+
+async def initiate(manager, to_agent_id="bob", priority=0, **kwargs):
+    """Initiate a handoff from alice."""
+    return await manager.initiate_handoff(
+        "alice", to_agent_id, HandoffReason.MANUAL, "please take over",
+        priority=priority, **kwargs
+    )
+
+
+class TestClaimHandoff:
+    """Test cases for claiming pending handoffs."""
+
+    @pytest.mark.asyncio
+    async def test_claims_highest_priority_first(self, handoff_manager):
+        """Test that claims come out in priority order and mark the handoff claimed."""
+        low = await initiate(handoff_manager, priority=1)
+        high = await initiate(handoff_manager, priority=9)
+
+        first = await handoff_manager.claim_next_handoff("bob")
+        second = await handoff_manager.claim_next_handoff("bob")
+
+        assert [first.id, second.id] == [high.id, low.id]
+        assert await handoff_manager.claim_next_handoff("bob") is None
+        assert await handoff_manager.get_pending_handoffs("bob") == []
+        audit = await handoff_manager.get_handoff_audit(high.id)
+        assert [entry.event_type for entry in audit] == ["created", "claimed"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_workers_never_share_a_handoff(self, server, handoff_manager):
+        """Test that racing workers claim disjoint handoffs."""
+        created = {(await initiate(handoff_manager, priority=i)).id for i in range(20)}
+        workers = [make_handoff_manager(server) for _ in range(4)]
+
+        async def drain(worker):
+            claimed = []
+            while (handoff := await worker.claim_next_handoff("bob")) is not None:
+                claimed.append(handoff.id)
+            return claimed
+
+        results = await asyncio.gather(*[drain(worker) for worker in workers])
+
+        claimed = [handoff_id for result in results for handoff_id in result]
+        assert len(claimed) == len(set(claimed)) == 20
+        assert set(claimed) == created
+
+    @pytest.mark.asyncio
+    async def test_blocking_claim_wakes_on_new_handoff(self, server, handoff_manager):
+        """Test that an idle agent picks up a handoff as soon as it is initiated."""
+        claim = asyncio.create_task(handoff_manager.claim_next_handoff("bob", timeout=2))
+        await asyncio.sleep(0.05)
+
+        created = await initiate(make_handoff_manager(server))
+        claimed = await asyncio.wait_for(claim, timeout=1)
+
+        assert claimed.id == created.id
+
+    @pytest.mark.asyncio
+    async def test_expired_handoffs_are_skipped(self, handoff_manager):
+        """Test that an expired handoff is marked expired instead of claimed."""
+        stale = await initiate(handoff_manager, priority=9, expires_in_minutes=1)
+        fresh = await initiate(handoff_manager, priority=1)
+        stale.expires_at = stale.created_at
+        await handoff_manager.redis_client.hset(
+            "handoff_requests", stale.id, handoff_manager.codec.encode(stale)
+        )
+        await handoff_manager.redis_client.zadd(
+            "handoff_expiry", {stale.id: handoff_manager._expiry_score(stale.expires_at)}
+        )
+
+        claimed = await handoff_manager.claim_next_handoff("bob")
+
+        assert claimed.id == fresh.id
+        status = await handoff_manager.redis_client.hget("handoff_status", stale.id)
+        assert HandoffStatus.EXPIRED in status
+
+
+class TestHandoffHistory:
+    """Test cases for the per-agent handoff history index."""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_history_once_newest_first(self, handoff_manager):
+        """Test that cursor pagination returns every handoff exactly once."""
+        created = [(await initiate(handoff_manager)).id for _ in range(7)]
+        await initiate(handoff_manager, to_agent_id="carol")
+
+        pages, cursor = [], None
+        while True:
+            page, cursor = await handoff_manager.get_handoff_history_page("bob", 3, cursor)
+            pages.append([summary.handoff_id for summary in page])
+            if cursor is None:
+                break
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [handoff_id for page in pages for handoff_id in page] == created[::-1]
+
+    @pytest.mark.asyncio
+    async def test_ties_on_created_at_are_not_skipped(self, handoff_manager):
+        """Test that handoffs with the same timestamp straddle pages correctly."""
+        created = {(await initiate(handoff_manager)).id for _ in range(5)}
+        await handoff_manager.redis_client.zadd(
+            "handoff_history:bob", {handoff_id: 100.0 for handoff_id in created}
+        )
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = await handoff_manager.get_handoff_history_page("bob", 2, cursor)
+            seen.extend(summary.handoff_id for summary in page)
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert set(seen) == created
+
+    @pytest.mark.asyncio
+    async def test_history_includes_status_and_both_agents(self, handoff_manager):
+        """Test that summaries carry the status and appear for both agents."""
+        handoff = await initiate(handoff_manager)
+        await handoff_manager.respond_to_handoff(handoff.id, "bob", accepted=False)
+
+        for agent_id in ("alice", "bob"):
+            history = await handoff_manager.get_handoff_history(agent_id)
+            assert [(s.handoff_id, s.status) for s in history] == [
+                (handoff.id, HandoffStatus.REJECTED)
+            ]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_indexes_existing_handoffs(self, handoff_manager):
+        """Test that handoffs stored before the index existed are backfilled."""
+        handoff = await initiate(handoff_manager)
+        await handoff_manager.redis_client.delete("handoff_history:alice", "handoff_history:bob")
+
+        assert await handoff_manager.rebuild_history_index() == 2
+        assert await handoff_manager.rebuild_history_index() == 0
+
+        history = await handoff_manager.get_handoff_history("bob")
+        assert [s.handoff_id for s in history] == [handoff.id]
+
+
+class TestHandoffExpiry:
+    """Test cases for the background handoff expiry scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_due_handoffs_are_expired_in_bulk(self, handoff_manager):
+        """Test that a sweep expires unanswered handoffs and notifies initiators."""
+        expiring = [await initiate(handoff_manager, expires_in_minutes=5) for _ in range(3)]
+        answered = await initiate(handoff_manager, expires_in_minutes=5)
+        await handoff_manager.respond_to_handoff(answered.id, "bob", accepted=False)
+        later = await initiate(handoff_manager, expires_in_minutes=120)
+
+        expired = await handoff_manager.expire_due_handoffs(
+            now=datetime.utcnow() + timedelta(minutes=10)
+        )
+
+        assert expired == 3
+        assert [h.id for h in await handoff_manager.get_pending_handoffs("bob")] == [later.id]
+        for handoff in expiring:
+            audit = await handoff_manager.get_handoff_audit(handoff.id)
+            assert audit[-1].event_type == "expired"
+        summaries = {s.handoff_id: s.status for s in await handoff_manager.get_handoff_history("bob")}
+        assert summaries[answered.id] == HandoffStatus.REJECTED
+
+        notices = await handoff_manager.message_bus.get_agent_messages("alice")
+        assert sum(m.metadata.get("response_type") == "handoff_expired" for m in notices) == 3
+
+        stats = handoff_manager.get_expiry_stats()
+        assert stats["handoffs_expired"] == 3
+        assert stats["backlog"] == 0
+        assert stats["scheduled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_schedulers_expire_each_handoff_once(self, server, handoff_manager):
+        """Test that schedulers in several processes do not double-expire."""
+        created = [await initiate(handoff_manager, expires_in_minutes=5) for _ in range(20)]
+        workers = [make_handoff_manager(server) for _ in range(3)]
+        now = datetime.utcnow() + timedelta(minutes=10)
+
+        counts = await asyncio.gather(*[worker.expire_due_handoffs(now=now) for worker in workers])
+
+        assert sum(counts) == 20
+        for handoff in created:
+            audit = await handoff_manager.get_handoff_audit(handoff.id)
+            assert [entry.event_type for entry in audit].count("expired") == 1
+
+    @pytest.mark.asyncio
+    async def test_backfill_schedules_existing_handoffs(self, handoff_manager):
+        """Test that handoffs initiated before the expiry index get scheduled."""
+        handoff = await initiate(handoff_manager, expires_in_minutes=5)
+        await handoff_manager.redis_client.delete("handoff_expiry")
+
+        assert await handoff_manager.backfill_expiry_index() == 1
+        assert await handoff_manager.backfill_expiry_index() == 0
+        assert await handoff_manager.expire_due_handoffs(
+            now=datetime.utcnow() + timedelta(minutes=10)
+        ) == 1
+        assert await handoff_manager.claim_next_handoff("bob") is None
+        audit = await handoff_manager.get_handoff_audit(handoff.id)
+        assert audit[-1].event_type == "expired"
+
+    @pytest.mark.asyncio
+    async def test_claimed_handoffs_do_not_expire(self, handoff_manager):
+        """Test that a sweep leaves a handoff alone while a worker holds it."""
+        handoff = await initiate(handoff_manager, expires_in_minutes=5)
+        assert (await handoff_manager.claim_next_handoff("bob")).id == handoff.id
+        later = datetime.utcnow() + timedelta(minutes=10)
+
+        assert await handoff_manager.redis_client.zscore("handoff_expiry", handoff.id) is None
+        assert await handoff_manager.expire_due_handoffs(now=later) == 0
+        # Claimed before claims left the expiry index
+        await handoff_manager.redis_client.zadd(
+            "handoff_expiry", {handoff.id: handoff_manager._expiry_score(handoff.expires_at)}
+        )
+        assert await handoff_manager.expire_due_handoffs(now=later) == 0
+
+        status = await handoff_manager.redis_client.hget("handoff_status", handoff.id)
+        assert HandoffStatus.CLAIMED in status
+        notices = await handoff_manager.message_bus.get_agent_messages("alice")
+        assert not any(m.metadata.get("response_type") == "handoff_expired" for m in notices)
@@ -0,0 +1,487 @@
+"""Test the Redis-backed MessageBus."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from agentmesh.messaging.message_bus import (
+    AGENT_MESSAGES_LIMIT,
+    CONVERSATION_HISTORY_LIMIT,
+    MessageBus,
+    Message,
+    MessageType,
+)
+
+
+class CountingConnection(fakeredis.FakeAsyncRedisConnection):
+    """Fake connection that counts client -> server round trips."""
+
+    round_trips = 0
+
+    async def send_packed_command(self, command, check_health=True):
+        CountingConnection.round_trips += 1
+        await super().send_packed_command(command, check_health)
+
+
+@pytest.fixture
+def message_bus():
+    """Create a MessageBus backed by an in-process fake Redis."""
+    bus = MessageBus()
+    bus.redis_client = fakeredis.FakeAsyncRedis(
+        decode_responses=True,
+        connection_class=CountingConnection,
+    )
+    CountingConnection.round_trips = 0
+    return bus
+
+
+class TestSendMessage:
+    """Test cases for the single-message write path."""
+
+    @pytest.mark.asyncio
+    async def test_send_message_stores_and_indexes(self, message_bus):
+        """Test that a sent message is stored, indexed and added to history."""
+        result = await message_bus.send_message("alice", "bob", "hello")
+
+        assert result.success is True
+        redis_client = message_bus.redis_client
+
+        stored = await redis_client.hget("messages", result.message_id)
+        assert Message(**json.loads(stored)).content == "hello"
+        assert await redis_client.lrange("agent_messages:alice", 0, -1) == [result.message_id]
+        assert await redis_client.lrange("agent_messages:bob", 0, -1) == [result.message_id]
+        assert await redis_client.lrange("conversation:alice:bob", 0, -1) == [result.message_id]
+
+    @pytest.mark.asyncio
+    async def test_send_message_is_single_round_trip(self, message_bus):
+        """Test that store, index, publish and trim share one round trip."""
+        await message_bus.redis_client.ping()  # open the connection first
+        CountingConnection.round_trips = 0
+
+        await message_bus.send_message("alice", "bob", "hello")
+
+        assert CountingConnection.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_send_message_publishes_to_receiver(self, message_bus):
+        """Test that the receiver channel gets the message payload."""
+        pubsub = message_bus.redis_client.pubsub()
+        await pubsub.subscribe("agent:bob")
+        await pubsub.get_message(timeout=0.1)  # subscribe confirmation
+
+        result = await message_bus.send_message("alice", "bob", "hello")
+
+        published = None
+        for _ in range(10):
+            published = await pubsub.get_message(timeout=0.1)
+            if published:
+                break
+        await pubsub.aclose()
+
+        assert published is not None
+        assert json.loads(published["data"])["id"] == result.message_id
+
+    @pytest.mark.asyncio
+    async def test_conversation_history_is_trimmed(self, message_bus):
+        """Test that conversation lists are capped."""
+        conv_key = "conversation:alice:bob"
+        await message_bus.redis_client.rpush(
+            conv_key, *[f"old-{i}" for i in range(CONVERSATION_HISTORY_LIMIT)]
+        )
+
+        result = await message_bus.send_message("alice", "bob", "hello")
+
+        history = await message_bus.redis_client.lrange(conv_key, 0, -1)
+        assert len(history) == CONVERSATION_HISTORY_LIMIT
+        assert history[0] == result.message_id
+
+    @pytest.mark.asyncio
+    async def test_conversation_history_round_trip(self, message_bus):
+        """Test that sent messages are returned by the history reader."""
+        for i in range(3):
+            await message_bus.send_message("alice", "bob", f"msg-{i}")
+
+        history = await message_bus.get_conversation_history("bob", "alice")
+
+        assert [m.content for m in history] == ["msg-0", "msg-1", "msg-2"]
+
+    @pytest.mark.asyncio
+    async def test_send_messages_is_single_round_trip(self, message_bus):
+        """Test that a batch of direct messages is stored and delivered at once."""
+        await message_bus.redis_client.ping()
+        CountingConnection.round_trips = 0
+        messages = [
+            Message(
+                id=f"msg-{i}",
+                sender_id="system",
+                receiver_id=f"agent-{i}",
+                message_type=MessageType.SYSTEM,
+                content="notice",
+                timestamp=datetime.utcnow(),
+            )
+            for i in range(5)
+        ]
+
+        results = await message_bus.send_messages(messages)
+
+        assert all(result.success for result in results)
+        assert CountingConnection.round_trips == 1
+        assert await message_bus.redis_client.lrange("agent_messages:agent-3", 0, -1) == ["msg-3"]
+
+
+class TestBroadcastMessage:
+    """Test cases for group broadcast fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_stores_payload_once(self, message_bus):
+        """Test that a broadcast is stored once and indexed per member."""
+        for agent_id in ("alice", "bob", "carol"):
+            await message_bus.add_agent_to_group(agent_id, "team")
+
+        results = await message_bus.broadcast_message("alice", "team", "standup")
+
+        assert sorted(r.receiver_id for r in results) == ["bob", "carol"]
+        assert all(r.success for r in results)
+        assert len({r.message_id for r in results}) == 1
+
+        redis_client = message_bus.redis_client
+        assert await redis_client.hlen("messages") == 1
+        for member_id in ("bob", "carol"):
+            assert await redis_client.lrange(f"agent_messages:{member_id}", 0, -1) == [
+                results[0].message_id
+            ]
+
+        history = await message_bus.get_conversation_history("alice", "carol")
+        assert [m.content for m in history] == ["standup"]
+        assert history[0].group_id == "team"
+        assert history[0].metadata["broadcast_id"] == results[0].message_id
+
+    @pytest.mark.asyncio
+    async def test_broadcast_round_trips_independent_of_group_size(self, message_bus):
+        """Test that fan-out uses a constant number of round trips."""
+        for i in range(50):
+            await message_bus.add_agent_to_group(f"agent-{i}", "big")
+        CountingConnection.round_trips = 0
+
+        results = await message_bus.broadcast_message("agent-0", "big", "hi")
+
+        assert len(results) == 49
+        assert CountingConnection.round_trips == 2  # SMEMBERS + one pipeline
+
+    @pytest.mark.asyncio
+    async def test_broadcast_to_empty_group(self, message_bus):
+        """Test that broadcasting to an empty group returns no results."""
+        assert await message_bus.broadcast_message("alice", "nobody", "hi") == []
+
+
+class TestHistoryPagination:
+    """Test cases for bulk history hydration and cursor pagination."""
+
+    @pytest.mark.asyncio
+    async def test_page_backwards_with_before_cursor(self, message_bus):
+        """Test paging through a deep conversation with `before`."""
+        for i in range(120):
+            await message_bus.send_message("alice", "bob", f"msg-{i}")
+
+        pages = []
+        cursor = None
+        while True:
+            page = await message_bus.get_conversation_history(
+                "alice", "bob", limit=50, before=cursor
+            )
+            if not page:
+                break
+            pages.append([m.content for m in page])
+            cursor = page[0].id
+
+        assert [len(p) for p in pages] == [50, 50, 20]
+        assert pages[0][-1] == "msg-119"
+        assert pages[-1][0] == "msg-0"
+
+    @pytest.mark.asyncio
+    async def test_page_forwards_with_after_cursor(self, message_bus):
+        """Test fetching messages newer than a cursor."""
+        results = [
+            await message_bus.send_message("alice", "bob", f"msg-{i}") for i in range(10)
+        ]
+
+        page = await message_bus.get_agent_messages(
+            "bob", limit=3, after=results[4].message_id
+        )
+
+        assert [m.content for m in page] == ["msg-5", "msg-6", "msg-7"]
+
+    @pytest.mark.asyncio
+    async def test_newest_message_has_nothing_after(self, message_bus):
+        """Test that the newest message cursor yields an empty page."""
+        result = await message_bus.send_message("alice", "bob", "only")
+
+        assert await message_bus.get_agent_messages("bob", after=result.message_id) == []
+
+    @pytest.mark.asyncio
+    async def test_page_round_trips_independent_of_page_size(self, message_bus):
+        """Test that a deep page costs a constant number of round trips."""
+        for i in range(200):
+            await message_bus.send_message("alice", "bob", f"msg-{i}")
+        cursor = (await message_bus.get_conversation_history("alice", "bob", limit=1))[0].id
+        CountingConnection.round_trips = 0
+
+        page = await message_bus.get_conversation_history(
+            "alice", "bob", limit=150, before=cursor
+        )
+
+        assert len(page) == 150
+        assert CountingConnection.round_trips == 3  # LPOS + LRANGE + HMGET
+
+    @pytest.mark.asyncio
+    async def test_unknown_cursor_returns_empty_page(self, message_bus):
+        """Test that a cursor not in the list returns nothing."""
+        await message_bus.send_message("alice", "bob", "hello")
+
+        assert await message_bus.get_agent_messages("bob", before="missing") == []
+
+
+@pytest.fixture
+def stream_bus(message_bus):
+    """Switch the fake-Redis MessageBus to the Redis Streams transport."""
+    from agentmesh.messaging.streams import StreamTransport
+
+    settings = message_bus.settings.model_copy(
+        update={"message_transport": "streams", "stream_block_ms": 1, "stream_claim_idle_ms": 0}
+    )
+    message_bus.stream_transport = StreamTransport(settings)
+    return message_bus
+
+
+async def _drain(bus, agent_id, consumer_name=None, fail=False, reclaim=False):
+    """Run one consumer iteration over an agent inbox and return the contents."""
+    received = []
+
+    async def callback(payload):
+        if fail:
+            raise RuntimeError("consumer crashed")
+        received.append(Message.model_validate_json(payload).content)
+
+    transport = bus.stream_transport
+    await transport.ensure_group(bus.redis_client, agent_id)
+    await transport.read_batch(
+        bus.redis_client,
+        agent_id,
+        callback,
+        consumer_name=consumer_name,
+        claim_cursor="0-0" if reclaim else None,
+    )
+    return received
+
+
+class TestStreamTransport:
+    """Test cases for the Redis Streams delivery transport."""
+
+    @pytest.mark.asyncio
+    async def test_messages_sent_while_offline_are_delivered(self, stream_bus):
+        """Test that messages queued before subscribing are not lost."""
+        for i in range(3):
+            await stream_bus.send_message("alice", "bob", f"msg-{i}")
+
+        received = await _drain(stream_bus, "bob")
+
+        assert received == ["msg-0", "msg-1", "msg-2"]
+        assert await stream_bus.stream_transport.pending_count(stream_bus.redis_client, "bob") == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_is_capped(self, stream_bus):
+        """Test that inbox streams are trimmed to roughly stream_maxlen."""
+        stream_bus.stream_transport.maxlen = 5
+        for i in range(50):
+            await stream_bus.send_message("alice", "bob", f"msg-{i}")
+
+        assert await stream_bus.redis_client.xlen("agent_stream:bob") < 50
+
+    @pytest.mark.asyncio
+    async def test_failed_entries_are_reclaimed(self, stream_bus):
+        """Test that entries a consumer failed on are redelivered to another."""
+        await stream_bus.send_message("alice", "bob", "retry-me")
+
+        assert await _drain(stream_bus, "bob", consumer_name="a", fail=True) == []
+        assert await stream_bus.stream_transport.pending_count(stream_bus.redis_client, "bob") == 1
+
+        assert await _drain(stream_bus, "bob", consumer_name="b") == []  # nothing new
+        received = await _drain(stream_bus, "bob", consumer_name="b", reclaim=True)
+
+        assert received == ["retry-me"]
+        assert await stream_bus.stream_transport.pending_count(stream_bus.redis_client, "bob") == 0
+
+    @pytest.mark.asyncio
+    async def test_consumers_in_group_do_not_duplicate(self, stream_bus):
+        """Test that two workers on one inbox split the entries between them."""
+        await stream_bus.stream_transport.ensure_group(stream_bus.redis_client, "bob")
+        for i in range(20):
+            await stream_bus.send_message("alice", "bob", f"msg-{i}")
+        stream_bus.stream_transport.batch_size = 5
+
+        received = []
+        for _ in range(2):
+            received += await _drain(stream_bus, "bob", consumer_name="a")
+            received += await _drain(stream_bus, "bob", consumer_name="b")
+
+        assert sorted(received) == sorted(f"msg-{i}" for i in range(20))
+        assert await stream_bus.stream_transport.pending_count(stream_bus.redis_client, "bob") == 0
+
+
+class TestSharedSubscriber:
+    """Test cases for the multiplexed pub/sub subscriber."""
+
+    @pytest_asyncio.fixture
+    async def subscriber_bus(self, message_bus):
+        """Yield a MessageBus with small per-subscription queues."""
+        message_bus.settings = message_bus.settings.model_copy(
+            update={"subscriber_queue_size": 3}
+        )
+        yield message_bus
+        await message_bus.disconnect()
+
+    @staticmethod
+    async def _next(subscription):
+        return Message.model_validate_json(
+            await asyncio.wait_for(subscription.get(), timeout=1.0)
+        )
+
+    @pytest.mark.asyncio
+    async def test_dispatches_to_each_agent(self, subscriber_bus):
+        """Test that agents sharing the connection only see their own messages."""
+        bob = await subscriber_bus.open_subscription("bob")
+        carol = await subscriber_bus.open_subscription("carol")
+
+        await subscriber_bus.send_message("alice", "bob", "for bob")
+        await subscriber_bus.send_message("alice", "carol", "for carol")
+
+        assert (await self._next(bob)).content == "for bob"
+        assert (await self._next(carol)).content == "for carol"
+        assert bob.queue.empty() and carol.queue.empty()
+
+        stats = subscriber_bus.shared_subscriber.get_stats()
+        assert stats["channels"] == 2
+        assert stats["delivered"] == 2
+
+    @pytest.mark.asyncio
+    async def test_uses_one_connection_for_all_channels(self, subscriber_bus):
+        """Test that many agent subscriptions share one pub/sub connection."""
+        for i in range(20):
+            await subscriber_bus.open_subscription(f"agent-{i}")
+
+        numsub = dict(await subscriber_bus.redis_client.pubsub_numsub(
+            *[f"agent:agent-{i}" for i in range(20)]
+        ))
+        assert set(numsub.values()) == {1}
+        assert subscriber_bus.shared_subscriber.pubsub is not None
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_drops_oldest(self, subscriber_bus):
+        """Test that a full queue evicts the oldest payloads."""
+        bob = await subscriber_bus.open_subscription("bob")
+        for i in range(5):
+            await subscriber_bus.send_message("alice", "bob", f"msg-{i}")
+
+        for _ in range(50):
+            if bob.delivered == 5:
+                break
+            await asyncio.sleep(0.01)
+
+        assert bob.dropped == 2
+        assert [(await self._next(bob)).content for _ in range(3)] == [
+            "msg-2", "msg-3", "msg-4"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_last_close_unsubscribes_channel(self, subscriber_bus):
+        """Test that the channel is released once no subscription uses it."""
+        first = await subscriber_bus.open_subscription("bob")
+        second = await subscriber_bus.open_subscription("bob")
+        redis_client = subscriber_bus.redis_client
+
+        await subscriber_bus.close_subscription(first)
+        assert dict(await redis_client.pubsub_numsub("agent:bob"))["agent:bob"] == 1
+
+        await subscriber_bus.close_subscription(second)
+        assert dict(await redis_client.pubsub_numsub("agent:bob"))["agent:bob"] == 0
+        assert subscriber_bus.shared_subscriber.get_stats()["channels"] == 0
+
+
+class TestRetention:
+    """Test cases for message retention and compaction."""
+
+    @pytest.mark.asyncio
+    async def test_compact_deletes_only_expired_messages(self, message_bus):
+        """Test that messages older than the retention window are reclaimed."""
+        old = await message_bus.send_message("alice", "bob", "old")
+        recent = await message_bus.send_message("alice", "bob", "recent")
+        retention = timedelta(hours=message_bus.settings.message_retention_hours)
+        # Age the first message past the retention window
+        await message_bus.redis_client.zadd(
+            "messages_by_time",
+            {old.message_id: message_bus.compactor.score(datetime.utcnow() - retention * 2)},
+        )
+
+        result = await message_bus.compactor.compact(message_bus.redis_client)
+
+        assert result["messages_reclaimed"] == 1
+        assert result["bytes_reclaimed"] > 0
+        assert await message_bus.redis_client.hkeys("messages") == [recent.message_id]
+        history = await message_bus.get_conversation_history("alice", "bob")
+        assert [m.content for m in history] == ["recent"]
+        assert message_bus.get_retention_stats()["messages_reclaimed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_compact_runs_in_batches(self, message_bus):
+        """Test that compaction drains more messages than one batch."""
+        message_bus.compactor.batch_size = 10
+        for i in range(25):
+            await message_bus.send_message("alice", "bob", f"msg-{i}")
+
+        future = datetime.utcnow() + timedelta(hours=message_bus.settings.message_retention_hours + 1)
+        result = await message_bus.compactor.compact(message_bus.redis_client, now=future)
+
+        assert result["messages_reclaimed"] == 25
+        assert await message_bus.redis_client.hlen("messages") == 0
+        assert await message_bus.redis_client.zcard("messages_by_time") == 0
+
+    @pytest.mark.asyncio
+    async def test_backfill_indexes_legacy_messages(self, message_bus):
+        """Test that messages stored without an index entry get one."""
+        result = await message_bus.send_message("alice", "bob", "legacy")
+        await message_bus.redis_client.delete("messages_by_time")
+
+        indexed = await message_bus.compactor.backfill_index(
+            message_bus.redis_client, message_bus.decode_message
+        )
+
+        assert indexed == 1
+        assert await message_bus.redis_client.zscore("messages_by_time", result.message_id)
+
+        # Later startups skip the scan unless forced
+        await message_bus.redis_client.delete("messages_by_time")
+        assert await message_bus.compactor.backfill_index(
+            message_bus.redis_client, message_bus.decode_message
+        ) == 0
+        assert await message_bus.compactor.backfill_index(
+            message_bus.redis_client, message_bus.decode_message, force=True
+        ) == 1
+
+    @pytest.mark.asyncio
+    async def test_agent_lists_are_capped_and_expire(self, message_bus):
+        """Test that per-agent lists are trimmed and carry a TTL."""
+        list_key = "agent_messages:bob"
+        await message_bus.redis_client.rpush(
+            list_key, *[f"old-{i}" for i in range(AGENT_MESSAGES_LIMIT)]
+        )
+
+        await message_bus.send_message("alice", "bob", "hello")
+
+        assert await message_bus.redis_client.llen(list_key) == AGENT_MESSAGES_LIMIT
+        assert await message_bus.redis_client.ttl(list_key) > 0
+        assert await message_bus.redis_client.ttl("conversation:alice:bob") > 0
@@ -0,0 +1,173 @@
+"""Test memoization of agent results across workflow runs."""
+
+import asyncio
+import time
+
+import pytest
+
+from agentmesh.orchestration.base import OrchestrationPattern, WorkflowConfig
+from agentmesh.orchestration.graph import GraphOrchestrator
+from agentmesh.orchestration.result_cache import MISSING, ResultCache
+from agentmesh.orchestration.sequential import SequentialOrchestrator
+from agentmesh.workflows.manager import WorkflowExecution
+
+
+class CountingGraphOrchestrator(GraphOrchestrator):
+    """Graph orchestrator whose agents echo their task and count calls."""
+
+    def __init__(self, cache: ResultCache, calls: list):
+        super().__init__(WorkflowConfig(
+            name="cached", pattern=OrchestrationPattern.GRAPH, agents=["agent"], cache_results=True
+        ))
+        self.result_cache = cache
+        self.calls = calls
+        for node_id in ["fetch", "summarize", "translate"]:
+            self.add_node(node_id, "agent", max_retries=1)
+        self.add_edge("fetch-summarize", "fetch", "summarize")
+        self.add_edge("summarize-translate", "summarize", "translate")
+
+    async def _run_agent(self, node, task):
+        self.calls.append(node.node_id)
+        await asyncio.sleep(0.01)
+        # Real agent output varies between calls, like this timestamp
+        return {"result": f"{node.node_id}: {task[:20]}", "at": time.perf_counter()}
+
+
+class StubAgentManager:
+    """Agent manager that knows every agent."""
+
+    async def get_agent(self, agent_id):
+        return {"id": agent_id}
+
+
+class TestResultCache:
+    """Test cases for the result cache itself."""
+
+    def test_key_covers_agent_task_and_inputs(self):
+        """Test that every part of an agent call changes its key."""
+        key = ResultCache.make_key({"model": "gpt-4o"}, "task", {"a": {"result": 1}})
+
+        assert key == ResultCache.make_key({"model": "gpt-4o"}, "task", {"a": {"result": 1}})
+        assert key != ResultCache.make_key({"model": "gpt-4o-mini"}, "task", {"a": {"result": 1}})
+        assert key != ResultCache.make_key({"model": "gpt-4o"}, "other task", {"a": {"result": 1}})
+        assert key != ResultCache.make_key({"model": "gpt-4o"}, "task", {"a": {"result": 2}})
+
+    def test_lru_eviction_and_ttl(self):
+        """Test that the cache stays bounded and forgets expired results."""
+        cache = ResultCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", {"result": "a"})
+        cache.put("b", {"result": "b"})
+        cache.get("a")
+        cache.put("c", {"result": "c"})
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == {"result": "a"}
+        assert cache.evictions == 1
+
+        cache.ttl_seconds = 0
+        cache.put("d", {"result": "d"})
+        assert cache.get("d") is MISSING
+
+    def test_cached_results_are_copies(self):
+        """Test that changing a returned result does not change the cache."""
+        cache = ResultCache()
+        result = {"result": "x", "items": [1]}
+        cache.put("k", result)
+        result["items"].append(2)
+        cache.get("k")["items"].append(3)
+
+        assert cache.get("k") == {"result": "x", "items": [1]}
+
+
+class TestWorkflowMemoization:
+    """Test cases for orchestrators reusing cached results."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_graph_run_skips_agent_calls(self):
+        """Test that a second identical graph run is served from the cache."""
+        cache, calls = ResultCache(), []
+
+        first = await CountingGraphOrchestrator(cache, calls).execute("translate the report")
+        assert calls == ["fetch", "summarize", "translate"]
+
+        calls.clear()
+        repeat = CountingGraphOrchestrator(cache, calls)
+        second = await repeat.execute("translate the report")
+
+        assert calls == []
+        assert {node_id: output["result"] for node_id, output in second.result["outputs"].items()} == {
+            node_id: output["result"] for node_id, output in first.result["outputs"].items()
+        }
+        assert repeat.cached_nodes == {"fetch", "summarize", "translate"}
+        assert repeat.get_cache_stats()["hit_rate"] == 1.0
+        # Cached nodes do not feed the duration history
+        assert repeat.duration_history == {}
+
+        calls.clear()
+        changed = CountingGraphOrchestrator(cache, calls)
+        await changed.execute("translate the memo")
+        assert calls == ["fetch", "summarize", "translate"]
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_reports_its_own_node(self):
+        """Test that a node served from another node's result keeps its own envelope."""
+        cache, calls = ResultCache(), []
+        first = CountingGraphOrchestrator(cache, calls)
+        await first.execute("translate the report")
+
+        other = GraphOrchestrator(WorkflowConfig(
+            name="other", pattern=OrchestrationPattern.GRAPH, agents=["agent"], cache_results=True
+        ))
+        other.result_cache = cache
+        other.add_node("fetch-again", "agent", max_retries=1)
+        result = await other.execute("translate the report")
+
+        output = result.result["outputs"]["fetch-again"]
+        assert other.cached_nodes == {"fetch-again"}
+        assert output["result"] == first.nodes["fetch"].output_data["result"]
+        assert output["node_id"] == "fetch-again"
+        # Rebuilt for this node, not replayed from the run that produced it
+        assert "at" not in output
+
+    @pytest.mark.asyncio
+    async def test_sequential_run_reuses_results(self, monkeypatch):
+        """Test that a repeated sequential workflow reports its hit rate."""
+        calls = []
+
+        async def simulate(self, agent_id, message, context):
+            calls.append(agent_id)
+            return f"{agent_id} handled {message.content}"
+
+        monkeypatch.setattr(SequentialOrchestrator, "_simulate_agent_execution", simulate)
+        cache = ResultCache()
+
+        def workflow():
+            config = WorkflowConfig(
+                name="pipeline",
+                pattern=OrchestrationPattern.SEQUENTIAL,
+                agents=["architect", "developer"],
+                cache_results=True
+            )
+            orchestrator = SequentialOrchestrator(config)
+            orchestrator.agent_manager = StubAgentManager()
+            orchestrator.result_cache = cache
+            return WorkflowExecution(config, orchestrator)
+
+        first = await workflow().execute("build a parser")
+        repeat = workflow()
+        second = await repeat.execute("build a parser")
+
+        assert calls == ["architect", "developer"]
+        assert second.result == first.result
+        info = await repeat.get_execution_info()
+        assert info["result_cache"] == {"enabled": True, "hits": 2, "misses": 0, "hit_rate": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_cache_is_opt_in(self):
+        """Test that workflows do not cache unless configured to."""
+        orchestrator = GraphOrchestrator(WorkflowConfig(
+            name="plain", pattern=OrchestrationPattern.GRAPH, agents=[]
+        ))
+
+        assert orchestrator.result_cache is None
+        assert orchestrator.get_cache_stats()["enabled"] is False
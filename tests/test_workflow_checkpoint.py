@@ -0,0 +1,127 @@
+"""Test checkpointing and resuming graph workflow runs."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from agentmesh.orchestration.base import OrchestrationPattern, WorkflowStatus
+from agentmesh.orchestration.graph import GraphOrchestrator
+from agentmesh.workflows.checkpoint import WorkflowCheckpointStore
+from agentmesh.workflows.config import WorkflowConfigFile
+from agentmesh.workflows.manager import WorkflowManager
+
+STEPS = ["research", "outline", "draft", "edit", "publish"]
+
+
+def pipeline_config() -> WorkflowConfigFile:
+    """A five-step graph workflow."""
+    return WorkflowConfigFile(
+        name="pipeline",
+        pattern=OrchestrationPattern.GRAPH,
+        agents=["writer", "editor"],
+        graph={
+            "nodes": [
+                {"id": step, "agent": "editor" if step == "edit" else "writer"}
+                for step in STEPS
+            ],
+            "edges": [
+                {"id": f"{source}-{target}", "source": source, "target": target}
+                for source, target in zip(STEPS, STEPS[1:])
+            ]
+        }
+    )
+
+
+def make_manager(server) -> WorkflowManager:
+    """Create a WorkflowManager whose checkpoints live in a fake Redis server."""
+    manager = WorkflowManager()
+    manager.checkpoint_store = WorkflowCheckpointStore()
+    manager.checkpoint_store.redis_client = fakeredis.FakeAsyncRedis(
+        server=server, decode_responses=True
+    )
+    return manager
+
+
+@pytest.fixture
+def server():
+    """Create a fake Redis server shared by several clients."""
+    return fakeredis.FakeServer()
+
+
+@pytest_asyncio.fixture
+async def agent_calls(monkeypatch):
+    """Replace agent execution with a short sleep and count the calls."""
+    calls = []
+
+    async def run_agent(self, node, task):
+        calls.append(node.node_id)
+        await asyncio.sleep(0.02)
+        return {"result": f"{node.node_id} done", "node_id": node.node_id}
+
+    monkeypatch.setattr(GraphOrchestrator, "_run_agent", run_agent)
+    return calls
+
+
+class TestWorkflowCheckpoint:
+    """Test cases for resuming interrupted graph runs."""
+
+    @pytest.mark.asyncio
+    async def test_resume_after_crash_skips_completed_nodes(self, server, agent_calls):
+        """Test that a run killed mid-way resumes without repeating finished nodes."""
+        manager = make_manager(server)
+        workflow = await manager.create_workflow_from_config(pipeline_config(), {})
+        run = asyncio.create_task(manager.execute_workflow(workflow, "write a post", tone="dry"))
+
+        # Kill the run while the third node is executing
+        while len(agent_calls) < 3:
+            await asyncio.sleep(0.005)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        checkpoint = await manager.checkpoint_store.load(workflow.execution_id)
+        assert checkpoint.status == WorkflowStatus.RUNNING
+        assert set(checkpoint.nodes) == {"research", "outline"}
+        assert checkpoint.parameters == {"tone": "dry"}
+
+        # A fresh manager, as in a restarted process
+        agent_calls.clear()
+        resumed = make_manager(server)
+        result = await resumed.resume_from_checkpoint(workflow.execution_id)
+
+        assert result.success
+        assert agent_calls == ["draft", "edit", "publish"]
+        saved = 1 - len(agent_calls) / len(STEPS)
+        assert saved == pytest.approx(0.4)
+        assert result.result["outputs"]["research"]["result"] == "research done"
+        # The first resumed node still sees its restored upstream output
+        orchestrator = next(iter(resumed.completed_workflows.values())).orchestrator
+        assert "outline done" in orchestrator._prepare_node_task("draft", "write a post")
+
+        checkpoint = await resumed.checkpoint_store.load(workflow.execution_id)
+        assert checkpoint.status == WorkflowStatus.COMPLETED
+        assert set(checkpoint.nodes) == set(STEPS)
+        with pytest.raises(ValueError):
+            await resumed.resume_from_checkpoint(workflow.execution_id)
+
+    @pytest.mark.asyncio
+    async def test_list_checkpoints(self, server, agent_calls):
+        """Test that finished runs are listed with their status and node count."""
+        manager = make_manager(server)
+        workflow = await manager.create_workflow_from_config(pipeline_config(), {})
+        await manager.execute_workflow(workflow, "write a post")
+
+        checkpoints = await manager.list_checkpoints()
+
+        assert [(c["execution_id"], c["status"], c["completed_nodes"]) for c in checkpoints] == [
+            (workflow.execution_id, "completed", len(STEPS))
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_execution_cannot_resume(self, server):
+        """Test that resuming without a checkpoint is rejected."""
+        with pytest.raises(ValueError):
+            await make_manager(server).resume_from_checkpoint("missing")